@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""Simulate many chat clients against a running API and report delivery stats.
+
+Each simulated client subscribes to the chat topic over Socket.IO and
+acknowledges ``chat:batch`` frames; ``--slow-clients`` of them ack only after
+``--slow-ack-delay`` seconds so the server's backpressure (skip, then
+``chat:resync``) can be observed. A poster sends timestamped messages and,
+when credentials are given, a reactor toggles reactions on the newest one to
+exercise reaction coalescing.
+
+    python core/api/scripts/chat_load_test.py --clients 200 --duration 30 \\
+        --username admin --password secret
+"""
+from __future__ import annotations
+
+import argparse
+import statistics
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+import requests
+import socketio
+
+MARKER = "load-test"
+
+
+class SimulatedClient:
+    def __init__(self, index: int, *, base_url: str, socket_path: str, ack_delay: float = 0.0) -> None:
+        self.index = index
+        self.ack_delay = ack_delay
+        self.batches = 0
+        self.events: Dict[str, int] = {}
+        self.latencies: List[float] = []
+        self.resyncs = 0
+        self._lock = threading.Lock()
+        self._ack_timer: Optional[threading.Timer] = None
+        self._sio = socketio.Client(reconnection=False)
+        self._sio.on("connect", self._on_connect)
+        self._sio.on("chat:batch", self._on_batch)
+        self._sio.on("chat:resync", self._on_resync)
+        self._base_url = base_url
+        self._socket_path = socket_path
+
+    def connect(self) -> None:
+        self._sio.connect(self._base_url, socketio_path=self._socket_path, wait_timeout=10)
+
+    def disconnect(self) -> None:
+        if self._ack_timer is not None:
+            self._ack_timer.cancel()
+        self._sio.disconnect()
+
+    def _acknowledge(self, seq: Any = None) -> None:
+        self._ack_timer = None
+        self._sio.emit("chat:ack", {"seq": seq})
+
+    def _on_connect(self) -> None:
+        self._sio.emit("subscribe", {"topics": ["chat"]})
+
+    def _on_batch(self, payload: Dict[str, Any]) -> None:
+        received = time.time()
+        with self._lock:
+            self.batches += 1
+            for entry in payload.get("events") or []:
+                name = str(entry.get("event"))
+                self.events[name] = self.events.get(name, 0) + 1
+                body = str((entry.get("data") or {}).get("body") or "")
+                if name == "chat:message" and body.startswith(MARKER):
+                    try:
+                        self.latencies.append(received - float(body.split()[1]))
+                    except (IndexError, ValueError):
+                        pass
+        if not self.ack_delay:
+            self._acknowledge(payload.get("seq"))
+        elif self._ack_timer is None:
+            self._ack_timer = threading.Timer(self.ack_delay, self._acknowledge, args=(payload.get("seq"),))
+            self._ack_timer.daemon = True
+            self._ack_timer.start()
+
+    def _on_resync(self, _payload: Any = None) -> None:
+        with self._lock:
+            self.resyncs += 1
+        # A real client re-reads history over HTTP here before carrying on.
+
+
+def _post_messages(base_url: str, rate: float, stop: threading.Event, latest: Dict[str, Optional[int]]) -> int:
+    session = requests.Session()
+    sent = 0
+    interval = 1.0 / rate
+    while not stop.wait(interval):
+        response = session.post(f"{base_url}/chat/messages", json={"body": f"{MARKER} {time.time():.6f}"}, timeout=10)
+        if response.ok:
+            latest["id"] = int(response.json()["message"]["id"])
+            sent += 1
+    return sent
+
+
+def _toggle_reactions(
+    base_url: str,
+    rate: float,
+    stop: threading.Event,
+    latest: Dict[str, Optional[int]],
+    credentials: Dict[str, str],
+) -> int:
+    session = requests.Session()
+    login = session.post(f"{base_url}/auth/login", json=credentials, timeout=10)
+    login.raise_for_status()
+    toggled = 0
+    add = True
+    interval = 1.0 / rate
+    while not stop.wait(interval):
+        message_id = latest.get("id")
+        if message_id is None:
+            continue
+        method = session.post if add else session.delete
+        response = method(f"{base_url}/chat/messages/{message_id}/reactions", json={"emoji": "👍"}, timeout=10)
+        if response.ok:
+            toggled += 1
+            add = not add
+    return toggled
+
+
+def _percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Load test chat broadcasting with simulated Socket.IO clients.")
+    parser.add_argument("--base-url", default="http://localhost:5001")
+    parser.add_argument("--socket-path", default="socket.io")
+    parser.add_argument("--clients", type=int, default=50, help="number of subscribed clients")
+    parser.add_argument("--slow-clients", type=int, default=0, help="clients that acknowledge late")
+    parser.add_argument("--slow-ack-delay", type=float, default=8.0, help="seconds a slow client waits to ack")
+    parser.add_argument("--duration", type=float, default=20.0, help="seconds to run")
+    parser.add_argument("--message-rate", type=float, default=2.0, help="messages posted per second")
+    parser.add_argument("--reaction-rate", type=float, default=20.0, help="reaction toggles per second")
+    parser.add_argument("--username", help="account used for reactions (skipped when omitted)")
+    parser.add_argument("--password", default="")
+    args = parser.parse_args(argv)
+    base_url = args.base_url.rstrip("/")
+
+    clients = [
+        SimulatedClient(
+            index,
+            base_url=base_url,
+            socket_path=args.socket_path,
+            ack_delay=args.slow_ack_delay if index < args.slow_clients else 0.0,
+        )
+        for index in range(args.clients)
+    ]
+    for client in clients:
+        client.connect()
+    print(f"connected {len(clients)} clients ({args.slow_clients} slow)")
+
+    stop = threading.Event()
+    latest: Dict[str, Optional[int]] = {"id": None}
+    results: Dict[str, int] = {}
+
+    def run(name: str, target: Any, *target_args: Any) -> threading.Thread:
+        thread = threading.Thread(target=lambda: results.__setitem__(name, target(*target_args)), daemon=True)
+        thread.start()
+        return thread
+
+    workers = [run("messages", _post_messages, base_url, args.message_rate, stop, latest)]
+    if args.username and args.reaction_rate > 0:
+        credentials = {"identifier": args.username, "password": args.password}
+        workers.append(
+            run("reactions", _toggle_reactions, base_url, args.reaction_rate, stop, latest, credentials)
+        )
+
+    started = time.monotonic()
+    time.sleep(args.duration)
+    stop.set()
+    for worker in workers:
+        worker.join(timeout=15)
+    time.sleep(1.0)  # let the final batches land
+    elapsed = time.monotonic() - started
+    for client in clients:
+        client.disconnect()
+
+    print(f"posted {results.get('messages', 0)} messages, toggled {results.get('reactions', 0)} reactions in {elapsed:.1f}s")
+    fast = [client for client in clients if not client.ack_delay] or clients
+    batches = [client.batches / elapsed for client in fast]
+    events = [sum(client.events.values()) / elapsed for client in fast]
+    print(f"per client: {statistics.mean(batches):.1f} batches/s, {statistics.mean(events):.1f} events/s")
+    totals: Dict[str, int] = {}
+    for client in fast:
+        for name, count in client.events.items():
+            totals[name] = totals.get(name, 0) + count
+    for name, count in sorted(totals.items()):
+        print(f"  {name}: {count / len(fast):.1f} per client")
+    latencies = [value for client in fast for value in client.latencies]
+    if latencies:
+        print(
+            "message latency: "
+            f"p50 {_percentile(latencies, 0.5) * 1000:.0f}ms, "
+            f"p95 {_percentile(latencies, 0.95) * 1000:.0f}ms, "
+            f"max {max(latencies) * 1000:.0f}ms"
+        )
+    slow = [client for client in clients if client.ack_delay]
+    if slow:
+        print(
+            f"slow clients: {statistics.mean(client.batches for client in slow):.1f} batches, "
+            f"{sum(client.resyncs for client in slow)} resyncs"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
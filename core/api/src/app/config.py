@@ -8,6 +8,9 @@ from typing import Any, Dict
 from .constants import (
     DEFAULT_AVATAR_UPLOAD_DIR,
     DEFAULT_BASENAME,
+    DEFAULT_CHAT_BROADCAST_TICK_MS,
+    DEFAULT_CHAT_LINK_FETCH_CONCURRENCY,
+    DEFAULT_CHAT_REACTION_WINDOW_MS,
     DEFAULT_CHAT_UPLOAD_DIR,
     DEFAULT_CORS_ORIGIN,
     DEFAULT_INTERNAL_TOKEN,
@@ -16,8 +19,10 @@ from .constants import (
     DEFAULT_PLEX_CLIENT_IDENTIFIER,
     DEFAULT_PLEX_DEVICE_NAME,
     DEFAULT_PLEX_ENABLE_ACCOUNT_LOOKUP,
+    DEFAULT_PLEX_HTTP_POOL_SIZE,
     DEFAULT_PLEX_IMAGE_CACHE_DIR,
     DEFAULT_PLEX_PLATFORM,
+    DEFAULT_PLEX_PREFETCH_BUDGET,
     DEFAULT_PLEX_PRODUCT,
     DEFAULT_PLEX_SERVER_BASE_URL,
     DEFAULT_PLEX_TIMEOUT_SECONDS,
@@ -28,10 +33,11 @@ from .constants import (
     DEFAULT_REDIS_TTL_SECONDS,
     DEFAULT_REDIS_URL,
     DEFAULT_SQLITE_PATH,
-    DEFAULT_STATUS_CHANNEL,
     DEFAULT_STATUS_KEY,
     DEFAULT_STATUS_NAMESPACE,
     DEFAULT_STATUS_STALE_SECONDS,
+    DEFAULT_STATUS_STREAM,
+    DEFAULT_STATUS_STREAM_GROUP,
     DEFAULT_TRANSCODER_SERVICE_TIMEOUT_SECONDS,
     DEFAULT_TRANSCODER_SERVICE_URL,
 )
@@ -60,6 +66,9 @@ def build_default_config() -> Dict[str, Any]:
         "INGEST_CONTROL_URL": DEFAULT_INGEST_CONTROL_URL,
         "TRANSCODER_CORS_ORIGIN": DEFAULT_CORS_ORIGIN,
         "TRANSCODER_CHAT_UPLOAD_DIR": DEFAULT_CHAT_UPLOAD_DIR,
+        "CHAT_LINK_FETCH_CONCURRENCY": DEFAULT_CHAT_LINK_FETCH_CONCURRENCY,
+        "CHAT_BROADCAST_TICK_MS": DEFAULT_CHAT_BROADCAST_TICK_MS,
+        "CHAT_REACTION_WINDOW_MS": DEFAULT_CHAT_REACTION_WINDOW_MS,
         "TRANSCODER_AVATAR_UPLOAD_DIR": DEFAULT_AVATAR_UPLOAD_DIR,
         "PLEX_IMAGE_CACHE_DIR": DEFAULT_PLEX_IMAGE_CACHE_DIR,
         "PLEX_CLIENT_IDENTIFIER": DEFAULT_PLEX_CLIENT_IDENTIFIER,
@@ -70,11 +79,14 @@ def build_default_config() -> Dict[str, Any]:
         "PLEX_SERVER_BASE_URL": DEFAULT_PLEX_SERVER_BASE_URL,
         "PLEX_ENABLE_ACCOUNT_LOOKUP": DEFAULT_PLEX_ENABLE_ACCOUNT_LOOKUP,
         "PLEX_TIMEOUT_SECONDS": DEFAULT_PLEX_TIMEOUT_SECONDS,
+        "PLEX_HTTP_POOL_SIZE": DEFAULT_PLEX_HTTP_POOL_SIZE,
+        "PLEX_PREFETCH_BUDGET": DEFAULT_PLEX_PREFETCH_BUDGET,
         "TRANSCODER_INTERNAL_TOKEN": DEFAULT_INTERNAL_TOKEN,
         "TRANSCODER_STATUS_NAMESPACE": DEFAULT_STATUS_NAMESPACE,
         "TRANSCODER_STATUS_KEY": DEFAULT_STATUS_KEY,
         "TRANSCODER_STATUS_STALE_SECONDS": DEFAULT_STATUS_STALE_SECONDS,
-        "TRANSCODER_STATUS_CHANNEL": DEFAULT_STATUS_CHANNEL,
+        "TRANSCODER_STATUS_STREAM": DEFAULT_STATUS_STREAM,
+        "TRANSCODER_STATUS_STREAM_GROUP": DEFAULT_STATUS_STREAM_GROUP,
         "REDIS_URL": DEFAULT_REDIS_URL,
         "REDIS_MAX_ENTRIES": DEFAULT_REDIS_MAX_ENTRIES,
         "REDIS_TTL_SECONDS": DEFAULT_REDIS_TTL_SECONDS,
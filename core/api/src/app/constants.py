@@ -118,6 +118,36 @@ DEFAULT_PLEX_TIMEOUT_SECONDS = _env_int(
     180,
     minimum=1,
 )
+DEFAULT_PLEX_HTTP_POOL_SIZE = _env_int(
+    "PLEX_HTTP_POOL_SIZE",
+    32,
+    minimum=1,
+    maximum=512,
+)
+DEFAULT_PLEX_PREFETCH_BUDGET = _env_int(
+    "PLEX_PREFETCH_BUDGET",
+    30,
+    minimum=0,
+    maximum=1000,
+)
+DEFAULT_CHAT_LINK_FETCH_CONCURRENCY = _env_int(
+    "CHAT_LINK_FETCH_CONCURRENCY",
+    4,
+    minimum=1,
+    maximum=64,
+)
+DEFAULT_CHAT_BROADCAST_TICK_MS = _env_int(
+    "CHAT_BROADCAST_TICK_MS",
+    100,
+    minimum=10,
+    maximum=2000,
+)
+DEFAULT_CHAT_REACTION_WINDOW_MS = _env_int(
+    "CHAT_REACTION_WINDOW_MS",
+    250,
+    minimum=0,
+    maximum=10_000,
+)
 DEFAULT_INTERNAL_TOKEN = os.getenv("TRANSCODER_INTERNAL_TOKEN")
 DEFAULT_STATUS_NAMESPACE = os.getenv("TRANSCODER_STATUS_NAMESPACE", "transcoder")
 DEFAULT_STATUS_KEY = os.getenv("TRANSCODER_STATUS_KEY", "status")
@@ -126,10 +156,11 @@ DEFAULT_STATUS_STALE_SECONDS = _env_int(
     15,
     minimum=1,
 )
-DEFAULT_STATUS_CHANNEL = os.getenv(
-    "TRANSCODER_STATUS_CHANNEL",
-    "transcoder:transcoder:status",
+DEFAULT_STATUS_STREAM = os.getenv(
+    "TRANSCODER_STATUS_STREAM",
+    "transcoder:transcoder:status:stream",
 )
+DEFAULT_STATUS_STREAM_GROUP = os.getenv("TRANSCODER_STATUS_STREAM_GROUP", "api")
 
 DEFAULT_REDIS_URL = (
     os.getenv("TRANSCODER_REDIS_URL")
@@ -156,6 +187,9 @@ __all__ = [
     "API_ROOT",
     "DEFAULT_AVATAR_UPLOAD_DIR",
     "DEFAULT_BASENAME",
+    "DEFAULT_CHAT_BROADCAST_TICK_MS",
+    "DEFAULT_CHAT_LINK_FETCH_CONCURRENCY",
+    "DEFAULT_CHAT_REACTION_WINDOW_MS",
     "DEFAULT_CHAT_UPLOAD_DIR",
     "DEFAULT_CORS_ORIGIN",
     "DEFAULT_INTERNAL_TOKEN",
@@ -164,8 +198,10 @@ __all__ = [
     "DEFAULT_PLEX_CLIENT_IDENTIFIER",
     "DEFAULT_PLEX_DEVICE_NAME",
     "DEFAULT_PLEX_ENABLE_ACCOUNT_LOOKUP",
+    "DEFAULT_PLEX_HTTP_POOL_SIZE",
     "DEFAULT_PLEX_IMAGE_CACHE_DIR",
     "DEFAULT_PLEX_PLATFORM",
+    "DEFAULT_PLEX_PREFETCH_BUDGET",
     "DEFAULT_PLEX_PRODUCT",
     "DEFAULT_PLEX_SERVER_BASE_URL",
     "DEFAULT_PLEX_TIMEOUT_SECONDS",
@@ -178,10 +214,11 @@ __all__ = [
     "API_SRC_ROOT",
     "DATA_ROOT",
     "DEFAULT_SQLITE_PATH",
-    "DEFAULT_STATUS_CHANNEL",
     "DEFAULT_STATUS_KEY",
     "DEFAULT_STATUS_NAMESPACE",
     "DEFAULT_STATUS_STALE_SECONDS",
+    "DEFAULT_STATUS_STREAM",
+    "DEFAULT_STATUS_STREAM_GROUP",
     "DEFAULT_TRANSCODER_SERVICE_TIMEOUT_SECONDS",
     "DEFAULT_TRANSCODER_SERVICE_URL",
     "SHARED_OUTPUT",
@@ -0,0 +1,57 @@
+"""Command-line EXPLAIN audit of the API's hot queries.
+
+Run from the repository root, for example::
+
+    python -m core.api.src.app.db_audit --create-missing
+
+The configured ``TRANSCODER_DATABASE_URI`` (SQLite by default) is used.
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+from typing import Optional, Sequence
+
+from flask import Flask
+
+from .bootstrap import load_configuration
+from .extensions import init_database
+from .providers import db
+from ..services.query_audit import audit_queries, ensure_indexes, format_report
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="EXPLAIN the API's hot queries and flag full table scans.")
+    parser.add_argument(
+        "--create-missing",
+        action="store_true",
+        help="create missing tables and indexes before auditing",
+    )
+    parser.add_argument(
+        "--fail-on-scan",
+        action="store_true",
+        help="exit with status 1 when any query uses a full table scan",
+    )
+    args = parser.parse_args(argv)
+
+    app = Flask(__name__)
+    load_configuration(app)
+    init_database(app)
+    with app.app_context():
+        print(f"database: {db.engine.url.render_as_string(hide_password=True)}")
+        if args.create_missing:
+            db.create_all()
+            for name in ensure_indexes():
+                print(f"created index {name}")
+        plans = audit_queries()
+    print(format_report(plans))
+    if args.fail_on_scan and any(plan.flagged for plan in plans):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover - manual entrypoint
+    sys.exit(main())
+
+
+__all__ = ["main"]
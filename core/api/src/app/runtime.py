@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from contextlib import nullcontext
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Any, Optional
 
 from flask import Flask
@@ -12,6 +13,7 @@ from .providers import db, socketio
 from ..services import (
     ChatService,
     GroupService,
+    PermissionCache,
     PlaybackCoordinator,
     PlaybackState,
     PlexService,
@@ -24,6 +26,13 @@ from ..services import (
     ViewerService,
     ensure_chat_schema,
 )
+from ..services.attachment_store import AttachmentStore
+from ..services.avatar_store import AvatarStore
+from ..services.chat_events import ChatEventPipeline
+from ..services.chat_retention import ChatRetentionService
+from ..services.link_images import LinkImageFetcher
+from ..services.query_audit import ensure_indexes
+from ..services.socket_topics import TOPIC_VIEWERS, topic_room
 
 
 @dataclass
@@ -33,6 +42,7 @@ class AppServices:
     group_service: GroupService
     settings_service: SettingsService
     redis_service: RedisService
+    permission_cache: PermissionCache
     chat_service: ChatService
     plex_service: PlexService
     viewer_service: ViewerService
@@ -55,12 +65,6 @@ def _coerce_non_negative(value: Any, default: int = 0) -> int:
 def init_services(app: Flask) -> AppServices:
     """Instantiate application services and attach them to the Flask app."""
 
-    group_service = GroupService()
-    app.extensions["group_service"] = group_service
-
-    settings_service = SettingsService()
-    app.extensions["settings_service"] = settings_service
-
     redis_service = RedisService(
         redis_url=app.config.get("REDIS_URL"),
         max_entries=_coerce_non_negative(app.config.get("REDIS_MAX_ENTRIES"), 0),
@@ -70,9 +74,47 @@ def init_services(app: Flask) -> AppServices:
     )
     app.extensions["redis_service"] = redis_service
 
-    chat_service = ChatService()
+    permission_cache = PermissionCache(redis_service=redis_service)
+    app.extensions["permission_cache"] = permission_cache
+
+    group_service = GroupService(permission_cache=permission_cache)
+    app.extensions["group_service"] = group_service
+
+    settings_service = SettingsService()
+    app.extensions["settings_service"] = settings_service
+
+    attachment_store = AttachmentStore(Path(app.config["CHAT_UPLOAD_PATH"]))
+    app.extensions["attachment_store"] = attachment_store
+
+    avatar_store = AvatarStore(Path(app.config["AVATAR_UPLOAD_PATH"]))
+    app.extensions["avatar_store"] = avatar_store
+
+    chat_service = ChatService(redis_service=redis_service, attachment_store=attachment_store)
     app.extensions["chat_service"] = chat_service
 
+    chat_events = ChatEventPipeline(
+        socketio,
+        app=app,
+        reaction_loader=chat_service.reaction_summary,
+        tick_seconds=int(app.config.get("CHAT_BROADCAST_TICK_MS") or 100) / 1000,
+        reaction_window=int(app.config.get("CHAT_REACTION_WINDOW_MS") or 0) / 1000,
+    )
+    app.extensions["chat_events"] = chat_events
+
+    chat_retention = ChatRetentionService(
+        chat_service=chat_service,
+        settings_service=settings_service,
+        redis_service=redis_service,
+    )
+    app.extensions["chat_retention"] = chat_retention
+
+    link_image_fetcher = LinkImageFetcher(
+        chat_service=chat_service,
+        redis_service=redis_service,
+        concurrency=int(app.config.get("CHAT_LINK_FETCH_CONCURRENCY") or 4),
+    )
+    app.extensions["link_image_fetcher"] = link_image_fetcher
+
     plex_service = PlexService(
         settings_service=settings_service,
         redis_service=redis_service,
@@ -85,10 +127,15 @@ def init_services(app: Flask) -> AppServices:
         allow_account_lookup=app.config.get("PLEX_ENABLE_ACCOUNT_LOOKUP", False),
         request_timeout=app.config.get("PLEX_TIMEOUT_SECONDS"),
         image_cache_dir=app.config.get("PLEX_IMAGE_CACHE_DIR"),
+        http_pool_size=app.config.get("PLEX_HTTP_POOL_SIZE"),
+        prefetch_budget=app.config.get("PLEX_PREFETCH_BUDGET"),
     )
     app.extensions["plex_service"] = plex_service
 
-    viewer_service = ViewerService()
+    viewer_service = ViewerService(
+        redis_service=redis_service,
+        on_change=lambda summary: socketio.emit("viewers:update", summary, to=topic_room(TOPIC_VIEWERS)),
+    )
     app.extensions["viewer_service"] = viewer_service
 
     client = TranscoderClient(
@@ -131,6 +178,7 @@ def init_services(app: Flask) -> AppServices:
         group_service=group_service,
         settings_service=settings_service,
         redis_service=redis_service,
+        permission_cache=permission_cache,
         chat_service=chat_service,
         plex_service=plex_service,
         viewer_service=viewer_service,
@@ -168,6 +216,7 @@ def bootstrap_database(app: Flask, services: AppServices) -> None:
                 settings_service=services.settings_service,
             )
             ensure_chat_schema()
+            ensure_indexes()
 
 
 def start_status_subscriber(app: Flask, services: AppServices) -> TranscoderStatusSubscriber:
@@ -175,9 +224,11 @@ def start_status_subscriber(app: Flask, services: AppServices) -> TranscoderStat
 
     subscriber = TranscoderStatusSubscriber(
         redis_url=services.redis_service.redis_url,
-        channel=app.config.get("TRANSCODER_STATUS_CHANNEL"),
+        stream=app.config.get("TRANSCODER_STATUS_STREAM"),
+        group=app.config.get("TRANSCODER_STATUS_STREAM_GROUP") or "api",
         socketio=socketio,
         status_callback=services.queue_service.observe_status_update,
+        snapshot_loader=services.transcoder_status_service.cached_snapshot,
     )
     subscriber.start()
     services.status_subscriber = subscriber
@@ -71,8 +71,11 @@ def _configure_routes(default_queue: str, library_queue: str, image_cache_queue:
 
     routes["core.api.src.celery_app.tasks.library.build_section_snapshot_task"] = {"queue": library_queue}
     routes["core.api.src.celery_app.tasks.library.fetch_section_snapshot_chunk"] = {"queue": library_queue}
+    routes["core.api.src.celery_app.tasks.library.prefetch_section_page_task"] = {"queue": library_queue}
     routes["core.api.src.celery_app.tasks.library.cache_section_images_task"] = {"queue": image_cache_queue}
     routes["core.api.src.celery_app.tasks.library.cache_single_image_task"] = {"queue": image_cache_queue}
+    routes["core.api.src.celery_app.tasks.chat.build_attachment_variants"] = {"queue": image_cache_queue}
+    routes["core.api.src.celery_app.tasks.chat.fetch_link_images"] = {"queue": image_cache_queue}
 
     existing_routes = celery.conf.get("task_routes") or {}
     existing_routes.update(routes)
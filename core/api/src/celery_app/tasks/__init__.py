@@ -1,7 +1,7 @@
 """Celery task registry."""
 
-from . import library  # noqa: F401  # import for side-effects
+from . import chat, library  # noqa: F401  # import for side-effects
 
 
-__all__ = ["library"]
+__all__ = ["chat", "library"]
 
@@ -0,0 +1,175 @@
+"""Chat-related Celery tasks."""
+from __future__ import annotations
+
+import logging
+import threading
+from typing import Any, Dict, Iterable, List, Sequence
+
+from celery import shared_task
+from flask import Flask, current_app
+
+from ...models import ChatAttachment
+from ...services.chat_retention import ChatRetentionService
+from ...services.chat_service import ChatService
+from ...services.link_images import FetchSlotsBusy, LinkImageFetcher
+
+logger = logging.getLogger(__name__)
+
+# The in-process fallback has nobody to retry it, so it waits for a slot instead.
+LOCAL_SLOT_WAIT_SECONDS = 30.0
+
+
+def _chat_service() -> ChatService:
+    chat: ChatService = current_app.extensions["chat_service"]
+    return chat
+
+
+@shared_task(
+    bind=True,
+    max_retries=2,
+    default_retry_delay=30,
+    name="core.api.src.celery_app.tasks.chat.build_attachment_variants",
+)
+def build_attachment_variants_task(self, *, content_hash: str, file_path: str) -> Dict[str, Any]:
+    """Generate thumbnail/preview copies of a stored chat attachment."""
+
+    try:
+        variants = _chat_service().build_attachment_variants(content_hash, file_path)
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.exception("Failed to build variants for attachment %s", content_hash)
+        raise self.retry(exc=exc)
+    return {"content_hash": content_hash, "variants": sorted(variants)}
+
+
+@shared_task(
+    bind=True,
+    max_retries=1,
+    default_retry_delay=300,
+    name="core.api.src.celery_app.tasks.chat.enforce_chat_retention",
+)
+def enforce_chat_retention_task(self) -> Dict[str, Any]:
+    """Archive expired chat history, sweep orphaned files and compact the tables."""
+
+    retention: ChatRetentionService = current_app.extensions["chat_retention"]
+    try:
+        report = retention.enforce()
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.exception("Chat retention run failed")
+        raise self.retry(exc=exc)
+    return report.to_dict()
+
+
+def _link_fetcher() -> LinkImageFetcher:
+    fetcher: LinkImageFetcher = current_app.extensions["link_image_fetcher"]
+    return fetcher
+
+
+def _publish_link_images(message_id: int, added: List[ChatAttachment]) -> None:
+    if not added:
+        return
+    enqueue_attachment_variants(added)
+    # Local import: the chat routes import this module to enqueue work.
+    from ...routes.chat import broadcast_message_update
+
+    message = _chat_service().get_message(message_id)
+    if message is not None:
+        broadcast_message_update(message)
+
+
+@shared_task(
+    bind=True,
+    max_retries=5,
+    default_retry_delay=2,
+    name="core.api.src.celery_app.tasks.chat.fetch_link_images",
+)
+def fetch_link_images_task(self, *, message_id: int, urls: List[str], slots: int) -> Dict[str, Any]:
+    """Download images linked from a chat message and attach them."""
+
+    try:
+        added = _link_fetcher().attach(message_id, urls, slots)
+    except FetchSlotsBusy as exc:
+        _publish_link_images(message_id, exc.added)
+        raise self.retry(exc=exc)
+    _publish_link_images(message_id, added)
+    return {"message_id": message_id, "attached": len(added)}
+
+
+def _fetch_locally(app: Flask, message_id: int, urls: List[str], slots: int) -> None:
+    with app.app_context():
+        try:
+            added = app.extensions["link_image_fetcher"].attach(message_id, urls, slots, wait=LOCAL_SLOT_WAIT_SECONDS)
+            _publish_link_images(message_id, added)
+        except FetchSlotsBusy as exc:
+            _publish_link_images(message_id, exc.added)
+            logger.warning("Gave up fetching linked images for message %s: %s", message_id, exc)
+        except Exception:  # pragma: no cover - defensive
+            logger.exception("Failed to attach linked images to message %s", message_id)
+
+
+def enqueue_link_images(message_id: int, urls: Sequence[str], slots: int) -> None:
+    """Fetch linked images for a saved message without blocking the request."""
+
+    if not urls or slots <= 0:
+        return
+    try:
+        fetch_link_images_task.delay(message_id=message_id, urls=list(urls), slots=slots)
+        return
+    except Exception as exc:  # pragma: no cover - Celery connectivity
+        logger.warning("Unable to enqueue link image fetch for message %s: %s", message_id, exc)
+    worker = threading.Thread(
+        target=_fetch_locally,
+        args=(current_app._get_current_object(), message_id, list(urls), slots),  # type: ignore[attr-defined]
+        name="chat-link-images",
+        daemon=True,
+    )
+    worker.start()
+
+
+def _build_locally(app: Flask, jobs: Dict[str, str]) -> None:
+    with app.app_context():
+        chat = app.extensions["chat_service"]
+        for content_hash, file_path in jobs.items():
+            try:
+                chat.build_attachment_variants(content_hash, file_path)
+            except Exception:  # pragma: no cover - defensive
+                logger.exception("Failed to build variants for attachment %s", content_hash)
+
+
+def enqueue_attachment_variants(attachments: Iterable[ChatAttachment]) -> None:
+    """Schedule variant generation for attachments that do not have any yet.
+
+    Falls back to a background thread when the broker is unreachable so
+    uploads never wait on image resizing.
+    """
+
+    jobs = {
+        attachment.content_hash: attachment.file_path
+        for attachment in attachments
+        if attachment.content_hash and attachment.variants is None
+    }
+    if not jobs:
+        return
+    pending: Dict[str, str] = {}
+    for content_hash, file_path in jobs.items():
+        try:
+            build_attachment_variants_task.delay(content_hash=content_hash, file_path=file_path)
+        except Exception as exc:  # pragma: no cover - Celery connectivity
+            logger.warning("Unable to enqueue attachment variants for %s: %s", content_hash, exc)
+            pending[content_hash] = file_path
+    if pending:
+        worker = threading.Thread(
+            target=_build_locally,
+            args=(current_app._get_current_object(), pending),  # type: ignore[attr-defined]
+            name="chat-attachment-variants",
+            daemon=True,
+        )
+        worker.start()
+
+
+__all__ = [
+    "build_attachment_variants_task",
+    "enforce_chat_retention_task",
+    "enqueue_attachment_variants",
+    "enqueue_link_images",
+    "fetch_link_images_task",
+]
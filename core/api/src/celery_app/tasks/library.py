@@ -15,6 +15,8 @@ logger = logging.getLogger(__name__)
 
 LIBRARY_SECTION_QUEUE = os.getenv("CELERY_LIBRARY_QUEUE", "library_sections")
 IMAGE_CACHE_QUEUE = os.getenv("CELERY_IMAGE_CACHE_QUEUE", "library_images")
+# Celery's Redis transport treats higher numbers as lower priority.
+PREFETCH_TASK_PRIORITY = 9
 
 
 def _plex_service() -> PlexService:
@@ -266,6 +268,72 @@ def enqueue_section_snapshot_build(
     return async_result.id
 
 
+@shared_task(
+    bind=True,
+    queue=LIBRARY_SECTION_QUEUE,
+    name="core.api.src.celery_app.tasks.library.prefetch_section_page_task",
+)
+def prefetch_section_page_task(
+    self,
+    *,
+    section_id: Any,
+    sort: Optional[str] = None,
+    letter: Optional[str] = None,
+    search: Optional[str] = None,
+    watch_state: Optional[str] = None,
+    genre: Optional[str] = None,
+    collection: Optional[str] = None,
+    year: Optional[str] = None,
+    offset: int = 0,
+    limit: int = 60,
+) -> Dict[str, Any]:
+    """Warm the cache for a section page the client is likely to request next."""
+
+    plex = _plex_service()
+    try:
+        summary = plex.prefetch_section_page(
+            section_id,
+            sort=sort,
+            letter=letter,
+            search=search,
+            watch_state=watch_state,
+            genre=genre,
+            collection=collection,
+            year=year,
+            offset=offset,
+            limit=limit,
+        )
+    except PlexServiceError as exc:
+        logger.info("Section prefetch skipped (section=%s, offset=%s): %s", section_id, offset, exc)
+        return {"section_id": str(section_id), "offset": offset, "error": str(exc)}
+    logger.debug(
+        "Prefetched section page (section=%s, offset=%s, items=%s, posters=%s)",
+        section_id,
+        offset,
+        summary.get("items"),
+        summary.get("posters"),
+    )
+    return summary
+
+
+def enqueue_section_prefetch(prefetch: Mapping[str, Any]) -> Optional[str]:
+    """Schedule a low-priority warm-up of the next section page."""
+
+    try:
+        async_result = prefetch_section_page_task.apply_async(
+            kwargs=dict(prefetch),
+            priority=PREFETCH_TASK_PRIORITY,
+        )
+    except Exception as exc:  # pragma: no cover - Celery connectivity
+        logger.warning(
+            "Unable to enqueue section prefetch for %s: %s",
+            prefetch.get("section_id"),
+            exc,
+        )
+        return None
+    return async_result.id
+
+
 @shared_task(
     bind=True,
     queue=IMAGE_CACHE_QUEUE,
@@ -303,12 +371,14 @@ def cache_single_image_task(
             "error": str(exc),
             "fetched": False,
             "grid_created": False,
+            "placeholder_created": False,
         }
     return {
         "path": stats.get("path", path),
         "error": None,
         "fetched": bool(stats.get("fetched")),
         "grid_created": bool(stats.get("grid_created")),
+        "placeholder_created": bool(stats.get("placeholder_created")),
     }
 
 
@@ -343,6 +413,7 @@ def cache_section_images_task(
         "downloads": 0,
         "skipped": 0,
         "grid_generated": 0,
+        "placeholders": 0,
         "errors": [],
         "enqueued": 0,
         "children": [],
@@ -486,11 +557,19 @@ def cache_section_images_task(
             if entry.get("grid_created"):
                 grids += 1
 
+    placeholders = 0
+    try:
+        placeholder_summary = plex.apply_section_snapshot_placeholders(section_id)
+        placeholders = int(placeholder_summary.get("placeholders") or 0)
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.warning("Failed to apply snapshot placeholders for section=%s: %s", section_id, exc)
+
     summary.update(
         {
             "downloads": downloads,
             "skipped": skips,
             "grid_generated": grids,
+            "placeholders": placeholders,
             "errors": errors,
         }
     )
@@ -619,6 +698,8 @@ __all__ = [
     "fetch_section_snapshot_chunk",
     "build_section_snapshot_task",
     "enqueue_section_snapshot_build",
+    "prefetch_section_page_task",
+    "enqueue_section_prefetch",
     "cache_single_image_task",
     "cache_section_images_task",
     "enqueue_section_image_cache",
@@ -1,6 +1,6 @@
 """Database models for the backend service."""
 from .base import BaseModel
-from .chat_message import ChatAttachment, ChatMention, ChatMessage, ChatReaction
+from .chat_message import ChatArchivedMessage, ChatAttachment, ChatMention, ChatMessage, ChatReaction
 from .permission import Permission, UserGroup, UserGroupMembership, UserGroupPermission
 from .queue_item import QueueItem
 from .setting import SystemSetting, UserSetting
@@ -19,5 +19,6 @@ __all__ = [
     "ChatAttachment",
     "ChatReaction",
     "ChatMention",
+    "ChatArchivedMessage",
     "QueueItem",
 ]
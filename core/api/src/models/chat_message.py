@@ -1,6 +1,8 @@
 """Database model for chat messages."""
 from __future__ import annotations
 
+import json
+import zlib
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
@@ -22,6 +24,10 @@ class ChatAttachment(BaseModel):
     mime_type = db.Column(db.String(120), nullable=False)
     file_size = db.Column(db.Integer, nullable=False)
     original_name = db.Column(db.String(255), nullable=True)
+    # SHA-256 of the stored bytes; rows sharing a hash share one file.
+    content_hash = db.Column(db.String(64), nullable=True, index=True)
+    # Resized copies keyed by variant name; ``None`` until they have been built.
+    variants = db.Column(db.JSON, nullable=True)
     created_at = db.Column(db.DateTime(timezone=True), nullable=False, server_default=func.now())
 
 
@@ -61,6 +67,10 @@ class ChatMessage(BaseModel):
         lazy="selectin",
     )
 
+    __table_args__ = (
+        db.Index("ix_chat_messages_created_at_id", "created_at", "id"),
+    )
+
     def to_dict(self) -> dict[str, Any]:
         created_at = self.created_at if isinstance(self.created_at, datetime) else datetime.utcnow()
         updated_at = self.updated_at if isinstance(self.updated_at, datetime) else created_at
@@ -145,4 +155,47 @@ class ChatMention(BaseModel):
     )
 
 
-__all__ = ["ChatMessage", "ChatAttachment", "ChatReaction", "ChatMention"]
+@dataclass
+class ChatArchivedMessage(BaseModel):
+    """A chat message moved out of the live tables by retention.
+
+    ``id`` keeps the original message id. ``body`` and ``username`` stay
+    plain so the archive is searchable; everything else (attachments,
+    reactions, mentions) is kept as zlib-compressed JSON in ``payload``.
+    ``attachment_refs`` lists the stored files the message still points at
+    (``{"digests": [...], "paths": [...]}``) so the attachment sweep keeps them.
+    """
+
+    __tablename__ = "chat_message_archive"
+
+    id = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    user_id = db.Column(db.Integer, nullable=False, index=True)
+    username = db.Column(db.String(150), nullable=False, index=True)
+    body = db.Column(db.Text, nullable=False)
+    created_at = db.Column(db.DateTime(timezone=True), nullable=False, index=True)
+    archived_at = db.Column(db.DateTime(timezone=True), nullable=False, server_default=func.now())
+    payload = db.Column(db.LargeBinary, nullable=False)
+    attachment_refs = db.Column(db.JSON(none_as_null=True), nullable=True)
+
+    @staticmethod
+    def compress(data: dict[str, Any]) -> bytes:
+        return zlib.compress(json.dumps(data, separators=(",", ":")).encode("utf-8"), 9)
+
+    def to_dict(self) -> dict[str, Any]:
+        try:
+            data = json.loads(zlib.decompress(self.payload).decode("utf-8"))
+        except (zlib.error, ValueError):
+            data = {}
+        data.update(
+            {
+                "id": int(self.id),
+                "user_id": int(self.user_id),
+                "username": self.username,
+                "body": self.body,
+                "archived": True,
+            }
+        )
+        return data
+
+
+__all__ = ["ChatMessage", "ChatAttachment", "ChatReaction", "ChatMention", "ChatArchivedMessage"]
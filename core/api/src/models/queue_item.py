@@ -21,7 +21,7 @@ class QueueItem(BaseModel):
     thumb = db.Column(db.String(255), nullable=True)
     art = db.Column(db.String(255), nullable=True)
     data = db.Column(db.JSON, nullable=True)
-    position = db.Column(db.Integer, nullable=False, index=True)
+    position = db.Column(db.Integer, nullable=False)
     requested_by_id = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=True, index=True)
     requested_by = db.relationship("User", backref=db.backref("queue_items", lazy="dynamic"))
     created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
@@ -32,5 +32,10 @@ class QueueItem(BaseModel):
         nullable=False,
     )
 
+    __table_args__ = (
+        # Matches the queue ordering (position, id) used by every listing.
+        db.Index("ix_queue_items_position_id", "position", "id"),
+    )
+
 
 __all__ = ["QueueItem"]
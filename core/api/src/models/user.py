@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Iterable, Set
+from typing import Any, Iterable, Optional, Set
 
 from flask_login import UserMixin
 
@@ -28,8 +28,24 @@ class User(UserMixin, BaseModel):
         lazy="selectin",
     )
 
+    @property
+    def avatar_version(self) -> Optional[str]:
+        """Content version of the avatar; it changes whenever the image does."""
+
+        if not self.avatar_path:
+            return None
+        # ``user-<id>-<digest>`` (or a legacy ``user-<id>-<token>.png``).
+        return self.avatar_path.rsplit(".", 1)[0].rsplit("-", 1)[-1]
+
+    def avatar_url(self, size: Optional[int] = None) -> Optional[str]:
+        version = self.avatar_version
+        if version is None:
+            return None
+        url = f"/users/{int(self.id)}/avatar/{version}"
+        return f"{url}?size={int(size)}" if size else url
+
     def to_public_dict(self) -> dict[str, Any]:
-        avatar_url = f"/users/{int(self.id)}/avatar" if self.avatar_path else None
+        avatar_url = self.avatar_url()
         group_payload = [
             {
                 "id": int(group.id),
@@ -49,9 +65,20 @@ class User(UserMixin, BaseModel):
             "permissions": sorted(self.permission_names()),
         }
 
+    def attach_permissions(self, names: Optional[Iterable[str]]) -> None:
+        """Use a precompiled permission set instead of walking ``groups``.
+
+        Passing ``None`` drops the attached set so ``groups`` is consulted again.
+        """
+
+        self._compiled_permissions = None if names is None else frozenset(names)
+
     def permission_names(self) -> Set[str]:
         if self.is_admin:
             return {"*"}
+        compiled = getattr(self, "_compiled_permissions", None)
+        if compiled is not None:
+            return set(compiled)
         names: Set[str] = set()
         for group in self.groups:
             names.update(permission.name for permission in group.permissions)
@@ -60,9 +87,11 @@ class User(UserMixin, BaseModel):
     def has_permission(self, permission: str | Iterable[str]) -> bool:
         if self.is_admin:
             return True
+        names = getattr(self, "_compiled_permissions", None)
+        if names is None:
+            names = self.permission_names()
         if isinstance(permission, str):
-            return permission in self.permission_names()
-        names = self.permission_names()
+            return permission in names
         return any(item in names for item in permission)
 
 
@@ -6,6 +6,7 @@ from .internal import INTERNAL_BLUEPRINT
 from .library import LIBRARY_BLUEPRINT
 from .queue import QUEUE_BLUEPRINT
 from .settings import SETTINGS_BLUEPRINT
+from . import sockets  # noqa: F401  - registers Socket.IO handlers
 from .transcode import api_bp as TRANSCODER_BLUEPRINT
 from .users import USERS_BLUEPRINT
 from .viewers import VIEWERS_BLUEPRINT
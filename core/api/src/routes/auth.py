@@ -89,7 +89,11 @@ def register_auth(app, *, group_service=None, settings_service=None) -> None:
             numeric = int(user_id)
         except (TypeError, ValueError):
             return None
-        return user_service.get_by_id(numeric)
+        user = user_service.get_for_session(numeric)
+        permission_cache = app.extensions.get("permission_cache")
+        if user is not None and permission_cache is not None and not user.is_admin:
+            user.attach_permissions(permission_cache.permissions_for(int(user.id)))
+        return user
 
     @login_manager.unauthorized_handler
     def _unauthorized() -> Any:  # pragma: no cover - flask callback
@@ -4,33 +4,34 @@ from __future__ import annotations
 import json
 import mimetypes
 import re
-import secrets
 from http import HTTPStatus
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Tuple
-from urllib.parse import urlparse
 
-import requests
-from flask import Blueprint, current_app, jsonify, request, send_file, session, url_for
-from flask_socketio import join_room, leave_room
+from flask import Blueprint, current_app, has_request_context, jsonify, request, send_file, session, url_for
 from flask_login import current_user
 from werkzeug.datastructures import FileStorage
 from werkzeug.utils import secure_filename
 
-from ..app.providers import socketio
+from ..celery_app.tasks.chat import enqueue_attachment_variants, enqueue_link_images
 from ..models import ChatAttachment, ChatMessage, User
 from ..services import ChatService, UserService
+from ..services.attachment_store import VARIANT_SIZES
+from ..services.chat_events import ChatEventPipeline
+from ..services.chat_retention import ChatRetentionService
+from ..services.socket_topics import TOPIC_CHAT, topic_room
 from ..services.viewer_service import ViewerService
 
 
 CHAT_BLUEPRINT = Blueprint("chat", __name__, url_prefix="/chat")
-CHAT_BROADCAST_ROOM = "chat:broadcast"
+CHAT_BROADCAST_ROOM = topic_room(TOPIC_CHAT)
 
 MAX_MESSAGE_LENGTH = 4_096
 MAX_ATTACHMENTS = 6
 MAX_UPLOAD_BYTES = 6 * 1024 * 1024  # 6 MiB per upload
-REMOTE_FETCH_TIMEOUT = 8
-REMOTE_MAX_BYTES = 5 * 1024 * 1024
+ATTACHMENT_MAX_AGE = 31_536_000  # attachment bytes never change for a given id
+CHAT_AVATAR_SIZE = 96  # rendered at 40px; the closest stored size covering 2x
+MENTION_AVATAR_SIZE = 48
 URL_PATTERN = re.compile(r"https?://[^\s<>]+", re.IGNORECASE)
 MENTION_PATTERN = re.compile(r"@([a-z0-9_\-]{2,})", re.IGNORECASE)
 
@@ -50,50 +51,45 @@ def _viewer_service() -> ViewerService:
     return svc
 
 
+def _events() -> ChatEventPipeline:
+    pipeline: ChatEventPipeline = current_app.extensions["chat_events"]
+    return pipeline
+
+
+def _retention() -> ChatRetentionService:
+    svc: ChatRetentionService = current_app.extensions["chat_retention"]
+    return svc
+
+
+def _avatar_url(user: Optional[User], size: int) -> Optional[str]:
+    version = getattr(user, "avatar_version", None)
+    if user is None or not version:
+        return None
+    return url_for("users.get_avatar_version", user_id=user.id, version=version, size=size, _external=False)
+
+
 def _serialize_message(message: ChatMessage) -> Dict[str, Any]:
     data = message.to_dict()
     attachments_payload = []
     for item in data.pop("attachments", []):
         attachment_id = item.get("id")
+        original_url = url_for("chat.get_attachment", attachment_id=attachment_id, _external=False)
         attachments_payload.append(
             {
                 **item,
-                "url": url_for("chat.get_attachment", attachment_id=attachment_id, _external=False),
+                # Chat renders the thumbnail; the original is only fetched on demand.
+                "url": url_for("chat.get_attachment", attachment_id=attachment_id, variant="thumb", _external=False),
+                "preview_url": url_for(
+                    "chat.get_attachment", attachment_id=attachment_id, variant="preview", _external=False
+                ),
+                "original_url": original_url,
             }
         )
     data["attachments"] = attachments_payload
-    reaction_map: Dict[str, Dict[str, Any]] = {}
-    for reaction in data.pop("reactions", []):
-        emoji = reaction.get("emoji")
-        if not emoji:
-            continue
-        entry = reaction_map.setdefault(
-            emoji,
-            {
-                "emoji": emoji,
-                "count": 0,
-                "user_ids": [],
-                "users": [],
-            },
-        )
-        entry["count"] += 1
-        user_id = reaction.get("user_id")
-        username = reaction.get("username")
-        if user_id is not None:
-            entry["user_ids"].append(int(user_id))
-        if username:
-            entry["users"].append(username)
-    for entry in reaction_map.values():
-        entry["user_ids"] = sorted(set(entry["user_ids"]))
-        entry["users"] = sorted(set(entry["users"]))
-    data["reactions"] = sorted(reaction_map.values(), key=lambda item: (-item["count"], item["emoji"]))
-    avatar_path = getattr(message.user, "avatar_path", None)
-    if avatar_path:
-        data["user_avatar_url"] = url_for("users.get_avatar", user_id=message.user_id, _external=False)
-    else:
-        data["user_avatar_url"] = None
-    user_groups = []
+    data["reactions"] = ChatService.summarize_reactions(data.pop("reactions", []))
     user = getattr(message, "user", None)
+    data["user_avatar_url"] = _avatar_url(user, CHAT_AVATAR_SIZE)
+    user_groups = []
     if user is not None and getattr(user, "groups", None) is not None:
         sorted_groups = sorted(user.groups, key=lambda item: item.name.lower())
         for group in sorted_groups:
@@ -113,10 +109,6 @@ def _serialize_message(message: ChatMessage) -> Dict[str, Any]:
     return data
 
 
-def _serialize_messages(messages: Iterable[ChatMessage]) -> List[Dict[str, Any]]:
-    return [_serialize_message(message) for message in messages]
-
-
 def _current_user_can_modify(message: ChatMessage, permission: str) -> bool:
     if not current_user.is_authenticated:
         return False
@@ -148,29 +140,9 @@ def _validate_body(body: str, *, allow_blank: bool = False) -> Optional[Tuple[An
     return None
 
 
-def _generate_filename(original_name: Optional[str], mime_type: str) -> str:
-    token = secrets.token_hex(16)
-    guessed_ext = None
-    if mime_type:
-        guessed_ext = mimetypes.guess_extension(mime_type.split(";")[0].strip())
-    if not guessed_ext and original_name:
-        guessed_ext = Path(secure_filename(original_name)).suffix
-    guessed_ext = guessed_ext or ""
-    return f"{token}{guessed_ext}"
-
-
 def _store_attachment(data: bytes, mime_type: str, original_name: Optional[str] = None) -> ChatAttachment:
-    upload_dir: Path = current_app.config["CHAT_UPLOAD_PATH"]
-    upload_dir.mkdir(parents=True, exist_ok=True)
-    file_name = _generate_filename(original_name, mime_type)
-    file_path = upload_dir / file_name
-    file_path.write_bytes(data)
-    return ChatAttachment(
-        file_path=file_name,
-        mime_type=mime_type,
-        file_size=len(data),
-        original_name=original_name,
-    )
+    safe_name = secure_filename(original_name) if original_name else None
+    return _service().store_attachment(data, mime_type, original_name=safe_name or original_name)
 
 
 def _load_file_storage(file_obj: FileStorage) -> ChatAttachment:
@@ -189,52 +161,19 @@ def _load_file_storage(file_obj: FileStorage) -> ChatAttachment:
     return _store_attachment(data, mime_type, original_name=file_obj.filename)
 
 
-def _fetch_remote_image(url: str) -> Optional[ChatAttachment]:
-    try:
-        response = requests.get(url, stream=True, timeout=REMOTE_FETCH_TIMEOUT)
-    except requests.RequestException:
-        return None
-    try:
-        content_type = response.headers.get("Content-Type", "").split(";")[0].strip().lower()
-        if not content_type.startswith("image/"):
-            return None
-        content_length = response.headers.get("Content-Length")
-        if content_length and int(content_length) > REMOTE_MAX_BYTES:
-            return None
-        data_chunks = []
-        total = 0
-        for chunk in response.iter_content(32 * 1024):
-            if not chunk:
-                continue
-            total += len(chunk)
-            if total > REMOTE_MAX_BYTES:
-                return None
-            data_chunks.append(chunk)
-        if not data_chunks:
-            return None
-        data = b"".join(data_chunks)
-        original_name = urlparse(url).path.split("/")[-1] or None
-        return _store_attachment(data, content_type, original_name=original_name)
-    finally:
-        response.close()
-
-
-def _collect_attachments_from_urls(body: str, remaining_slots: int) -> List[ChatAttachment]:
-    attachments: List[ChatAttachment] = []
-    if remaining_slots <= 0:
-        return attachments
-    seen_urls: set[str] = set()
-    for match in URL_PATTERN.finditer(body):
-        url = match.group(0)
-        if url in seen_urls:
-            continue
-        seen_urls.add(url)
-        attachment = _fetch_remote_image(url)
-        if attachment:
-            attachments.append(attachment)
-        if len(attachments) >= remaining_slots:
-            break
-    return attachments
+def _extract_urls(body: str) -> List[str]:
+    return list(dict.fromkeys(match.group(0) for match in URL_PATTERN.finditer(body)))
+
+
+def broadcast_message_update(message: ChatMessage) -> None:
+    """Queue ``chat:message:update``; usable outside a request (e.g. from workers)."""
+
+    if has_request_context():
+        payload = _serialize_message(message)
+    else:
+        with current_app.test_request_context():
+            payload = _serialize_message(message)
+    _events().publish_update(CHAT_BROADCAST_ROOM, payload)
 
 
 def _parse_new_message_request() -> Tuple[Optional[Tuple[Any, int]], str, List[ChatAttachment], Any]:
@@ -277,14 +216,10 @@ def _parse_new_message_request() -> Tuple[Optional[Tuple[Any, int]], str, List[C
 
 
 def _cleanup_attachments(attachments: Iterable[ChatAttachment]) -> None:
-    upload_dir: Path = current_app.config["CHAT_UPLOAD_PATH"]
-    for attachment in attachments:
-        file_path = upload_dir / attachment.file_path
-        if file_path.exists():
-            try:
-                file_path.unlink()
-            except OSError:
-                current_app.logger.warning("Failed to remove attachment %s", file_path)
+    try:
+        _service().discard_attachments(attachments)
+    except Exception:  # pragma: no cover - defensive
+        current_app.logger.warning("Failed to release chat attachments", exc_info=True)
 
 
 def _resolve_chat_identity() -> Tuple[Any, str, str, bool]:
@@ -355,17 +290,11 @@ def mentionable_users() -> Any:
     users = _user_service().list_users()
     payload: List[Dict[str, Any]] = []
     for person in users:
-        avatar_path = getattr(person, "avatar_path", None)
-        avatar_url = (
-            url_for("users.get_avatar", user_id=person.id, _external=False)
-            if avatar_path
-            else None
-        )
         payload.append(
             {
                 "id": int(person.id),
                 "username": person.username,
-                "avatar_url": avatar_url,
+                "avatar_url": _avatar_url(person, MENTION_AVATAR_SIZE),
                 "is_admin": bool(person.is_admin),
             }
         )
@@ -385,22 +314,53 @@ def _validate_emoji(payload: Dict[str, Any]) -> Tuple[Optional[Any], Optional[st
 def list_messages() -> Any:
     limit = request.args.get("limit", default=50, type=int)
     before_id = request.args.get("before_id", default=None, type=int)
+    after_id = request.args.get("after_id", default=None, type=int)
     limit = max(1, min(limit, 100))
-    records, has_more = _service().fetch_messages(limit=limit, before_id=before_id)
-    serialized = _serialize_messages(records)
-    next_before_id: Optional[int]
-    if records and has_more:
-        next_before_id = int(records[0].id)
-    else:
-        next_before_id = None
+    serialized, has_more = _service().fetch_serialized_page(
+        serializer=_serialize_message,
+        limit=limit,
+        before_id=before_id,
+        after_id=after_id,
+    )
     payload: Dict[str, Any] = {
         "messages": serialized,
-        "next_before_id": next_before_id,
+        "next_before_id": None,
         "has_more": has_more,
     }
+    if after_id is not None:
+        # Catch-up pages run forwards; keep reading while ``has_more``.
+        payload["next_after_id"] = int(serialized[-1]["id"]) if serialized else after_id
+    elif serialized and has_more:
+        payload["next_before_id"] = int(serialized[0]["id"])
     return jsonify(payload), HTTPStatus.OK
 
 
+@CHAT_BLUEPRINT.get("/archive")
+def search_archive() -> Any:
+    """Search messages moved out of live history by retention, newest first."""
+
+    auth_error = _ensure_authenticated()
+    if auth_error:
+        return auth_error
+    limit = max(1, min(request.args.get("limit", default=50, type=int), 100))
+    before_id = request.args.get("before_id", default=None, type=int)
+    messages, has_more = _retention().search_archive(
+        query=request.args.get("q", default="", type=str),
+        limit=limit,
+        before_id=before_id,
+    )
+    for message in messages:
+        # Archived attachments keep their metadata only; the files are released.
+        message["reactions"] = ChatService.summarize_reactions(message.get("reactions") or [])
+    return jsonify(
+        {
+            "messages": messages,
+            "has_more": has_more,
+            "next_before_id": int(messages[-1]["id"]) if messages and has_more else None,
+        }
+    ), HTTPStatus.OK
+
+
 @CHAT_BLUEPRINT.route("/messages", methods=["POST", "OPTIONS"])
 def post_message() -> Any:
     if request.method == "OPTIONS":
@@ -413,18 +373,6 @@ def post_message() -> Any:
 
     mention_users: List[User] = _resolve_mentions(body, mentions_payload)
 
-    remaining_slots = MAX_ATTACHMENTS - len(attachments)
-    try:
-        url_attachments = _collect_attachments_from_urls(body, remaining_slots)
-        attachments.extend(url_attachments)
-        if len(attachments) > MAX_ATTACHMENTS:
-            overflow = attachments[MAX_ATTACHMENTS:]
-            _cleanup_attachments(overflow)
-            del attachments[MAX_ATTACHMENTS:]
-    except Exception:
-        # On failure to download remote images we still proceed without them
-        pass
-
     try:
         message = _service().create_message(
             user=user,
@@ -438,8 +386,11 @@ def post_message() -> Any:
         _cleanup_attachments(attachments)
         raise
 
+    enqueue_attachment_variants(message.attachments)
     message_dict = _serialize_message(message)
-    socketio.emit("chat:message", message_dict, to=CHAT_BROADCAST_ROOM)
+    _events().publish_message(CHAT_BROADCAST_ROOM, message_dict)
+    # Linked images arrive later through ``chat:message:update``.
+    enqueue_link_images(message.id, _extract_urls(body), MAX_ATTACHMENTS - len(attachments))
     return jsonify({"message": message_dict}), HTTPStatus.CREATED
 
 
@@ -464,7 +415,7 @@ def patch_message(message_id: int) -> Any:
     mention_users = _resolve_mentions(body, payload.get("mentions"))
     updated = _service().update_message(message, body=body, mentions=mention_users)
     message_dict = _serialize_message(updated)
-    socketio.emit("chat:message:update", message_dict, to=CHAT_BROADCAST_ROOM)
+    _events().publish_update(CHAT_BROADCAST_ROOM, message_dict)
     return jsonify({"message": message_dict}), HTTPStatus.OK
 
 
@@ -480,22 +431,38 @@ def delete_message(message_id: int) -> Any:
     if not _current_user_can_modify(message, "chat.message.delete.any"):
         return jsonify({"error": "forbidden"}), HTTPStatus.FORBIDDEN
 
-    _cleanup_attachments(message.attachments)
     _service().delete_message(message)
-    socketio.emit("chat:message:delete", {"id": message_id}, to=CHAT_BROADCAST_ROOM)
+    _events().publish_delete(CHAT_BROADCAST_ROOM, message_id)
     return jsonify({"ok": True}), HTTPStatus.OK
 
 
 @CHAT_BLUEPRINT.get("/attachments/<int:attachment_id>")
 def get_attachment(attachment_id: int) -> Any:
+    """Serve an attachment; ``?variant=thumb|preview`` selects a resized copy.
+
+    Until a variant has been built the original is served uncached, after
+    which the URL is immutable like the attachment itself.
+    """
+
     attachment = ChatAttachment.query.get(attachment_id)
     if not attachment:
         return jsonify({"error": "attachment not found"}), HTTPStatus.NOT_FOUND
     upload_dir: Path = current_app.config["CHAT_UPLOAD_PATH"]
-    file_path = upload_dir / attachment.file_path
+    relative, mime_type, max_age = attachment.file_path, attachment.mime_type, ATTACHMENT_MAX_AGE
+    requested = request.args.get("variant")
+    if requested in VARIANT_SIZES:
+        variant = (attachment.variants or {}).get(requested)
+        if isinstance(variant, dict) and variant.get("file_path"):
+            relative, mime_type = str(variant["file_path"]), str(variant.get("mime_type") or mime_type)
+        elif attachment.variants is None:
+            max_age = 0
+    file_path = upload_dir / relative
     if not file_path.exists():
         return jsonify({"error": "attachment missing"}), HTTPStatus.NOT_FOUND
-    return send_file(str(file_path), mimetype=attachment.mime_type)
+    response = send_file(str(file_path), mimetype=mime_type, max_age=max_age, conditional=True)
+    if max_age:
+        response.headers["Cache-Control"] = f"public, max-age={max_age}, immutable"
+    return response
 
 
 @CHAT_BLUEPRINT.route("/messages/<int:message_id>/reactions", methods=["POST", "DELETE"])
@@ -526,29 +493,10 @@ def manage_reaction(message_id: int) -> Any:
     if not updated:
         return jsonify({"error": "message not found"}), HTTPStatus.NOT_FOUND
     message_dict = _serialize_message(updated)
-    socketio.emit("chat:message:update", message_dict, to=CHAT_BROADCAST_ROOM)
+    # Other clients get coalesced ``chat:reactions`` counts, not the full message.
+    _events().reactions_changed(CHAT_BROADCAST_ROOM, message_id)
     return jsonify({"message": message_dict}), status_code
 
 
-__all__ = ["CHAT_BLUEPRINT"]
+__all__ = ["CHAT_BLUEPRINT", "broadcast_message_update"]
 
-
-@socketio.on("connect")
-def handle_socket_connect():  # pragma: no cover - socketio callback
-    current_app.logger.info("Client connected to socket")
-    try:
-        join_room(CHAT_BROADCAST_ROOM)
-    except RuntimeError:
-        # join_room requires an active Socket.IO request context
-        current_app.logger.debug("Unable to join chat broadcast room for sid=%s", getattr(request, "sid", None))
-
-
-@socketio.on("disconnect")
-def handle_socket_disconnect():  # pragma: no cover - socketio callback
-    current_app.logger.info("Client disconnected from socket")
-    try:
-        leave_room(CHAT_BROADCAST_ROOM)
-    except RuntimeError:
-        current_app.logger.debug(
-            "Unable to leave chat broadcast room for sid=%s", getattr(request, "sid", None)
-        )
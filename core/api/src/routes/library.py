@@ -15,6 +15,7 @@ from ..celery_app.tasks.library import (
     enqueue_home_image_cache,
     enqueue_home_snapshot_refresh,
     enqueue_section_image_cache,
+    enqueue_section_prefetch,
     enqueue_section_snapshot_build,
 )
 
@@ -236,6 +237,21 @@ def section_items(section_id: str) -> Any:
     except PlexServiceError as exc:
         return jsonify({"error": str(exc)}), HTTPStatus.BAD_GATEWAY
 
+    prefetch = plex.claim_section_prefetch(
+        section_id,
+        payload,
+        user_id=getattr(current_user, "id", None),
+        sort=sort,
+        letter=letter,
+        search=search,
+        watch_state=watch_state,
+        genre=genre,
+        collection=collection,
+        year=year,
+    )
+    if prefetch is not None:
+        enqueue_section_prefetch(prefetch)
+
     return jsonify(payload)
 
 
@@ -688,8 +704,31 @@ def item_details(rating_key: str) -> Any:
         request.remote_addr,
         rating_key,
     )
+    profile = (request.args.get("profile") or PlexService.DETAIL_PROFILE_FULL).strip().lower()
+    if profile not in PlexService.DETAIL_PROFILES:
+        return jsonify({"error": "unsupported detail profile"}), HTTPStatus.BAD_REQUEST
+    try:
+        payload = plex.item_details(rating_key, profile=profile)
+    except PlexNotConnectedError as exc:
+        return jsonify({"error": str(exc)}), HTTPStatus.BAD_REQUEST
+    except PlexServiceError as exc:
+        return jsonify({"error": str(exc)}), HTTPStatus.NOT_FOUND
+    return jsonify(payload)
+
+
+@LIBRARY_BLUEPRINT.get("/plex/items/<rating_key>/<any(related, reviews, extras):section>")
+@login_required
+def item_detail_section(rating_key: str, section: str) -> Any:
+    plex = _plex_service()
+    logger.info(
+        "API request: fetch Plex item %s (user=%s, remote=%s, rating_key=%s)",
+        section,
+        getattr(current_user, "id", None),
+        request.remote_addr,
+        rating_key,
+    )
     try:
-        payload = plex.item_details(rating_key)
+        payload = plex.item_detail_section(rating_key, section)
     except PlexNotConnectedError as exc:
         return jsonify({"error": str(exc)}), HTTPStatus.BAD_REQUEST
     except PlexServiceError as exc:
@@ -63,6 +63,39 @@ def add_queue_item() -> Any:
     return jsonify({"item": item, "queue": snapshot}), HTTPStatus.CREATED
 
 
+@QUEUE_BLUEPRINT.post("/items/bulk")
+@login_required
+def add_queue_items() -> Any:
+    payload = request.get_json(silent=True) or {}
+    raw_items = payload.get("items")
+    if not isinstance(raw_items, list) or not raw_items:
+        return jsonify({"error": "items must be a non-empty list"}), HTTPStatus.BAD_REQUEST
+    entries = []
+    for raw in raw_items:
+        if isinstance(raw, Mapping):
+            entries.append({"rating_key": raw.get("rating_key"), "part_id": raw.get("part_id")})
+        else:
+            entries.append({"rating_key": raw})
+    mode = (payload.get("mode") or "last").lower()
+    index_value = payload.get("index")
+    try:
+        index = int(index_value) if index_value is not None else None
+    except (TypeError, ValueError):
+        index = None
+    queue = _queue_service()
+    try:
+        items, skipped = queue.enqueue_many(
+            entries,
+            mode=mode,
+            index=index,
+            requested_by=current_user if current_user.is_authenticated else None,
+        )
+    except QueueError as exc:
+        return jsonify({"error": str(exc)}), exc.status_code
+    snapshot = _queue_snapshot()
+    return jsonify({"items": items, "skipped": skipped, "queue": snapshot}), HTTPStatus.CREATED
+
+
 @QUEUE_BLUEPRINT.patch("/items/<int:item_id>/move")
 @login_required
 def move_queue_item(item_id: int) -> Any:
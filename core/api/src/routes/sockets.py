@@ -0,0 +1,104 @@
+"""Socket.IO connection and topic subscription handlers."""
+from __future__ import annotations
+
+from typing import Any, Dict, List
+
+from flask import current_app, request
+from flask_socketio import emit, join_room, leave_room, rooms
+
+from ..app.providers import socketio
+from ..services.chat_events import ChatEventPipeline
+from ..services.socket_topics import (
+    THROTTLED_TOPICS,
+    TOPIC_CHAT,
+    TOPIC_STATUS,
+    TOPICS,
+    resolve_rate,
+    topic_room,
+    topic_rooms,
+)
+from ..services.transcoder_status import TranscoderStatusService
+
+
+def _requested_topics(payload: Any) -> List[str]:
+    if not isinstance(payload, dict):
+        return []
+    raw = payload.get("topics")
+    if isinstance(raw, str):
+        raw = [raw]
+    if not isinstance(raw, (list, tuple)):
+        return []
+    return [topic for topic in raw if isinstance(topic, str) and topic in TOPICS]
+
+
+def _chat_events() -> ChatEventPipeline:
+    pipeline: ChatEventPipeline = current_app.extensions["chat_events"]
+    return pipeline
+
+
+def _subscriptions() -> Dict[str, Any]:
+    joined = [room for room in rooms() if isinstance(room, str) and room.startswith("topic:")]
+    return {"rooms": sorted(joined)}
+
+
+@socketio.on("connect")
+def handle_socket_connect():  # pragma: no cover - socketio callback
+    current_app.logger.info("Client connected to socket sid=%s", getattr(request, "sid", None))
+
+
+@socketio.on("disconnect")
+def handle_socket_disconnect():  # pragma: no cover - socketio callback
+    # Socket.IO drops room memberships with the connection.
+    _chat_events().forget(request.sid)
+    current_app.logger.info("Client disconnected from socket sid=%s", getattr(request, "sid", None))
+
+
+@socketio.on("subscribe")
+def handle_subscribe(payload: Any = None):  # pragma: no cover - socketio callback
+    """Join topic rooms; ``interval_ms`` picks the send-rate tier for state topics."""
+
+    interval = resolve_rate(payload.get("interval_ms") if isinstance(payload, dict) else None)
+    joined = set(rooms())
+    for topic in _requested_topics(payload):
+        target = topic_room(topic, interval if topic in THROTTLED_TOPICS else 0)
+        for room in topic_rooms(topic):
+            if room != target and room in joined:
+                leave_room(room)
+        join_room(target)
+        if topic == TOPIC_CHAT:
+            _chat_events().track(request.sid, target)
+        if topic == TOPIC_STATUS:
+            # Bring the client up to date instead of waiting for the next change.
+            status_service: TranscoderStatusService = current_app.extensions["transcoder_status_service"]
+            snapshot = status_service.cached_snapshot()
+            if snapshot:
+                emit("transcoder:status", snapshot)
+    return _subscriptions()
+
+
+@socketio.on("unsubscribe")
+def handle_unsubscribe(payload: Any = None):  # pragma: no cover - socketio callback
+    joined = set(rooms())
+    for topic in _requested_topics(payload):
+        for room in topic_rooms(topic):
+            if room in joined:
+                leave_room(room)
+        if topic == TOPIC_CHAT:
+            _chat_events().forget(request.sid)
+    return _subscriptions()
+
+
+@socketio.on("chat:ack")
+def handle_chat_ack(payload: Any = None):  # pragma: no cover - socketio callback
+    """Mark the client as caught up with ``chat:batch`` delivery."""
+
+    _chat_events().acknowledge(request.sid)
+
+
+__all__ = [
+    "handle_chat_ack",
+    "handle_socket_connect",
+    "handle_socket_disconnect",
+    "handle_subscribe",
+    "handle_unsubscribe",
+]
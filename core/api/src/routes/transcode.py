@@ -1,7 +1,6 @@
 """Transcode orchestration routes for the backend service."""
 from __future__ import annotations
 
-import copy
 import logging
 from collections.abc import Mapping
 from http import HTTPStatus
@@ -82,7 +81,7 @@ def _extract_metadata(payload: Optional[Mapping[str, Any]]) -> dict[str, Any]:
         return {}
     metadata = payload.get("metadata")
     if isinstance(metadata, Mapping):
-        return copy.deepcopy(metadata)
+        return dict(metadata)
 
     details = payload.get("details") if isinstance(payload.get("details"), Mapping) else None
     item = payload.get("item") if isinstance(payload.get("item"), Mapping) else None
@@ -96,11 +95,11 @@ def _extract_metadata(payload: Optional[Mapping[str, Any]]) -> dict[str, Any]:
     if "library_section_id" in payload:
         metadata_dict["library_section_id"] = payload.get("library_section_id")
     if item:
-        metadata_dict["item"] = copy.deepcopy(item)
+        metadata_dict["item"] = item
     if details:
-        metadata_dict["details"] = copy.deepcopy(details)
+        metadata_dict["details"] = details
     if source:
-        metadata_dict["source"] = copy.deepcopy(source)
+        metadata_dict["source"] = source
     return metadata_dict
 
 
@@ -112,6 +111,8 @@ def _build_status_response(
     session = _extract_session(status_payload)
     metadata = _extract_metadata(status_payload)
 
+    # Nested item/details/source mappings are shared with the snapshot, not
+    # copied; the response is only serialized, never mutated below the top level.
     playback = playback_snapshot if isinstance(playback_snapshot, Mapping) else None
     if playback:
         rating_key = playback.get("rating_key")
@@ -125,15 +126,15 @@ def _build_status_response(
 
         item_payload = playback.get("item") if isinstance(playback.get("item"), Mapping) else None
         if item_payload:
-            metadata.setdefault("item", copy.deepcopy(item_payload))
+            metadata.setdefault("item", item_payload)
 
         details_payload = playback.get("details") if isinstance(playback.get("details"), Mapping) else None
         if details_payload:
-            metadata.setdefault("details", copy.deepcopy(details_payload))
+            metadata.setdefault("details", details_payload)
 
         source_payload = playback.get("source") if isinstance(playback.get("source"), Mapping) else None
         if source_payload:
-            metadata.setdefault("source", copy.deepcopy(source_payload))
+            metadata.setdefault("source", source_payload)
 
         started_at = playback.get("started_at")
         if started_at and not session.get("started_at"):
@@ -149,7 +150,7 @@ def _build_status_response(
     return {
         "session": session,
         "metadata": metadata,
-        "redis": copy.deepcopy(dict(redis_info)),
+        "redis": dict(redis_info),
     }
 
 
@@ -1,23 +1,20 @@
 """User preference and profile management routes."""
 from __future__ import annotations
 
-import io
-import os
-import secrets
 from typing import Any, Dict, Optional, Tuple
 
-from PIL import Image
-from flask import Blueprint, current_app, jsonify, request, send_file
+from flask import Blueprint, current_app, jsonify, redirect, request, send_file, url_for
 from flask_login import current_user
 
 from ..app.providers import db
 from ..models import User
 from ..services import SettingsService, UserService
+from ..services.avatar_store import AvatarStore
 
 
 USERS_BLUEPRINT = Blueprint("users", __name__, url_prefix="/users")
 
-AVATAR_MAX_DIMENSION = 256
+AVATAR_MAX_AGE = 31_536_000  # versioned avatar URLs never change content
 SUPPORTED_NOTIFY_SCOPE = {"all", "mentions", "none"}
 SUPPORTED_THEMES = {"dark", "light", "monokai", "darcula"}
 THEME_ALIASES = {
@@ -42,22 +39,25 @@ def _require_authentication() -> Tuple[Optional[User], Optional[Tuple[Any, int]]
     return current_user, None  # type: ignore[return-value]
 
 
-def _user_avatar_dir() -> str:
-    directory = current_app.config["AVATAR_UPLOAD_PATH"]
-    os.makedirs(directory, exist_ok=True)
-    return directory
+def _avatar_store() -> AvatarStore:
+    store: AvatarStore = current_app.extensions["avatar_store"]
+    return store
 
 
 def _remove_existing_avatar(user: User) -> None:
-    if not user.avatar_path:
-        return
-    avatar_dir = _user_avatar_dir()
-    existing_path = os.path.join(avatar_dir, user.avatar_path)
-    if os.path.exists(existing_path):
-        try:
-            os.remove(existing_path)
-        except OSError:
-            current_app.logger.warning("Failed to remove avatar %s", existing_path)
+    if user.avatar_path:
+        _avatar_store().remove(user.avatar_path)
+
+
+def _send_avatar(user: User, *, max_age: int) -> Any:
+    resolved = _avatar_store().resolve(user.avatar_path, request.args.get("size", default=None, type=int))
+    if resolved is None:
+        return jsonify({"error": "avatar not found"}), 404
+    path, mime_type = resolved
+    response = send_file(str(path), mimetype=mime_type, max_age=max_age, conditional=True)
+    if max_age:
+        response.headers["Cache-Control"] = f"public, max-age={max_age}, immutable"
+    return response
 
 
 @USERS_BLUEPRINT.get("/me/preferences")
@@ -201,30 +201,13 @@ def upload_avatar() -> Any:
         return jsonify({"error": "avatar must be an image"}), 400
 
     try:
-        image = Image.open(file_storage.stream)
-    except (OSError, ValueError) as exc:
+        key = _avatar_store().save(user.id, file_storage.stream)
+    except ValueError as exc:
         return jsonify({"error": f"invalid image: {exc}"}), 400
 
-    image = image.convert("RGBA")
-    max_side = max(image.size)
-    if max_side > AVATAR_MAX_DIMENSION:
-        scale = AVATAR_MAX_DIMENSION / max_side
-        new_size = (max(1, int(image.width * scale)), max(1, int(image.height * scale)))
-        image = image.resize(new_size, Image.Resampling.LANCZOS)
-
-    output = io.BytesIO()
-    image.save(output, format="PNG")
-    output.seek(0)
-
-    avatar_dir = _user_avatar_dir()
-    filename = f"user-{user.id}-{secrets.token_hex(8)}.png"
-    target_path = os.path.join(avatar_dir, filename)
-
-    with open(target_path, "wb") as file_out:
-        file_out.write(output.read())
-
-    _remove_existing_avatar(user)
-    user.avatar_path = filename
+    if key != user.avatar_path:
+        _remove_existing_avatar(user)
+    user.avatar_path = key
     db.session.add(user)
     db.session.commit()
 
@@ -245,13 +228,34 @@ def delete_avatar() -> Any:
 
 @USERS_BLUEPRINT.get("/<int:user_id>/avatar")
 def get_avatar(user_id: int) -> Any:
+    """Serve the current avatar at an unversioned URL; clients must revalidate."""
+
     user = _user_service().get_by_id(user_id)
     if not user or not user.avatar_path:
         return jsonify({"error": "avatar not found"}), 404
-    avatar_path = os.path.join(_user_avatar_dir(), user.avatar_path)
-    if not os.path.exists(avatar_path):
+    return _send_avatar(user, max_age=0)
+
+
+@USERS_BLUEPRINT.get("/<int:user_id>/avatar/<version>")
+def get_avatar_version(user_id: int, version: str) -> Any:
+    """Serve an avatar by content version; ``?size=`` picks the closest render."""
+
+    user = _user_service().get_by_id(user_id)
+    if not user or not user.avatar_path:
         return jsonify({"error": "avatar not found"}), 404
-    return send_file(avatar_path, mimetype="image/png")
+    if version != user.avatar_version:
+        # An outdated URL (e.g. from a cached chat page) points at the current image.
+        response = redirect(
+            url_for(
+                "users.get_avatar_version",
+                user_id=user_id,
+                version=user.avatar_version,
+                size=request.args.get("size", default=None, type=int),
+            )
+        )
+        response.headers["Cache-Control"] = "no-cache"
+        return response
+    return _send_avatar(user, max_age=AVATAR_MAX_AGE)
 
 
 __all__ = ["USERS_BLUEPRINT"]
@@ -2,7 +2,13 @@
 
 from .chat_service import ChatReaction, ChatService, ensure_chat_schema
 from .group_service import GroupService
-from .playback_coordinator import PlaybackCoordinator, PlaybackCoordinatorError, PlaybackResult
+from .permission_cache import PermissionCache
+from .playback_coordinator import (
+    PlaybackCoordinator,
+    PlaybackCoordinatorError,
+    PlaybackResult,
+    StandbyPlayback,
+)
 from .playback_state import PlaybackState
 from .plex_service import PlexNotConnectedError, PlexService, PlexServiceError
 from .queue_service import QueueError, QueueService
@@ -18,6 +24,7 @@ __all__ = [
     "ChatReaction",
     "ensure_chat_schema",
     "GroupService",
+    "PermissionCache",
     "SettingsService",
     "PlexService",
     "PlexServiceError",
@@ -33,6 +40,7 @@ __all__ = [
     "PlaybackCoordinator",
     "PlaybackCoordinatorError",
     "PlaybackResult",
+    "StandbyPlayback",
     "QueueService",
     "QueueError",
     "TaskMonitorService",
@@ -0,0 +1,33 @@
+"""Atomic file writes shared by the on-disk stores."""
+from __future__ import annotations
+
+import os
+import tempfile
+from pathlib import Path
+
+# Temp files are hidden siblings of their target: ``.<name>.<random>.part``.
+TEMP_SUFFIX = ".part"
+
+
+def write_atomic(target: Path, payload: bytes) -> None:
+    """Write ``payload`` to a sibling temp file and rename it over ``target``.
+
+    Readers see either the previous file or the complete new one, never a
+    partial write. The temp file is removed if anything fails.
+    """
+
+    target.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_name = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.", suffix=TEMP_SUFFIX)
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(payload)
+        os.replace(temp_name, target)
+    except BaseException:
+        try:
+            os.unlink(temp_name)
+        except OSError:
+            pass
+        raise
+
+
+__all__ = ["TEMP_SUFFIX", "write_atomic"]
@@ -0,0 +1,185 @@
+"""Content-addressed storage for chat attachments and their resized variants."""
+from __future__ import annotations
+
+import hashlib
+import logging
+import mimetypes
+import os
+import re
+import time
+from io import BytesIO
+from pathlib import Path
+from typing import AbstractSet, Any, Dict, Iterable, Optional, Tuple
+
+from PIL import Image
+
+from .atomic_files import TEMP_SUFFIX, write_atomic
+
+LOGGER = logging.getLogger(__name__)
+
+_EXTENSION = re.compile(r"\.[a-z0-9]{1,8}")
+
+# Longest side, in pixels, of each generated variant. ``thumb`` is what chat
+# renders inline (2x the 18rem bubble width); ``preview`` backs larger views.
+VARIANT_SIZES: Dict[str, int] = {"thumb": 640, "preview": 1600}
+VARIANT_FORMAT = "WEBP"
+VARIANT_MIME_TYPE = "image/webp"
+VARIANT_QUALITY = 80
+
+
+class AttachmentStore:
+    """Store uploads under the SHA-256 of their bytes.
+
+    Identical uploads share one file, so reposts cost no extra disk. Files are
+    laid out as ``objects/<aa>/<digest><ext>`` with variants alongside as
+    ``<digest>.<variant>.webp``. Reference counting is left to the caller,
+    which knows how many attachment rows still point at a digest.
+    """
+
+    OBJECTS_DIR = "objects"
+    # Blobs this young are never released, so a concurrent upload of the same
+    # bytes that has not committed yet cannot lose its file.
+    RELEASE_GRACE_SECONDS = 120
+
+    def __init__(self, root: Path) -> None:
+        self.root = Path(root)
+
+    @staticmethod
+    def digest(data: bytes) -> str:
+        return hashlib.sha256(data).hexdigest()
+
+    def put(self, data: bytes, mime_type: str, original_name: Optional[str] = None) -> Tuple[str, str]:
+        """Persist ``data`` (once per digest) and return ``(relative_path, digest)``."""
+
+        digest = self.digest(data)
+        relative = self._object_path(digest, self._extension(mime_type, original_name))
+        target = self.root / relative
+        if target.exists():
+            # Refresh the mtime so the release grace period covers this reuse.
+            try:
+                os.utime(target)
+            except OSError:  # pragma: no cover - defensive
+                pass
+            return relative, digest
+        write_atomic(target, data)
+        return relative, digest
+
+    def path_for(self, relative: str) -> Path:
+        return self.root / relative
+
+    def build_variants(self, relative: str, digest: str) -> Dict[str, Dict[str, Any]]:
+        """Write each variant smaller than the original and describe it.
+
+        Animated images are left alone so they keep playing at full size.
+        """
+
+        source = self.root / relative
+        variants: Dict[str, Dict[str, Any]] = {}
+        try:
+            with Image.open(source) as image:
+                if getattr(image, "is_animated", False):
+                    return variants
+                image.load()
+                if image.mode not in {"RGB", "RGBA"}:
+                    image = image.convert("RGBA" if "A" in image.getbands() or "transparency" in image.info else "RGB")
+                resample = Image.Resampling.LANCZOS
+                for name, limit in sorted(VARIANT_SIZES.items(), key=lambda item: item[1]):
+                    if max(image.size) <= limit:
+                        break
+                    resized = image.copy()
+                    resized.thumbnail((limit, limit), resample=resample)
+                    buffer = BytesIO()
+                    resized.save(buffer, format=VARIANT_FORMAT, quality=VARIANT_QUALITY, method=4)
+                    payload = buffer.getvalue()
+                    variant_relative = self._object_path(digest, f".{name}.webp")
+                    write_atomic(self.root / variant_relative, payload)
+                    variants[name] = {
+                        "file_path": variant_relative,
+                        "mime_type": VARIANT_MIME_TYPE,
+                        "file_size": len(payload),
+                        "width": resized.width,
+                        "height": resized.height,
+                    }
+        except (OSError, ValueError) as exc:
+            LOGGER.warning("Failed to build variants for attachment %s: %s", digest, exc)
+        return variants
+
+    def release(self, relative: str, variants: Optional[Dict[str, Any]] = None) -> None:
+        """Remove an unreferenced blob and its variants."""
+
+        paths = [self.root / relative]
+        for variant in (variants or {}).values():
+            if isinstance(variant, dict) and variant.get("file_path"):
+                paths.append(self.root / str(variant["file_path"]))
+        try:
+            if time.time() - paths[0].stat().st_mtime < self.RELEASE_GRACE_SECONDS:
+                return
+        except OSError:
+            pass
+        self._unlink(paths)
+
+    def remove_legacy(self, relative: str) -> None:
+        """Remove a pre-dedup upload, which is never shared."""
+
+        self._unlink([self.root / relative])
+
+    def sweep(self, referenced_digests: AbstractSet[str], referenced_paths: AbstractSet[str]) -> int:
+        """Remove blobs, variants and leftover temp files that nothing references.
+
+        Anything younger than the release grace period is kept. Files in the
+        root directory are pre-dedup uploads, matched by relative path.
+        """
+
+        cutoff = time.time() - self.RELEASE_GRACE_SECONDS
+        orphans = []
+        objects = self.root / self.OBJECTS_DIR
+        if objects.is_dir():
+            for shard in objects.iterdir():
+                if not shard.is_dir():
+                    continue
+                for path in shard.iterdir():
+                    name = path.name
+                    if name.startswith("."):
+                        orphan = name.endswith(TEMP_SUFFIX)
+                    else:
+                        orphan = name[:64] not in referenced_digests
+                    if orphan and self._older_than(path, cutoff):
+                        orphans.append(path)
+        if self.root.is_dir():
+            for path in self.root.iterdir():
+                if path.is_file() and path.name not in referenced_paths and self._older_than(path, cutoff):
+                    orphans.append(path)
+        self._unlink(orphans)
+        return len(orphans)
+
+    @staticmethod
+    def _older_than(path: Path, cutoff: float) -> bool:
+        try:
+            return path.stat().st_mtime < cutoff
+        except OSError:
+            return False
+
+    def _object_path(self, digest: str, suffix: str) -> str:
+        return f"{self.OBJECTS_DIR}/{digest[:2]}/{digest}{suffix}"
+
+    @staticmethod
+    def _extension(mime_type: str, original_name: Optional[str]) -> str:
+        guessed = None
+        if mime_type:
+            guessed = mimetypes.guess_extension(mime_type.split(";")[0].strip())
+        if not guessed and original_name:
+            guessed = Path(original_name).suffix.lower()
+        return guessed if guessed and _EXTENSION.fullmatch(guessed) else ""
+
+    @staticmethod
+    def _unlink(paths: Iterable[Path]) -> None:
+        for path in paths:
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                continue
+            except OSError:
+                LOGGER.warning("Failed to remove attachment file %s", path)
+
+
+__all__ = ["AttachmentStore", "VARIANT_SIZES"]
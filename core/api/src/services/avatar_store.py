@@ -0,0 +1,90 @@
+"""Normalized, content-addressed storage for user avatars."""
+from __future__ import annotations
+
+import hashlib
+import logging
+from io import BytesIO
+from pathlib import Path
+from typing import BinaryIO, Dict, Optional, Tuple
+
+from PIL import Image, ImageOps
+
+from .atomic_files import write_atomic
+
+LOGGER = logging.getLogger(__name__)
+
+# Square edge, in pixels, of each rendered size. Chat bubbles (40px) use 96,
+# mention pickers 48, and profile views 256.
+AVATAR_SIZES: Tuple[int, ...] = (48, 96, 256)
+AVATAR_FORMAT = "WEBP"
+AVATAR_MIME_TYPE = "image/webp"
+AVATAR_QUALITY = 85
+
+
+class AvatarStore:
+    """Render uploads into fixed square WEBP sizes named by their content hash.
+
+    An avatar is identified by a key ``user-<id>-<digest>`` and stored as
+    ``<key>.<size>.webp``. The digest doubles as the URL version, so avatar
+    URLs can be cached as immutable. Keys ending in ``.png`` are single-file
+    uploads from before sizes existed and are served as they are.
+    """
+
+    LEGACY_SUFFIX = ".png"
+
+    def __init__(self, root: Path) -> None:
+        self.root = Path(root)
+
+    def save(self, user_id: int, source: BinaryIO) -> str:
+        """Normalize an uploaded image into every size and return its key.
+
+        Raises ``ValueError`` when the upload is not a readable image.
+        """
+
+        try:
+            with Image.open(source) as opened:
+                image = ImageOps.exif_transpose(opened).convert("RGBA")
+        except (OSError, ValueError, Image.DecompressionBombError) as exc:
+            raise ValueError(str(exc)) from exc
+
+        renders: Dict[int, bytes] = {}
+        for size in AVATAR_SIZES:
+            # Never upscale: small uploads are only cropped square.
+            edge = min(size, *image.size)
+            resized = ImageOps.fit(image, (edge, edge), method=Image.Resampling.LANCZOS)
+            buffer = BytesIO()
+            resized.save(buffer, format=AVATAR_FORMAT, quality=AVATAR_QUALITY, method=4)
+            renders[size] = buffer.getvalue()
+
+        digest = hashlib.sha256(b"".join(renders[size] for size in AVATAR_SIZES)).hexdigest()[:16]
+        key = f"user-{int(user_id)}-{digest}"
+        self.root.mkdir(parents=True, exist_ok=True)
+        for size, payload in renders.items():
+            write_atomic(self.root / f"{key}.{size}.webp", payload)
+        return key
+
+    def resolve(self, key: str, size: Optional[int] = None) -> Optional[Tuple[Path, str]]:
+        """Return ``(path, mime_type)`` of the smallest render covering ``size``."""
+
+        if key.endswith(self.LEGACY_SUFFIX):
+            path = self.root / key
+            return (path, "image/png") if path.exists() else None
+        wanted = next((candidate for candidate in AVATAR_SIZES if size and candidate >= size), AVATAR_SIZES[-1])
+        path = self.root / f"{key}.{wanted}.webp"
+        return (path, AVATAR_MIME_TYPE) if path.exists() else None
+
+    def remove(self, key: str) -> None:
+        if key.endswith(self.LEGACY_SUFFIX):
+            paths = [self.root / key]
+        else:
+            paths = [self.root / f"{key}.{size}.webp" for size in AVATAR_SIZES]
+        for path in paths:
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                continue
+            except OSError:
+                LOGGER.warning("Failed to remove avatar %s", path)
+
+
+__all__ = ["AVATAR_SIZES", "AvatarStore"]
@@ -0,0 +1,243 @@
+"""Batched, coalesced chat broadcasting over Socket.IO."""
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from flask import Flask
+from flask_socketio import SocketIO
+
+LOGGER = logging.getLogger(__name__)
+
+EVENT_MESSAGE = "chat:message"
+EVENT_UPDATE = "chat:message:update"
+EVENT_DELETE = "chat:message:delete"
+EVENT_REACTIONS = "chat:reactions"
+EVENT_BATCH = "chat:batch"
+EVENT_RESYNC = "chat:resync"
+
+
+@dataclass
+class _RoomQueue:
+    events: "OrderedDict[str, Tuple[str, Dict[str, Any]]]" = field(default_factory=OrderedDict)
+    # message id -> monotonic time of the first unflushed reaction change
+    reactions: Dict[int, float] = field(default_factory=dict)
+    seq: int = 0
+
+
+@dataclass
+class _ClientState:
+    room: str
+    awaiting_since: Optional[float] = None
+    lagging: bool = False
+
+
+class ChatEventPipeline:
+    """Queue chat events per room and emit them as one ``chat:batch`` per tick.
+
+    Within a tick, repeated updates to a message collapse into the newest one
+    and a delete drops anything still queued for that message. Reaction
+    changes only mark a message dirty; once ``reaction_window`` has passed
+    the aggregate counts are loaded once and sent as ``chat:reactions``, so
+    a reaction storm costs one query and one event per window.
+
+    Clients acknowledge each batch with ``chat:ack``. A client that has not
+    acknowledged for ``lag_seconds`` is skipped by further batches and told
+    to ``chat:resync`` (re-read history over HTTP) when it acknowledges
+    again. Ack state is tracked for the sockets connected to this worker.
+    """
+
+    def __init__(
+        self,
+        socketio: SocketIO,
+        *,
+        app: Flask,
+        reaction_loader: Callable[[int], Optional[List[Dict[str, Any]]]],
+        tick_seconds: float = 0.1,
+        reaction_window: float = 0.25,
+        lag_seconds: float = 5.0,
+    ) -> None:
+        self._socketio = socketio
+        self._app = app
+        self._reaction_loader = reaction_loader
+        self._tick = max(0.01, tick_seconds)
+        self._reaction_window = max(0.0, reaction_window)
+        self._lag_seconds = lag_seconds
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._rooms: Dict[str, _RoomQueue] = {}
+        self._clients: Dict[str, _ClientState] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+
+    # ------------------------------------------------------------------
+    # Producers
+    # ------------------------------------------------------------------
+    def publish_message(self, room: str, payload: Dict[str, Any]) -> None:
+        self._queue(room, f"message:{payload.get('id')}", EVENT_MESSAGE, payload)
+
+    def publish_update(self, room: str, payload: Dict[str, Any]) -> None:
+        message_id = payload.get("id")
+        with self._lock:
+            queue = self._rooms.setdefault(room, _RoomQueue())
+            pending = queue.events.get(f"message:{message_id}")
+            if pending is not None:
+                # Not sent yet: ship the newest state as the new message itself.
+                queue.events[f"message:{message_id}"] = (EVENT_MESSAGE, payload)
+            else:
+                queue.events[f"update:{message_id}"] = (EVENT_UPDATE, payload)
+            if isinstance(message_id, int):
+                # The full payload already carries current reactions.
+                queue.reactions.pop(message_id, None)
+        self._ensure_running()
+
+    def publish_delete(self, room: str, message_id: int) -> None:
+        with self._lock:
+            queue = self._rooms.setdefault(room, _RoomQueue())
+            queue.events.pop(f"update:{message_id}", None)
+            queue.reactions.pop(message_id, None)
+            if queue.events.pop(f"message:{message_id}", None) is None:
+                queue.events[f"delete:{message_id}"] = (EVENT_DELETE, {"id": message_id})
+        self._ensure_running()
+
+    def reactions_changed(self, room: str, message_id: int) -> None:
+        with self._lock:
+            queue = self._rooms.setdefault(room, _RoomQueue())
+            queue.reactions.setdefault(message_id, time.monotonic())
+        self._ensure_running()
+
+    # ------------------------------------------------------------------
+    # Client flow control
+    # ------------------------------------------------------------------
+    def track(self, sid: str, room: str) -> None:
+        with self._lock:
+            self._clients[sid] = _ClientState(room=room)
+
+    def forget(self, sid: str) -> None:
+        with self._lock:
+            self._clients.pop(sid, None)
+
+    def acknowledge(self, sid: str) -> None:
+        with self._lock:
+            state = self._clients.get(sid)
+            if state is None:
+                return
+            state.awaiting_since = None
+            resync = state.lagging
+            state.lagging = False
+        if resync:
+            self._emit(EVENT_RESYNC, {}, to=sid)
+
+    def close(self) -> None:
+        self._stopped = True
+        self._wakeup.set()
+
+    # ------------------------------------------------------------------
+    # Flushing
+    # ------------------------------------------------------------------
+    def _queue(self, room: str, key: str, event: str, payload: Dict[str, Any]) -> None:
+        with self._lock:
+            self._rooms.setdefault(room, _RoomQueue()).events[key] = (event, payload)
+        self._ensure_running()
+
+    def _ensure_running(self) -> None:
+        self._wakeup.set()
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(target=self._run, name="chat-event-pipeline", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stopped:
+            # Sleep until something is queued, then flush once per tick until drained.
+            self._wakeup.wait()
+            self._wakeup.clear()
+            pending = True
+            while pending and not self._stopped:
+                time.sleep(self._tick)
+                try:
+                    pending = self._flush(time.monotonic())
+                except Exception:  # pragma: no cover - defensive
+                    LOGGER.exception("Chat event flush failed")
+                    pending = False
+
+    def _flush(self, now: float) -> bool:
+        """Emit due batches; return whether reaction changes are still waiting."""
+
+        batches: List[Tuple[str, List[Dict[str, Any]], List[int]]] = []
+        with self._lock:
+            for room, queue in self._rooms.items():
+                events = [{"event": event, "data": payload} for event, payload in queue.events.values()]
+                queue.events.clear()
+                due = [
+                    message_id
+                    for message_id, first_change in queue.reactions.items()
+                    if now - first_change >= self._reaction_window
+                ]
+                for message_id in due:
+                    queue.reactions.pop(message_id, None)
+                if events or due:
+                    batches.append((room, events, due))
+            pending = any(queue.reactions for queue in self._rooms.values())
+
+        for room, events, due in batches:
+            if due:
+                events.extend(self._reaction_events(due))
+            if not events:
+                continue
+            skip = self._mark_sent(room, now)
+            with self._lock:
+                queue = self._rooms.setdefault(room, _RoomQueue())
+                queue.seq += 1
+                seq = queue.seq
+            self._emit(EVENT_BATCH, {"seq": seq, "events": events}, to=room, skip_sid=skip or None)
+        return pending
+
+    def _reaction_events(self, message_ids: List[int]) -> List[Dict[str, Any]]:
+        events: List[Dict[str, Any]] = []
+        with self._app.app_context():
+            for message_id in message_ids:
+                reactions = self._reaction_loader(message_id)
+                if reactions is None:
+                    continue
+                events.append({"event": EVENT_REACTIONS, "data": {"id": message_id, "reactions": reactions}})
+        return events
+
+    def _mark_sent(self, room: str, now: float) -> List[str]:
+        skip: List[str] = []
+        with self._lock:
+            for sid, state in self._clients.items():
+                if state.room != room:
+                    continue
+                if state.lagging:
+                    skip.append(sid)
+                elif state.awaiting_since is None:
+                    state.awaiting_since = now
+                elif now - state.awaiting_since > self._lag_seconds:
+                    state.lagging = True
+                    skip.append(sid)
+        return skip
+
+    def _emit(self, event: str, payload: Dict[str, Any], **kwargs: Any) -> None:
+        try:
+            self._socketio.emit(event, payload, **kwargs)
+        except Exception:  # pragma: no cover - defensive
+            LOGGER.debug("Failed to emit %s", event, exc_info=True)
+
+
+__all__ = [
+    "ChatEventPipeline",
+    "EVENT_BATCH",
+    "EVENT_DELETE",
+    "EVENT_MESSAGE",
+    "EVENT_REACTIONS",
+    "EVENT_RESYNC",
+    "EVENT_UPDATE",
+]
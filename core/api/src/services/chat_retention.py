@@ -0,0 +1,243 @@
+"""Chat history retention: archive old messages, sweep orphaned files, compact."""
+from __future__ import annotations
+
+import logging
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import delete, or_, select
+from sqlalchemy.orm import selectinload
+from sqlalchemy.sql.elements import ColumnElement
+
+from ..app.providers import db
+from ..models import ChatArchivedMessage, ChatAttachment, ChatMention, ChatMessage, ChatReaction
+
+if TYPE_CHECKING:  # pragma: no cover - typing helper
+    from .chat_service import ChatService
+    from .redis_service import RedisService
+    from .settings_service import SettingsService
+
+LOGGER = logging.getLogger(__name__)
+
+_CHAT_TABLES = ("chat_messages", "chat_reactions", "chat_mentions", "chat_attachments")
+
+
+@dataclass
+class RetentionReport:
+    archived: int = 0
+    deleted: int = 0
+    files_removed: int = 0
+    compacted: bool = False
+    skipped: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class ChatRetentionService:
+    """Keep the live chat tables bounded.
+
+    Messages past the configured age or count limit are moved, in batches,
+    into ``chat_message_archive`` (or dropped when archiving is off).
+    Attachment files no live or archived message references are then swept,
+    and the database is compacted once something was removed.
+    """
+
+    REDIS_NAMESPACE = "chat:retention"
+    LOCK_KEY = "running"
+    LOCK_TTL_SECONDS = 3600
+    BATCH_SIZE = 500
+    # SQLite is only rewritten (VACUUM) once this share of its pages is free.
+    VACUUM_FREE_RATIO = 0.2
+
+    def __init__(
+        self,
+        *,
+        chat_service: "ChatService",
+        settings_service: "SettingsService",
+        redis_service: Optional["RedisService"] = None,
+    ) -> None:
+        self._chat = chat_service
+        self._settings = settings_service
+        self._redis = redis_service
+
+    def enforce(self, *, now: Optional[datetime] = None) -> RetentionReport:
+        """Apply the retention settings once; safe to call from several workers."""
+
+        report = RetentionReport()
+        if self._use_redis() and not self._redis.claim(  # type: ignore[union-attr]
+            self.REDIS_NAMESPACE, self.LOCK_KEY, ttl=self.LOCK_TTL_SECONDS
+        ):
+            report.skipped = "another retention run is in progress"
+            return report
+        try:
+            settings = self._settings.get_chat_retention_settings()
+            archive = bool(settings["retention_archive"])
+            expired = self._expired_condition(
+                days=int(settings["retention_days"]),
+                max_messages=int(settings["retention_max_messages"]),
+                now=now or datetime.utcnow(),
+            )
+            while expired is not None:
+                moved = self._prune_batch(expired, archive=archive)
+                if archive:
+                    report.archived += moved
+                else:
+                    report.deleted += moved
+                if moved < self.BATCH_SIZE:
+                    break
+            report.files_removed = self.sweep_attachments()
+            if report.archived or report.deleted:
+                report.compacted = self.compact()
+        finally:
+            if self._use_redis():
+                self._redis.delete(self.REDIS_NAMESPACE, self.LOCK_KEY)  # type: ignore[union-attr]
+        LOGGER.info(
+            "Chat retention: archived=%d deleted=%d files_removed=%d compacted=%s",
+            report.archived,
+            report.deleted,
+            report.files_removed,
+            report.compacted,
+        )
+        return report
+
+    def sweep_attachments(self) -> int:
+        """Delete stored files that neither an attachment row nor the archive points at."""
+
+        store = self._chat.attachment_store
+        if store is None:
+            return 0
+        digests = set(
+            db.session.execute(
+                select(ChatAttachment.content_hash).filter(ChatAttachment.content_hash.is_not(None)).distinct()
+            ).scalars()
+        )
+        legacy_paths = set(
+            db.session.execute(
+                select(ChatAttachment.file_path).filter(ChatAttachment.content_hash.is_(None))
+            ).scalars()
+        )
+        archived_refs = db.session.execute(
+            select(ChatArchivedMessage.attachment_refs).filter(ChatArchivedMessage.attachment_refs.is_not(None))
+        ).scalars()
+        for refs in archived_refs:
+            if isinstance(refs, dict):
+                digests.update(refs.get("digests") or ())
+                legacy_paths.update(refs.get("paths") or ())
+        return store.sweep(digests, legacy_paths)
+
+    def compact(self) -> bool:
+        """Return freed pages to the filesystem and refresh planner statistics."""
+
+        engine = db.get_engine()
+        dialect = engine.dialect.name
+        try:
+            with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+                if dialect == "sqlite":
+                    free_pages = int(conn.exec_driver_sql("PRAGMA freelist_count").scalar() or 0)
+                    total_pages = int(conn.exec_driver_sql("PRAGMA page_count").scalar() or 0)
+                    vacuumed = bool(total_pages) and free_pages / total_pages >= self.VACUUM_FREE_RATIO
+                    if vacuumed:
+                        conn.exec_driver_sql("VACUUM")
+                    conn.exec_driver_sql("PRAGMA optimize")
+                    return vacuumed
+                if dialect == "postgresql":
+                    for table in _CHAT_TABLES:
+                        conn.exec_driver_sql(f"VACUUM (ANALYZE) {table}")
+                    return True
+                if dialect in {"mysql", "mariadb"}:
+                    conn.exec_driver_sql(f"OPTIMIZE TABLE {', '.join(_CHAT_TABLES)}")
+                    return True
+        except Exception:  # pragma: no cover - defensive
+            LOGGER.exception("Chat table compaction failed")
+        return False
+
+    def search_archive(
+        self,
+        *,
+        query: str = "",
+        limit: int = 50,
+        before_id: Optional[int] = None,
+    ) -> Tuple[List[Dict[str, Any]], bool]:
+        """Return archived messages matching ``query``, newest first."""
+
+        stmt = select(ChatArchivedMessage)
+        text_query = query.strip()
+        if text_query:
+            escaped = text_query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            pattern = f"%{escaped}%"
+            stmt = stmt.filter(
+                or_(
+                    ChatArchivedMessage.body.ilike(pattern, escape="\\"),
+                    ChatArchivedMessage.username.ilike(pattern, escape="\\"),
+                )
+            )
+        if before_id is not None:
+            stmt = stmt.filter(ChatArchivedMessage.id < before_id)
+        rows = db.session.execute(stmt.order_by(ChatArchivedMessage.id.desc()).limit(limit + 1)).scalars().all()
+        return [row.to_dict() for row in rows[:limit]], len(rows) > limit
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _expired_condition(*, days: int, max_messages: int, now: datetime) -> Optional[ColumnElement[bool]]:
+        clauses: List[ColumnElement[bool]] = []
+        if days > 0:
+            clauses.append(ChatMessage.created_at < now - timedelta(days=days))
+        if max_messages > 0:
+            # Id of the newest message beyond the limit; it and everything older go.
+            boundary = db.session.execute(
+                select(ChatMessage.id).order_by(ChatMessage.id.desc()).offset(max_messages).limit(1)
+            ).scalar_one_or_none()
+            if boundary is not None:
+                clauses.append(ChatMessage.id <= boundary)
+        return or_(*clauses) if clauses else None
+
+    def _prune_batch(self, expired: ColumnElement[bool], *, archive: bool) -> int:
+        stmt = select(ChatMessage).filter(expired).order_by(ChatMessage.id.asc()).limit(self.BATCH_SIZE)
+        if archive:
+            stmt = stmt.options(
+                selectinload(ChatMessage.attachments),
+                selectinload(ChatMessage.reactions).selectinload(ChatReaction.user),
+                selectinload(ChatMessage.mentions).selectinload(ChatMention.user),
+            )
+        messages = db.session.execute(stmt).scalars().all()
+        if not messages:
+            return 0
+        ids = [int(message.id) for message in messages]
+        if archive:
+            db.session.add_all(self._archive_row(message) for message in messages)
+        # Bulk deletes: SQLite does not enforce ON DELETE CASCADE by default.
+        for model in (ChatReaction, ChatMention, ChatAttachment):
+            db.session.execute(delete(model).where(model.message_id.in_(ids)).execution_options(synchronize_session=False))
+        db.session.execute(delete(ChatMessage).where(ChatMessage.id.in_(ids)).execution_options(synchronize_session=False))
+        db.session.commit()
+        db.session.expunge_all()
+        return len(ids)
+
+    @staticmethod
+    def _archive_row(message: ChatMessage) -> ChatArchivedMessage:
+        data = message.to_dict()
+        for key in ("id", "user_id", "username", "body"):
+            data.pop(key, None)
+        # The attachment rows are deleted; keep their files out of the sweep.
+        attachments = message.attachments
+        digests = sorted({item.content_hash for item in attachments if item.content_hash})
+        paths = sorted({item.file_path for item in attachments if not item.content_hash and item.file_path})
+        return ChatArchivedMessage(
+            id=message.id,
+            user_id=message.user_id,
+            username=message.username,
+            body=message.body,
+            created_at=message.created_at,
+            payload=ChatArchivedMessage.compress(data),
+            attachment_refs={"digests": digests, "paths": paths} if digests or paths else None,
+        )
+
+    def _use_redis(self) -> bool:
+        return bool(self._redis and self._redis.available)
+
+
+__all__ = ["ChatRetentionService", "RetentionReport"]
@@ -1,13 +1,18 @@
 """Chat persistence helpers."""
 from __future__ import annotations
 
-from typing import Iterable, List, Optional, Sequence
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Sequence
 
-from sqlalchemy import inspect, select, text
+from sqlalchemy import Select, func, inspect, select, text
 from sqlalchemy.orm import selectinload
 
 from ..app.providers import db
-from ..models import ChatAttachment, ChatMention, ChatMessage, ChatReaction, User
+from ..models import ChatArchivedMessage, ChatAttachment, ChatMention, ChatMessage, ChatReaction, User
+
+if TYPE_CHECKING:  # pragma: no cover - typing helper
+    from .attachment_store import AttachmentStore
+    from .redis_service import RedisService
 
 
 def ensure_chat_schema() -> None:
@@ -21,6 +26,27 @@ def ensure_chat_schema() -> None:
         ChatReaction.__table__.create(bind=engine)
     if "chat_mentions" not in existing_tables:
         ChatMention.__table__.create(bind=engine)
+    if "chat_message_archive" not in existing_tables:
+        ChatArchivedMessage.__table__.create(bind=engine)
+
+    archive_columns = {col["name"] for col in inspector.get_columns("chat_message_archive")}
+    if "attachment_refs" not in archive_columns:
+        with engine.begin() as conn:
+            conn.execute(text("ALTER TABLE chat_message_archive ADD COLUMN attachment_refs JSON"))
+
+    attachment_columns = {col["name"] for col in inspector.get_columns("chat_attachments")}
+    if "content_hash" not in attachment_columns:
+        with engine.begin() as conn:
+            conn.execute(text("ALTER TABLE chat_attachments ADD COLUMN content_hash VARCHAR(64)"))
+            conn.execute(
+                text(
+                    "CREATE INDEX IF NOT EXISTS ix_chat_attachments_content_hash "
+                    "ON chat_attachments (content_hash)"
+                )
+            )
+    if "variants" not in attachment_columns:
+        with engine.begin() as conn:
+            conn.execute(text("ALTER TABLE chat_attachments ADD COLUMN variants JSON"))
 
     columns = {col["name"] for col in inspector.get_columns("chat_messages")}
     if "updated_at" not in columns:
@@ -40,8 +66,143 @@ def ensure_chat_schema() -> None:
             )
 
 
+def _message_options() -> tuple[Any, ...]:
+    return (
+        selectinload(ChatMessage.user).selectinload(User.groups),
+        selectinload(ChatMessage.attachments),
+        selectinload(ChatMessage.reactions).selectinload(ChatReaction.user),
+        selectinload(ChatMessage.mentions).selectinload(ChatMention.user),
+    )
+
+
+def _revision(updated_at: Any) -> str:
+    if isinstance(updated_at, datetime):
+        return str(int(updated_at.timestamp() * 1_000_000))
+    return "0"
+
+
 class ChatService:
-    """Encapsulates chat message CRUD operations."""
+    """Encapsulates chat message CRUD operations.
+
+    Serialized messages are cached in Redis under ``(id, updated_at)`` so
+    history pages only load and serialize messages that changed. Edits move
+    a message to a new key; reactions and deletes drop the cached entry.
+
+    Attachment bytes live in an :class:`AttachmentStore` keyed by content
+    hash. A file is released only once no attachment row references it.
+    """
+
+    SERIALIZED_NAMESPACE = "chat:messages"
+    SERIALIZED_TTL_SECONDS = 600
+
+    def __init__(
+        self,
+        *,
+        redis_service: Optional["RedisService"] = None,
+        attachment_store: Optional["AttachmentStore"] = None,
+    ) -> None:
+        self._redis = redis_service
+        self._attachments = attachment_store
+
+    @property
+    def attachment_store(self) -> Optional["AttachmentStore"]:
+        return self._attachments
+
+    def store_attachment(
+        self,
+        data: bytes,
+        mime_type: str,
+        original_name: Optional[str] = None,
+    ) -> ChatAttachment:
+        """Persist upload bytes (deduplicated) and return an unsaved attachment row."""
+
+        if self._attachments is None:
+            raise RuntimeError("attachment storage is not configured")
+        file_path, digest = self._attachments.put(data, mime_type, original_name)
+        return self.reuse_attachment(
+            file_path=file_path,
+            mime_type=mime_type,
+            file_size=len(data),
+            original_name=original_name,
+            content_hash=digest,
+        )
+
+    def reuse_attachment(
+        self,
+        *,
+        file_path: str,
+        mime_type: str,
+        file_size: int,
+        original_name: Optional[str],
+        content_hash: str,
+    ) -> ChatAttachment:
+        """Return an unsaved attachment row for a blob that is already stored."""
+
+        # Reposts reuse variants already built for the same bytes.
+        variants = db.session.execute(
+            select(ChatAttachment.variants)
+            .filter(ChatAttachment.content_hash == content_hash, ChatAttachment.variants.is_not(None))
+            .limit(1)
+        ).scalar_one_or_none()
+        return ChatAttachment(
+            file_path=file_path,
+            mime_type=mime_type,
+            file_size=file_size,
+            original_name=original_name,
+            content_hash=content_hash,
+            variants=variants,
+        )
+
+    def add_attachments(self, message_id: int, attachments: Sequence[ChatAttachment]) -> List[ChatAttachment]:
+        """Attach rows to an existing message, skipping content it already carries."""
+
+        message = db.session.get(ChatMessage, message_id)
+        if message is None:
+            self.discard_attachments(attachments)
+            return []
+        seen = {attachment.content_hash for attachment in message.attachments if attachment.content_hash}
+        added: List[ChatAttachment] = []
+        for attachment in attachments:
+            if attachment.content_hash and attachment.content_hash in seen:
+                continue
+            seen.add(attachment.content_hash)
+            message.attachments.append(attachment)
+            added.append(attachment)
+        if not added:
+            return []
+        db.session.commit()
+        # Attachments do not touch ``updated_at``, so drop the cached payload explicitly.
+        self._forget_serialized(message.id, _revision(message.updated_at))
+        return added
+
+    def build_attachment_variants(self, content_hash: str, file_path: str) -> Dict[str, Any]:
+        """Generate resized copies of a stored blob and record them on every row sharing it."""
+
+        if self._attachments is None:
+            return {}
+        variants = self._attachments.build_variants(file_path, content_hash)
+        rows = ChatAttachment.query.filter_by(content_hash=content_hash).all()
+        for row in rows:
+            row.variants = variants
+        db.session.commit()
+        return variants
+
+    def discard_attachments(self, attachments: Iterable[ChatAttachment]) -> None:
+        """Release files of attachments whose rows were deleted or never saved."""
+
+        if self._attachments is None:
+            return
+        for attachment in attachments:
+            if not attachment.content_hash:
+                self._attachments.remove_legacy(attachment.file_path)
+                continue
+            remaining = db.session.execute(
+                select(func.count(ChatAttachment.id)).filter(
+                    ChatAttachment.content_hash == attachment.content_hash
+                )
+            ).scalar_one()
+            if not remaining:
+                self._attachments.release(attachment.file_path, attachment.variants)
 
     def create_message(
         self,
@@ -76,6 +237,7 @@ class ChatService:
         body: str,
         mentions: Optional[Sequence[User]] = None,
     ) -> ChatMessage:
+        previous_revision = _revision(message.updated_at)
         message.body = body.strip()
         if mentions is not None:
             desired_ids = {user.id for user in mentions}
@@ -90,43 +252,94 @@ class ChatService:
         db.session.add(message)
         db.session.commit()
         db.session.refresh(message)
+        self._forget_serialized(message.id, previous_revision, _revision(message.updated_at))
         return message
 
     def delete_message(self, message: ChatMessage) -> None:
+        message_id, revision = message.id, _revision(message.updated_at)
+        attachments = [
+            ChatAttachment(
+                file_path=attachment.file_path,
+                content_hash=attachment.content_hash,
+                variants=attachment.variants,
+            )
+            for attachment in message.attachments
+        ]
         db.session.delete(message)
         db.session.commit()
+        self._forget_serialized(message_id, revision)
+        self.discard_attachments(attachments)
+
+    @staticmethod
+    def page_query(
+        *,
+        limit: int = 50,
+        before_id: Optional[int] = None,
+        after_id: Optional[int] = None,
+    ) -> Select:
+        """Return the ``(id, updated_at)`` query for one history page (plus one lookahead row)."""
 
-    def fetch_messages(
+        query = select(ChatMessage.id, ChatMessage.updated_at)
+        if after_id is not None:
+            query = query.filter(ChatMessage.id > after_id).order_by(ChatMessage.id.asc())
+        else:
+            if before_id is not None:
+                query = query.filter(ChatMessage.id < before_id)
+            query = query.order_by(ChatMessage.id.desc())
+        return query.limit(limit + 1)
+
+    def fetch_serialized_page(
         self,
         *,
+        serializer: Callable[[ChatMessage], Dict[str, Any]],
         limit: int = 50,
         before_id: Optional[int] = None,
-    ) -> tuple[List[ChatMessage], bool]:
-        query = select(ChatMessage).options(
-            selectinload(ChatMessage.user).selectinload(User.groups),
-            selectinload(ChatMessage.attachments),
-            selectinload(ChatMessage.reactions).selectinload(ChatReaction.user),
-            selectinload(ChatMessage.mentions).selectinload(ChatMention.user),
-        )
-        if before_id is not None:
-            query = query.filter(ChatMessage.id < before_id)
-        query = query.order_by(ChatMessage.id.desc()).limit(limit + 1)
-        results: Iterable[ChatMessage] = db.session.execute(query).scalars()
-        ordered = list(results)
-        has_more = len(ordered) > limit
-        sliced = ordered[:limit]
-        sliced.reverse()
-        return sliced, has_more
+        after_id: Optional[int] = None,
+    ) -> tuple[List[Dict[str, Any]], bool]:
+        """Return one page of serialized messages in chronological order.
+
+        Paging walks backwards from ``before_id`` (or the newest message), or
+        forwards from ``after_id`` for clients catching up after a
+        reconnect. Only ``(id, updated_at)`` is read for the page; messages
+        missing from the cache are loaded with their relationships,
+        serialized and stored.
+        """
+
+        query = self.page_query(limit=limit, before_id=before_id, after_id=after_id)
+        rows = db.session.execute(query).all()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        if after_id is None:
+            rows.reverse()
+        if not rows:
+            return [], has_more
+
+        keys = {int(row.id): f"{int(row.id)}:{_revision(row.updated_at)}" for row in rows}
+        cached: Dict[str, Dict[str, Any]] = {}
+        if self._use_redis():
+            cached = self._redis.cache_get_many(self.SERIALIZED_NAMESPACE, keys.values())  # type: ignore[union-attr]
+        serialized: Dict[int, Dict[str, Any]] = {
+            message_id: cached[key] for message_id, key in keys.items() if key in cached
+        }
+        missing = [message_id for message_id in keys if message_id not in serialized]
+        if missing:
+            stmt = select(ChatMessage).options(*_message_options()).filter(ChatMessage.id.in_(missing))
+            for message in db.session.execute(stmt).scalars():
+                payload = serializer(message)
+                serialized[int(message.id)] = payload
+                if self._use_redis():
+                    self._redis.cache_set(  # type: ignore[union-attr]
+                        self.SERIALIZED_NAMESPACE,
+                        f"{int(message.id)}:{_revision(message.updated_at)}",
+                        payload,
+                        ttl=self.SERIALIZED_TTL_SECONDS,
+                    )
+        return [serialized[message_id] for message_id in keys if message_id in serialized], has_more
 
     def get_message(self, message_id: int) -> Optional[ChatMessage]:
         stmt = (
             select(ChatMessage)
-            .options(
-                selectinload(ChatMessage.user).selectinload(User.groups),
-                selectinload(ChatMessage.attachments),
-                selectinload(ChatMessage.reactions).selectinload(ChatReaction.user),
-                selectinload(ChatMessage.mentions).selectinload(ChatMention.user),
-            )
+            .options(*_message_options())
             .filter(ChatMessage.id == message_id)
             .limit(1)
         )
@@ -142,6 +355,7 @@ class ChatService:
         db.session.add(reaction)
         db.session.commit()
         db.session.refresh(reaction)
+        self._forget_serialized(message.id, _revision(message.updated_at))
         return reaction
 
     def remove_reaction(self, message: ChatMessage, user: User, emoji: str) -> bool:
@@ -152,7 +366,64 @@ class ChatService:
             return False
         db.session.delete(reaction)
         db.session.commit()
+        self._forget_serialized(message.id, _revision(message.updated_at))
         return True
 
+    @staticmethod
+    def summarize_reactions(reactions: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Collapse per-user reaction rows into one entry per emoji, busiest first."""
+
+        reaction_map: Dict[str, Dict[str, Any]] = {}
+        for reaction in reactions:
+            emoji = reaction.get("emoji")
+            if not emoji:
+                continue
+            entry = reaction_map.setdefault(
+                emoji,
+                {
+                    "emoji": emoji,
+                    "count": 0,
+                    "user_ids": [],
+                    "users": [],
+                },
+            )
+            entry["count"] += 1
+            user_id = reaction.get("user_id")
+            username = reaction.get("username")
+            if user_id is not None:
+                entry["user_ids"].append(int(user_id))
+            if username:
+                entry["users"].append(username)
+        for entry in reaction_map.values():
+            entry["user_ids"] = sorted(set(entry["user_ids"]))
+            entry["users"] = sorted(set(entry["users"]))
+        return sorted(reaction_map.values(), key=lambda item: (-item["count"], item["emoji"]))
+
+    def reaction_summary(self, message_id: int) -> Optional[List[Dict[str, Any]]]:
+        """Return the aggregated reactions of a message, or ``None`` if it is gone."""
+
+        exists = db.session.execute(
+            select(ChatMessage.id).filter(ChatMessage.id == message_id).limit(1)
+        ).scalar_one_or_none()
+        if exists is None:
+            return None
+        rows = db.session.execute(
+            select(ChatReaction.emoji, ChatReaction.user_id, User.username)
+            .outerjoin(User, User.id == ChatReaction.user_id)
+            .filter(ChatReaction.message_id == message_id)
+        ).all()
+        return self.summarize_reactions(
+            {"emoji": emoji, "user_id": user_id, "username": username} for emoji, user_id, username in rows
+        )
+
+    def _forget_serialized(self, message_id: int, *revisions: str) -> None:
+        if not self._use_redis():
+            return
+        for revision in dict.fromkeys(revisions):
+            self._redis.cache_delete(self.SERIALIZED_NAMESPACE, f"{int(message_id)}:{revision}")  # type: ignore[union-attr]
+
+    def _use_redis(self) -> bool:
+        return bool(self._redis and self._redis.available)
+
 
 __all__ = ["ChatService", "ChatAttachment", "ChatReaction", "ChatMention", "ensure_chat_schema"]
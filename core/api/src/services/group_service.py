@@ -3,7 +3,7 @@ from __future__ import annotations
 
 import logging
 import re
-from typing import Dict, Iterable, List, Optional, Sequence
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Sequence
 
 from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
@@ -12,6 +12,9 @@ from sqlalchemy.orm import joinedload
 from ..app.providers import db
 from ..models import Permission, User, UserGroup
 
+if TYPE_CHECKING:  # pragma: no cover - typing helper
+    from .permission_cache import PermissionCache
+
 LOGGER = logging.getLogger(__name__)
 
 
@@ -79,6 +82,9 @@ class GroupService:
         },
     )
 
+    def __init__(self, *, permission_cache: Optional["PermissionCache"] = None) -> None:
+        self._permission_cache = permission_cache
+
     @property
     def default_user_slug(self) -> str:
         return self.USER_SLUG
@@ -152,6 +158,7 @@ class GroupService:
         if changed:
             try:
                 db.session.commit()
+                self._permissions_changed()
             except IntegrityError:
                 db.session.rollback()
                 LOGGER.debug("Default permissions already populated by another worker.")
@@ -201,8 +208,10 @@ class GroupService:
                     user.groups.append(group)
 
         db.session.add(user)
+        user.attach_permissions(None)
         if commit:
             db.session.commit()
+            self._permissions_changed()
 
     def list_permissions(self) -> List[Permission]:
         stmt = select(Permission).order_by(Permission.name.asc())
@@ -261,6 +270,8 @@ class GroupService:
                     group.permissions.append(permission)
         db.session.add(group)
         db.session.commit()
+        if permissions is not None:
+            self._permissions_changed()
         return group
 
     def delete_group(self, group: UserGroup) -> None:
@@ -270,6 +281,11 @@ class GroupService:
             raise ValueError("group has members and cannot be deleted")
         db.session.delete(group)
         db.session.commit()
+        self._permissions_changed()
+
+    def _permissions_changed(self) -> None:
+        if self._permission_cache is not None:
+            self._permission_cache.bump()
 
     def _unique_slug(self, source: str) -> str:
         base = re.sub(r"[^a-z0-9]+", "-", source.strip().lower()).strip("-") or "group"
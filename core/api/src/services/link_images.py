@@ -0,0 +1,236 @@
+"""Background ingestion of images linked from chat message bodies."""
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Sequence, Tuple
+from urllib.parse import urlparse
+
+import requests
+from werkzeug.utils import secure_filename
+
+from ..models import ChatAttachment
+
+if TYPE_CHECKING:  # pragma: no cover - typing helper
+    from .chat_service import ChatService
+    from .redis_service import RedisService
+
+LOGGER = logging.getLogger(__name__)
+
+
+class FetchSlotsBusy(RuntimeError):
+    """Raised when every fetch slot is taken and the caller should retry later.
+
+    ``added`` holds the attachments saved before giving up; the caller still
+    has to publish them, since a retry skips them as already present.
+    """
+
+    def __init__(self, message: str, *, added: Optional[List[ChatAttachment]] = None) -> None:
+        super().__init__(message)
+        self.added: List[ChatAttachment] = list(added or [])
+
+
+class LinkImageFetcher:
+    """Download linked images and attach them to an existing chat message.
+
+    Results are cached per URL (hits as stored attachment metadata, misses
+    as a short-lived marker), so a link reposted by many viewers is fetched
+    once. Concurrent downloads are capped cluster-wide through Redis slot
+    keys, or per process when Redis is unavailable.
+    """
+
+    REDIS_NAMESPACE = "chat:link_images"
+    HIT_TTL_SECONDS = 86_400
+    MISS_TTL_SECONDS = 600
+    POLL_INTERVAL_SECONDS = 0.25
+
+    def __init__(
+        self,
+        *,
+        chat_service: "ChatService",
+        redis_service: Optional["RedisService"] = None,
+        max_bytes: int = 5 * 1024 * 1024,
+        timeout: float = 8.0,
+        concurrency: int = 4,
+    ) -> None:
+        self._chat = chat_service
+        self._redis = redis_service
+        self._max_bytes = max_bytes
+        self._timeout = timeout
+        self._concurrency = max(1, concurrency)
+        self._local_slots = threading.BoundedSemaphore(self._concurrency)
+        self._session = requests.Session()
+
+    def attach(
+        self,
+        message_id: int,
+        urls: Sequence[str],
+        slots: int,
+        *,
+        wait: float = 0.0,
+    ) -> List[ChatAttachment]:
+        """Fetch up to ``slots`` images from ``urls`` and add them to the message.
+
+        Raises :class:`FetchSlotsBusy` when no download slot frees up within
+        ``wait`` seconds; attachments gathered so far are saved and returned
+        on the exception's ``added``, and a retry skips images the message
+        already has.
+        """
+
+        attachments: List[ChatAttachment] = []
+        busy: Optional[FetchSlotsBusy] = None
+        try:
+            for url in urls:
+                if len(attachments) >= slots:
+                    break
+                try:
+                    resolved = self._resolve(url, wait=wait)
+                except FetchSlotsBusy as exc:
+                    busy = exc
+                    break
+                if resolved is not None:
+                    attachments.append(resolved)
+        finally:
+            added = self._chat.add_attachments(message_id, attachments) if attachments else []
+        if busy is not None:
+            busy.added = added
+            raise busy
+        return added
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+    def _resolve(self, url: str, *, wait: float) -> Optional[ChatAttachment]:
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        cached = self._cached(key)
+        if cached is not None:
+            return self._from_cache(cached)
+
+        if self._use_redis() and not self._redis.claim(  # type: ignore[union-attr]
+            self.REDIS_NAMESPACE, f"inflight:{key}", ttl=int(self._timeout) + 5
+        ):
+            # Another worker is fetching this URL; wait for its result.
+            deadline = time.monotonic() + self._timeout + 5
+            while time.monotonic() < deadline:
+                time.sleep(self.POLL_INTERVAL_SECONDS)
+                cached = self._cached(key)
+                if cached is not None:
+                    return self._from_cache(cached)
+            return None
+
+        try:
+            with self._slot(wait):
+                downloaded = self._download(url)
+            if downloaded is None:
+                self._remember(key, {"miss": True}, self.MISS_TTL_SECONDS)
+                return None
+            data, mime_type, original_name = downloaded
+            attachment = self._chat.store_attachment(data, mime_type, original_name=original_name)
+            self._remember(
+                key,
+                {
+                    "file_path": attachment.file_path,
+                    "mime_type": attachment.mime_type,
+                    "file_size": attachment.file_size,
+                    "original_name": attachment.original_name,
+                    "content_hash": attachment.content_hash,
+                },
+                self.HIT_TTL_SECONDS,
+            )
+            return attachment
+        finally:
+            if self._use_redis():
+                self._redis.delete(self.REDIS_NAMESPACE, f"inflight:{key}")  # type: ignore[union-attr]
+
+    def _cached(self, key: str) -> Optional[Dict[str, Any]]:
+        if not self._use_redis():
+            return None
+        return self._redis.json_get(self.REDIS_NAMESPACE, f"url:{key}")  # type: ignore[union-attr]
+
+    def _remember(self, key: str, payload: Dict[str, Any], ttl: int) -> None:
+        if self._use_redis():
+            self._redis.json_set(self.REDIS_NAMESPACE, f"url:{key}", payload, ttl=ttl)  # type: ignore[union-attr]
+
+    def _from_cache(self, cached: Dict[str, Any]) -> Optional[ChatAttachment]:
+        if cached.get("miss"):
+            return None
+        store = self._chat.attachment_store
+        file_path = cached.get("file_path")
+        if store is None or not file_path or not store.path_for(str(file_path)).exists():
+            return None
+        return self._chat.reuse_attachment(
+            file_path=str(file_path),
+            mime_type=str(cached.get("mime_type") or "application/octet-stream"),
+            file_size=int(cached.get("file_size") or 0),
+            original_name=cached.get("original_name"),
+            content_hash=str(cached.get("content_hash") or ""),
+        )
+
+    def _download(self, url: str) -> Optional[Tuple[bytes, str, Optional[str]]]:
+        try:
+            response = self._session.get(url, stream=True, timeout=self._timeout)
+        except requests.RequestException:
+            return None
+        try:
+            if response.status_code != 200:
+                return None
+            content_type = response.headers.get("Content-Type", "").split(";")[0].strip().lower()
+            if not content_type.startswith("image/"):
+                return None
+            content_length = response.headers.get("Content-Length")
+            if content_length and content_length.isdigit() and int(content_length) > self._max_bytes:
+                return None
+            chunks = []
+            total = 0
+            deadline = time.monotonic() + self._timeout
+            for chunk in response.iter_content(32 * 1024):
+                if not chunk:
+                    continue
+                total += len(chunk)
+                if total > self._max_bytes or time.monotonic() > deadline:
+                    return None
+                chunks.append(chunk)
+            if not chunks:
+                return None
+            original_name = urlparse(url).path.split("/")[-1] or None
+            return b"".join(chunks), content_type, secure_filename(original_name) if original_name else None
+        except requests.RequestException:
+            return None
+        finally:
+            response.close()
+
+    @contextmanager
+    def _slot(self, wait: float) -> Iterator[None]:
+        if not self._use_redis():
+            # Without Redis the caller is an in-process worker; queue behind the semaphore.
+            if not self._local_slots.acquire(timeout=wait if wait > 0 else None):
+                raise FetchSlotsBusy("no local fetch slot available")
+            try:
+                yield
+            finally:
+                self._local_slots.release()
+            return
+
+        ttl = int(self._timeout) + 5
+        deadline = time.monotonic() + max(wait, 0.0)
+        while True:
+            for index in range(self._concurrency):
+                slot_key = f"slot:{index}"
+                if self._redis.claim(self.REDIS_NAMESPACE, slot_key, ttl=ttl):  # type: ignore[union-attr]
+                    try:
+                        yield
+                    finally:
+                        self._redis.delete(self.REDIS_NAMESPACE, slot_key)  # type: ignore[union-attr]
+                    return
+            if time.monotonic() >= deadline:
+                raise FetchSlotsBusy("all fetch slots are busy")
+            time.sleep(self.POLL_INTERVAL_SECONDS)
+
+    def _use_redis(self) -> bool:
+        return bool(self._redis and self._redis.available)
+
+
+__all__ = ["FetchSlotsBusy", "LinkImageFetcher"]
@@ -0,0 +1,101 @@
+"""Compiled per-user permission sets guarded by a global version stamp."""
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, Dict, FrozenSet, Optional, Tuple
+
+from sqlalchemy import Select, select
+
+from ..app.providers import db
+from ..models import Permission, UserGroupMembership, UserGroupPermission
+
+if TYPE_CHECKING:  # pragma: no cover - typing helper
+    from .redis_service import RedisService
+
+
+class PermissionCache:
+    """Cache each user's effective permission names.
+
+    Entries are tagged with a version stamp shared through Redis. Any change
+    to group permissions or membership calls :meth:`bump`, which makes every
+    cached set stale in every worker at once. A hit costs one Redis GET for
+    the stamp; a miss compiles the set with a single join query instead of
+    walking ``groups`` → ``permissions`` relationships.
+    """
+
+    REDIS_NAMESPACE = "auth"
+    VERSION_KEY = "permissions:version"
+    ENTRY_TTL_SECONDS = 3600
+
+    def __init__(self, *, redis_service: Optional["RedisService"] = None) -> None:
+        self._redis = redis_service
+        self._lock = threading.Lock()
+        self._local_version = 0
+        self._entries: Dict[int, Tuple[int, FrozenSet[str]]] = {}
+
+    def version(self) -> int:
+        if self._use_redis():
+            shared = self._redis.counter_get(self.REDIS_NAMESPACE, self.VERSION_KEY)  # type: ignore[union-attr]
+            if shared is not None:
+                return shared
+        with self._lock:
+            return self._local_version
+
+    def bump(self) -> None:
+        """Invalidate every cached permission set."""
+
+        with self._lock:
+            self._local_version += 1
+            self._entries.clear()
+        if self._use_redis():
+            self._redis.counter_bump(self.REDIS_NAMESPACE, self.VERSION_KEY)  # type: ignore[union-attr]
+
+    def permissions_for(self, user_id: int) -> FrozenSet[str]:
+        version = self.version()
+        with self._lock:
+            entry = self._entries.get(user_id)
+        if entry is not None and entry[0] == version:
+            return entry[1]
+
+        names: Optional[FrozenSet[str]] = None
+        entry_key = f"permissions:{int(user_id)}"
+        if self._use_redis():
+            payload = self._redis.json_get(self.REDIS_NAMESPACE, entry_key)  # type: ignore[union-attr]
+            if isinstance(payload, dict) and payload.get("version") == version:
+                raw = payload.get("names")
+                if isinstance(raw, list):
+                    names = frozenset(str(name) for name in raw)
+        if names is None:
+            names = self._compile(user_id)
+            if self._use_redis():
+                self._redis.json_set(  # type: ignore[union-attr]
+                    self.REDIS_NAMESPACE,
+                    entry_key,
+                    {"version": version, "names": sorted(names)},
+                    ttl=self.ENTRY_TTL_SECONDS,
+                )
+        with self._lock:
+            self._entries[user_id] = (version, names)
+        return names
+
+    @classmethod
+    def _compile(cls, user_id: int) -> FrozenSet[str]:
+        return frozenset(db.session.execute(cls.query_for(user_id)).scalars())
+
+    @staticmethod
+    def query_for(user_id: int) -> Select:
+        """Return the single-query permission lookup for ``user_id``."""
+
+        return (
+            select(Permission.name)
+            .join(UserGroupPermission, UserGroupPermission.permission_id == Permission.id)
+            .join(UserGroupMembership, UserGroupMembership.group_id == UserGroupPermission.group_id)
+            .where(UserGroupMembership.user_id == user_id)
+            .distinct()
+        )
+
+    def _use_redis(self) -> bool:
+        return bool(self._redis and self._redis.available)
+
+
+__all__ = ["PermissionCache"]
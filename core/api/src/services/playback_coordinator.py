@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import logging
 import math
+import threading
 import uuid
 from dataclasses import dataclass
 from http import HTTPStatus
@@ -27,6 +28,17 @@ class PlaybackResult:
     details: Optional[Mapping[str, Any]]
 
 
+@dataclass(frozen=True)
+class StandbyPlayback:
+    """A queue item pre-rolled into a standby transcoder session."""
+
+    rating_key: str
+    part_id: Optional[str]
+    session_id: str
+    source: Mapping[str, Any]
+    details: Optional[Mapping[str, Any]]
+
+
 class PlaybackCoordinatorError(RuntimeError):
     """Raised when coordinating playback actions fails."""
 
@@ -52,6 +64,8 @@ class PlaybackCoordinator:
         self._playback_state = playback_state
         self._config = config
         self._settings_service = settings_service
+        self._standby_lock = threading.Lock()
+        self._standby: Optional[StandbyPlayback] = None
 
     def start_playback(
         self,
@@ -89,6 +103,8 @@ class PlaybackCoordinator:
 
         overrides = self._build_transcoder_overrides(rating_key, part_id, source, session=session)
 
+        # Stopping the transcoder also discards any pre-rolled standby run.
+        self._take_standby()
         self._ensure_stopped_before_start(rating_key, part_id)
 
         status_code, payload = self._attempt_start(overrides, rating_key, part_id)
@@ -107,7 +123,10 @@ class PlaybackCoordinator:
 
         details_payload = None
         try:
-            details_payload = self._plex.item_details(rating_key)
+            details_payload = self._plex.item_details(
+                rating_key,
+                profile=PlexService.DETAIL_PROFILE_PLAYBACK,
+            )
         except PlexServiceError as exc:
             LOGGER.warning("Failed to fetch detailed Plex metadata for %s: %s", rating_key, exc)
 
@@ -131,9 +150,157 @@ class PlaybackCoordinator:
             details=details_payload,
         )
 
+    @property
+    def standby(self) -> Optional[StandbyPlayback]:
+        with self._standby_lock:
+            return self._standby
+
+    def prepare_standby(
+        self,
+        rating_key: str,
+        *,
+        part_id: Optional[str] = None,
+        session: Mapping[str, Any],
+    ) -> StandbyPlayback:
+        """Resolve the next item and start encoding it into a standby session.
+
+        The transcoder keeps the current run on air and promotes the standby
+        when that run ends, so the next item starts without a cold start.
+        """
+
+        session_id = str(session.get("id") or "")
+        if not session_id:
+            raise PlaybackCoordinatorError("standby session requires an id")
+        try:
+            source = self._plex.resolve_media_source(rating_key, part_id=part_id)
+        except PlexNotConnectedError as exc:
+            raise PlaybackCoordinatorError(str(exc), status_code=HTTPStatus.BAD_REQUEST) from exc
+        except PlexServiceError as exc:
+            raise PlaybackCoordinatorError(str(exc), status_code=HTTPStatus.NOT_FOUND) from exc
+
+        overrides = self._build_transcoder_overrides(rating_key, part_id, source, session=session)
+        try:
+            status_code, payload = self._client.prepare_standby(overrides)
+        except TranscoderServiceError as exc:
+            raise PlaybackCoordinatorError(
+                "transcoder service unavailable",
+                status_code=HTTPStatus.BAD_GATEWAY,
+            ) from exc
+        if status_code not in (HTTPStatus.ACCEPTED, HTTPStatus.OK):
+            message = payload.get("error") if isinstance(payload, Mapping) else None
+            raise PlaybackCoordinatorError(
+                message or f"transcoder standby request failed ({status_code})",
+                status_code=HTTPStatus.BAD_GATEWAY,
+            )
+
+        details_payload = None
+        try:
+            details_payload = self._plex.item_details(
+                rating_key,
+                profile=PlexService.DETAIL_PROFILE_PLAYBACK,
+            )
+        except PlexServiceError as exc:
+            LOGGER.warning("Failed to fetch detailed Plex metadata for %s: %s", rating_key, exc)
+
+        standby = StandbyPlayback(
+            rating_key=rating_key,
+            part_id=part_id,
+            session_id=session_id,
+            source=source,
+            details=details_payload,
+        )
+        with self._standby_lock:
+            self._standby = standby
+        LOGGER.info(
+            "PlaybackCoordinator prepared standby (rating_key=%s session_id=%s)",
+            rating_key,
+            session_id,
+        )
+        return standby
+
+    def promote_standby(
+        self,
+        session_id: str,
+        *,
+        standby: Optional[StandbyPlayback] = None,
+        already_promoted: bool = False,
+    ) -> Optional[PlaybackResult]:
+        """Make the standby session the current playback.
+
+        ``already_promoted`` is set when the transcoder promoted the standby on
+        its own at the end of the previous run. ``standby`` describes a
+        standby another worker prepared and is used when this process holds
+        none for ``session_id``. Returns ``None`` when there is no matching
+        standby, so callers can fall back to a cold start.
+        """
+
+        with self._standby_lock:
+            local = self._standby
+            if local is not None and local.session_id == session_id:
+                standby = local
+                self._standby = None
+        if standby is None or standby.session_id != session_id:
+            return None
+
+        transcode_payload: Mapping[str, Any] = {}
+        status_code = HTTPStatus.OK
+        if not already_promoted:
+            try:
+                status_code, payload = self._client.promote_standby(session_id)
+            except TranscoderServiceError as exc:
+                LOGGER.warning("Standby promotion failed for session %s: %s", session_id, exc)
+                return None
+            if status_code != HTTPStatus.OK:
+                LOGGER.info(
+                    "Transcoder declined standby promotion (session_id=%s status=%s)",
+                    session_id,
+                    status_code,
+                )
+                return None
+            transcode_payload = payload if isinstance(payload, Mapping) else {}
+
+        self._playback_state.update(
+            rating_key=standby.rating_key,
+            source=standby.source,
+            details=standby.details,
+            session_id=session_id,
+        )
+        LOGGER.info(
+            "PlaybackCoordinator promoted standby (rating_key=%s session_id=%s)",
+            standby.rating_key,
+            session_id,
+        )
+        return PlaybackResult(
+            status_code=status_code,
+            source=standby.source,
+            transcode=transcode_payload,
+            details=standby.details,
+        )
+
+    def discard_standby(self, *, force: bool = False) -> None:
+        """Drop the pre-rolled standby run, if any.
+
+        ``force`` asks the transcoder to drop its standby even when another
+        worker prepared it.
+        """
+
+        if self._take_standby() is None and not force:
+            return
+        try:
+            self._client.discard_standby()
+        except TranscoderServiceError as exc:
+            LOGGER.warning("Failed to discard transcoder standby: %s", exc)
+
+    def _take_standby(self) -> Optional[StandbyPlayback]:
+        with self._standby_lock:
+            standby = self._standby
+            self._standby = None
+        return standby
+
     def stop_playback(self) -> Tuple[int, Optional[MutableMapping[str, Any]]]:
         """Stop the active transcoder run and clear playback state when appropriate."""
 
+        self._take_standby()
         try:
             status_code, payload = self._client.stop()
         except TranscoderServiceError as exc:
@@ -520,4 +687,5 @@ __all__ = [
     "PlaybackCoordinator",
     "PlaybackCoordinatorError",
     "PlaybackResult",
+    "StandbyPlayback",
 ]
@@ -1,15 +1,21 @@
-"""Simple in-memory store for the currently playing library item."""
+"""In-process store for the currently playing library item, mirrored to Redis."""
 from __future__ import annotations
 
 import copy
+import json
+import logging
 import threading
-from dataclasses import dataclass
+import time
+from dataclasses import dataclass, fields, replace
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING, Any, Dict, Mapping, Optional, Tuple
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Mapping, Optional, Tuple
 
 if TYPE_CHECKING:  # pragma: no cover - typing helper
     from .redis_service import RedisService
 
+LOGGER = logging.getLogger(__name__)
+
 
 def _iso_now() -> str:
     """Return the current UTC time in ISO-8601 format."""
@@ -116,7 +122,7 @@ def _sanitize_source(source: Optional[Mapping[str, Any]]) -> dict[str, Any]:
     return cleaned
 
 
-@dataclass
+@dataclass(frozen=True)
 class PlaybackSnapshot:
     """Serializable representation of the current playback item."""
 
@@ -141,27 +147,79 @@ class PlaybackSnapshot:
             "session_id": self.session_id,
         }
 
+    @classmethod
+    def from_dict(cls, payload: Mapping[str, Any]) -> Optional["PlaybackSnapshot"]:
+        started_at = payload.get("started_at")
+        if not isinstance(started_at, str):
+            return None
+        rating_key = payload.get("rating_key")
+        session_id = payload.get("session_id")
+        item = payload.get("item")
+        details = payload.get("details")
+        source = payload.get("source")
+        updated_at = payload.get("updated_at")
+        return cls(
+            rating_key=str(rating_key) if rating_key is not None else None,
+            library_section_id=_safe_int(payload.get("library_section_id")),
+            item=item if isinstance(item, dict) else {},
+            details=details if isinstance(details, dict) else {},
+            source=source if isinstance(source, dict) else {},
+            started_at=started_at,
+            updated_at=updated_at if isinstance(updated_at, str) else started_at,
+            session_id=str(session_id) if session_id is not None else None,
+        )
+
+
+_SNAPSHOT_FIELDS = frozenset(field.name for field in fields(PlaybackSnapshot))
+
 
 class PlaybackState:
-    """Thread-safe tracker for the currently playing library item."""
+    """Thread-safe tracker for the currently playing library item.
+
+    Reads are served from an immutable in-process snapshot. When Redis is
+    available every write is mirrored into a hash (only the fields that
+    changed) and announced on a pub/sub channel together with a monotonically
+    increasing version, so other API processes refresh their local copy
+    without polling. ``touch`` is write-behind: the local timestamp moves on
+    every call while Redis sees it at most every ``TOUCH_FLUSH_SECONDS``.
+    """
 
     REDIS_NAMESPACE = "playback"
-    REDIS_KEY = "snapshot"
+    REDIS_KEY = "state"
+    REDIS_VERSION_KEY = "state:version"
+    REDIS_CHANNEL = "state:changes"
+    TOUCH_FLUSH_SECONDS = 5.0
+    SYNC_MAX_BACKOFF_SECONDS = 30.0
 
     def __init__(self, *, redis_service: Optional["RedisService"] = None) -> None:
         self._lock = threading.Lock()
         self._snapshot: Optional[PlaybackSnapshot] = None
+        self._view: Optional[Mapping[str, Any]] = None
+        self._version = 0
+        self._touch_flushed_at = 0.0
         self._redis = redis_service
         self._transcoder_running = False
         self._has_seen_running = False
+        self._sync_lock = threading.Lock()
+        self._sync_thread: Optional[threading.Thread] = None
+        self._sync_loaded = threading.Event()
+        self._stop_event = threading.Event()
 
     def clear(self) -> None:
-        if self._use_redis():
-            self._redis.delete(self.REDIS_NAMESPACE, self.REDIS_KEY)  # type: ignore[union-attr]
+        self._ensure_sync()
         with self._lock:
-            self._snapshot = None
+            self._set_snapshot_locked(None)
             self._transcoder_running = False
             self._has_seen_running = False
+        if self._use_redis():
+            version = self._redis.hash_set(  # type: ignore[union-attr]
+                self.REDIS_NAMESPACE,
+                self.REDIS_KEY,
+                {},
+                replace=True,
+                version_key=self.REDIS_VERSION_KEY,
+            )
+            self._announce(version, {"cleared": True})
 
     def update(
         self,
@@ -178,6 +236,7 @@ class PlaybackState:
         rating = rating_key or item.get("rating_key")
         library_section_id = _safe_int(item.get("library_section_id")) if item else None
         started_at = _iso_now()
+        self._ensure_sync()
 
         snapshot = PlaybackSnapshot(
             rating_key=str(rating) if rating is not None else None,
@@ -190,51 +249,53 @@ class PlaybackState:
             session_id=session_id,
         )
 
-        if self._use_redis():
-            self._redis.json_set(self.REDIS_NAMESPACE, self.REDIS_KEY, snapshot.to_dict())  # type: ignore[union-attr]
-            with self._lock:
-                self._snapshot = snapshot
-                self._transcoder_running = False
-                self._has_seen_running = False
-            return
-
         with self._lock:
-            self._snapshot = snapshot
+            self._set_snapshot_locked(snapshot)
+            self._touch_flushed_at = time.monotonic()
             self._transcoder_running = False
             self._has_seen_running = False
+        if self._use_redis():
+            version = self._redis.hash_set(  # type: ignore[union-attr]
+                self.REDIS_NAMESPACE,
+                self.REDIS_KEY,
+                snapshot.to_dict(),
+                replace=True,
+                version_key=self.REDIS_VERSION_KEY,
+            )
+            self._announce(version, {})
 
     def touch(self) -> None:
         """Refresh the update timestamp without mutating content."""
 
-        if self._use_redis():
-            payload = self._redis.json_get(self.REDIS_NAMESPACE, self.REDIS_KEY)  # type: ignore[union-attr]
-            if not isinstance(payload, dict):
-                return
-            payload["updated_at"] = _iso_now()
-            self._redis.json_set(self.REDIS_NAMESPACE, self.REDIS_KEY, payload)  # type: ignore[union-attr]
-            with self._lock:
-                if self._snapshot is not None:
-                    self._snapshot.updated_at = payload["updated_at"]
-            return
-
+        self._ensure_sync()
+        now = time.monotonic()
         with self._lock:
             if self._snapshot is None:
                 return
-            self._snapshot.updated_at = _iso_now()
-
-    def snapshot(self) -> Optional[dict[str, Any]]:
-        """Return a serializable copy of the current playback item."""
-
-        if self._use_redis():
-            payload = self._redis.json_get(self.REDIS_NAMESPACE, self.REDIS_KEY)  # type: ignore[union-attr]
-            if isinstance(payload, dict):
-                return copy.deepcopy(payload)
+            updated_at = _iso_now()
+            self._set_snapshot_locked(replace(self._snapshot, updated_at=updated_at))
+            flush = now - self._touch_flushed_at >= self.TOUCH_FLUSH_SECONDS
+            if flush:
+                self._touch_flushed_at = now
+        if flush and self._use_redis():
+            version = self._redis.hash_set(  # type: ignore[union-attr]
+                self.REDIS_NAMESPACE,
+                self.REDIS_KEY,
+                {"updated_at": updated_at},
+                version_key=self.REDIS_VERSION_KEY,
+            )
+            self._announce(version, {"fields": ["updated_at"]})
+
+    def snapshot(self) -> Optional[Mapping[str, Any]]:
+        """Return a shared, read-only view of the current playback item.
+
+        The view is rebuilt only when the snapshot changes; callers must copy
+        nested values before modifying them.
+        """
 
+        self._ensure_sync()
         with self._lock:
-            if self._snapshot is None:
-                return None
-            data = self._snapshot.to_dict()
-        return copy.deepcopy(data)
+            return self._view
 
     def is_running(self) -> bool:
         """Return whether the transcoder is currently reported as running."""
@@ -259,8 +320,123 @@ class PlaybackState:
                 self._transcoder_running = False
             return previous, self._has_seen_running
 
+    def close(self) -> None:
+        """Stop the background Redis listener, if any."""
+
+        self._stop_event.set()
+
+    # ------------------------------------------------------------------
+    # Redis synchronisation
+    # ------------------------------------------------------------------
+    def _set_snapshot_locked(self, snapshot: Optional[PlaybackSnapshot]) -> None:
+        self._snapshot = snapshot
+        self._view = MappingProxyType(snapshot.to_dict()) if snapshot is not None else None
+
+    def _announce(self, version: Optional[int], message: Dict[str, Any]) -> None:
+        if version is None:
+            return
+        with self._lock:
+            expected = self._version + 1
+            self._version = max(self._version, version)
+        if version != expected:
+            # Another process wrote in between; pick up the combined result.
+            self._reload(version)
+        self._redis.publish(  # type: ignore[union-attr]
+            self.REDIS_NAMESPACE,
+            self.REDIS_CHANNEL,
+            {"version": version, **message},
+        )
+
+    def _ensure_sync(self) -> None:
+        if self._sync_thread is not None or not self._use_redis():
+            return
+        with self._sync_lock:
+            if self._sync_thread is not None:
+                return
+            thread = threading.Thread(target=self._listen, name="playback-state-sync", daemon=True)
+            self._sync_thread = thread
+            thread.start()
+        # Serve the first read from Redis rather than an empty local copy.
+        self._sync_loaded.wait(timeout=1.0)
+
+    def _listen(self) -> None:
+        backoff = 1.0
+        while not self._stop_event.is_set():
+            pubsub = None
+            try:
+                pubsub = self._redis.subscribe(self.REDIS_NAMESPACE, self.REDIS_CHANNEL)  # type: ignore[union-attr]
+                if pubsub is not None:
+                    # Anything published before the subscription is picked up here.
+                    self._reload(None)
+                    self._sync_loaded.set()
+                    backoff = 1.0
+                    for message in pubsub.listen():
+                        if self._stop_event.is_set():
+                            break
+                        self._apply_notification(message.get("data"))
+            except Exception:  # pragma: no cover - network dependent
+                LOGGER.debug("Playback state listener disconnected", exc_info=True)
+            finally:
+                self._sync_loaded.set()
+                if pubsub is not None:
+                    try:
+                        pubsub.close()
+                    except Exception:  # pragma: no cover - defensive
+                        pass
+            if self._stop_event.wait(backoff):
+                break
+            backoff = min(backoff * 2, self.SYNC_MAX_BACKOFF_SECONDS)
+
+    def _apply_notification(self, raw: Any) -> None:
+        if isinstance(raw, bytes):
+            raw = raw.decode("utf-8", "replace")
+        try:
+            message = json.loads(raw)
+            version = int(message["version"])
+        except (TypeError, ValueError, KeyError):
+            return
+        with self._lock:
+            if version <= self._version:
+                return
+            contiguous = version == self._version + 1 and self._snapshot is not None
+        if message.get("cleared"):
+            with self._lock:
+                if version > self._version:
+                    self._version = version
+                    self._set_snapshot_locked(None)
+            return
+        changed = message.get("fields")
+        if contiguous and isinstance(changed, list) and changed:
+            self._refresh_fields(version, changed)
+        else:
+            self._reload(version)
+
+    def _refresh_fields(self, version: int, names: Iterable[Any]) -> None:
+        requested = [name for name in names if name in _SNAPSHOT_FIELDS]
+        payload = self._redis.hash_get(self.REDIS_NAMESPACE, self.REDIS_KEY, requested)  # type: ignore[union-attr]
+        if not payload:
+            self._reload(version)
+            return
+        with self._lock:
+            if version <= self._version or self._snapshot is None:
+                return
+            merged = self._snapshot.to_dict()
+            merged.update(payload)
+            self._version = version
+            self._set_snapshot_locked(PlaybackSnapshot.from_dict(merged))
+
+    def _reload(self, version: Optional[int]) -> None:
+        payload = self._redis.hash_get(self.REDIS_NAMESPACE, self.REDIS_KEY)  # type: ignore[union-attr]
+        snapshot = PlaybackSnapshot.from_dict(payload) if payload else None
+        with self._lock:
+            if version is not None:
+                if version < self._version:
+                    return
+                self._version = version
+            self._set_snapshot_locked(snapshot)
+
     def _use_redis(self) -> bool:
         return bool(self._redis and self._redis.available)
 
 
-__all__ = ["PlaybackState"]
+__all__ = ["PlaybackSnapshot", "PlaybackState"]
@@ -1,6 +1,7 @@
 """Helpers to integrate with Plex using direct HTTP calls."""
 from __future__ import annotations
 
+import base64
 import hashlib
 import ipaddress
 import json
@@ -32,6 +33,7 @@ from urllib.parse import parse_qsl, urlencode, urljoin, urlparse
 
 import requests
 from flask import current_app
+from requests.adapters import HTTPAdapter
 from urllib3.exceptions import InsecureRequestWarning
 
 from PIL import Image
@@ -78,6 +80,8 @@ class PlexClient:
         *,
         timeout: int,
         verify: bool = True,
+        pool_connections: int = 1,
+        pool_maxsize: int = 10,
     ) -> None:
         self._base_url = base_url.rstrip("/")
         self._token = token
@@ -85,6 +89,12 @@ class PlexClient:
         self._session = requests.Session()
         self._session.headers.update(headers)
         self._session.verify = verify
+        adapter = HTTPAdapter(
+            pool_connections=max(1, int(pool_connections)),
+            pool_maxsize=max(1, int(pool_maxsize)),
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
 
     @property
     def base_url(self) -> str:
@@ -102,6 +112,12 @@ class PlexClient:
     def headers(self) -> Dict[str, str]:
         return dict(self._session.headers)
 
+    def close(self) -> None:
+        try:
+            self._session.close()
+        except Exception:  # pragma: no cover - defensive
+            pass
+
     def _build_url(self, path: str) -> str:
         if path.startswith("http://") or path.startswith("https://"):
             return path
@@ -199,12 +215,29 @@ class PlexService:
     IMAGE_VARIANT_GRID: str = "grid"
     GRID_THUMBNAIL_MAX_SIZE: Tuple[int, int] = (240, 360)
     GRID_THUMBNAIL_QUALITY: int = 70
+    PLACEHOLDER_MAX_SIZE: Tuple[int, int] = (16, 16)
+    PLACEHOLDER_QUALITY: int = 40
     SECTION_CACHE_NAMESPACE: str = "plex.sections"
     SECTION_ITEMS_CACHE_NAMESPACE: str = "plex.section_items"
     SECTION_SNAPSHOTS_CACHE_NAMESPACE: str = "plex.section_snapshots"
     HOME_SNAPSHOT_CACHE_NAMESPACE: str = "plex.home_snapshot"
     METADATA_CACHE_NAMESPACE: str = "plex.metadata"
-    CLIENT_CACHE_TTL_SECONDS: int = 30
+    METADATA_BATCH_SIZE: int = 50
+    METADATA_BATCH_WORKERS: int = 4
+    IMAGE_PLACEHOLDER_CACHE_NAMESPACE: str = "plex.image_placeholders"
+    SERVER_IDENTITY_CACHE_NAMESPACE: str = "plex.server_identity"
+    SERVER_IDENTITY_TTL_SECONDS: int = 300
+    DEFAULT_HTTP_POOL_SIZE: int = 32
+    PREFETCH_CLAIM_NAMESPACE: str = "plex.prefetch_claims"
+    PREFETCH_BUDGET_NAMESPACE: str = "plex.prefetch_budget"
+    PREFETCH_CLAIM_TTL_SECONDS: int = 300
+    PREFETCH_BUDGET_WINDOW_SECONDS: int = 60
+    DEFAULT_PREFETCH_BUDGET: int = 30
+    PREFETCH_GRID_PARAMS: Dict[str, str] = {
+        "width": "360",
+        "height": "540",
+        "upscale": "1",
+    }
     LIBRARY_QUERY_FLAGS: Dict[str, Any] = {
         "checkFiles": 0,
         "includeAllConcerts": 0,
@@ -232,7 +265,7 @@ class PlexService:
         "includeChapters": 1,
         "includeChildren": 1,
         "includeConcerts": 1,
-        "includeExtras": 1,
+        "includeExtras": 0,
         "includeFields": 1,
         "includeGeolocation": 1,
         "includeLoudnessRamps": 1,
@@ -240,11 +273,29 @@ class PlexService:
         "includeOnDeck": 0,
         "includePopularLeaves": 0,
         "includePreferences": 1,
-        "includeRelated": 1,
-        "includeRelatedCount": 1,
-        "includeReviews": 1,
+        "includeRelated": 0,
+        "includeRelatedCount": 0,
+        "includeReviews": 0,
         "includeStations": 0,
     }
+    PLAYBACK_QUERY_FLAGS: Dict[str, Any] = {
+        **LIBRARY_QUERY_FLAGS,
+        "includeChapters": 1,
+        "includeMarkers": 1,
+    }
+    DETAIL_PROFILE_MINIMAL: str = "minimal"
+    DETAIL_PROFILE_PLAYBACK: str = "playback"
+    DETAIL_PROFILE_FULL: str = "full"
+    DETAIL_PROFILES: Tuple[str, ...] = (
+        DETAIL_PROFILE_MINIMAL,
+        DETAIL_PROFILE_PLAYBACK,
+        DETAIL_PROFILE_FULL,
+    )
+    DETAIL_SECTION_FLAGS: Dict[str, str] = {
+        "related": "includeRelated",
+        "reviews": "includeReviews",
+        "extras": "includeExtras",
+    }
     ACCOUNT_RESOURCE_URL = "https://plex.tv/api/v2/user"
 
     def __init__(
@@ -261,6 +312,8 @@ class PlexService:
         allow_account_lookup: bool = False,
         request_timeout: Optional[int] = None,
         image_cache_dir: Optional[str] = None,
+        http_pool_size: Optional[int] = None,
+        prefetch_budget: Optional[int] = None,
     ) -> None:
         self._settings = settings_service
         self._redis = redis_service
@@ -276,8 +329,23 @@ class PlexService:
         except (TypeError, ValueError):
             timeout_value = 10
         self._request_timeout = max(1, timeout_value)
-        self._client_local: threading.local = threading.local()
-        self._client_cache_ttl = max(1, int(self.CLIENT_CACHE_TTL_SECONDS))
+        try:
+            pool_size = int(http_pool_size) if http_pool_size is not None else self.DEFAULT_HTTP_POOL_SIZE
+        except (TypeError, ValueError):
+            pool_size = self.DEFAULT_HTTP_POOL_SIZE
+        self._http_pool_size = max(1, pool_size)
+        try:
+            budget = int(prefetch_budget) if prefetch_budget is not None else self.DEFAULT_PREFETCH_BUDGET
+        except (TypeError, ValueError):
+            budget = self.DEFAULT_PREFETCH_BUDGET
+        self._prefetch_budget = max(0, budget)
+        # Clients are shared across threads: ``requests.Session`` delegates to a
+        # thread-safe urllib3 pool, so keep-alive sockets are reused by every
+        # request thread instead of being re-established per thread.
+        self._client_pool_lock = threading.Lock()
+        self._client_pool: Dict[Tuple[str, str, bool], PlexClient] = {}
+        self._server_identities: Dict[Tuple[str, str, bool], Dict[str, Any]] = {}
+        self._server_identity_ttl = max(1, int(self.SERVER_IDENTITY_TTL_SECONDS))
         self._image_cache_dir: Optional[Path] = None
         if image_cache_dir:
             try:
@@ -321,8 +389,7 @@ class PlexService:
         if not self._redis or not self._redis.available:
             return None
         try:
-            base_url = self._get_server_base_url()
-            token = self._get_token()
+            base_url, token, _verify_ssl = self._connection_settings()
         except PlexNotConnectedError:
             return None
         material = f"{base_url.strip().lower()}|{token}"
@@ -362,12 +429,49 @@ class PlexService:
     def _sections_cache_key(self, scope: str) -> str:
         return self._build_cache_key(scope, "sections_snapshot")
 
+    def _section_items_cache_key(
+        self,
+        scope: str,
+        section_id: Any,
+        *,
+        offset: int,
+        limit: int,
+        sort: Optional[str],
+        letter: Optional[str],
+        search: Optional[str],
+        watch_state: Optional[str],
+        genre: Optional[str],
+        collection: Optional[str],
+        year: Optional[str],
+    ) -> str:
+        signature = {
+            "section_id": str(section_id),
+            "offset": offset,
+            "limit": limit,
+            "sort": sort or "",
+            "letter": letter or "",
+            "search": search or "",
+            "watch_state": watch_state or "",
+            "genre": genre or "",
+            "collection": collection or "",
+            "year": year or "",
+        }
+        return self._build_cache_key(scope, signature)
+
     def _home_snapshot_cache_key(self, scope: str) -> str:
         return self._build_cache_key(scope, "home_snapshot")
 
     def _library_settings_signature(self, settings: Dict[str, Any]) -> str:
         return self._build_cache_key("library_settings", settings)
 
+    def _metadata_profile_cache_key(self, scope: str, rating_key: str, profile: str) -> str:
+        if profile == self.DETAIL_PROFILE_FULL:
+            return self._build_cache_key(scope, rating_key)
+        return self._build_cache_key(scope, rating_key, profile)
+
+    def _metadata_section_cache_key(self, scope: str, rating_key: str, section: str) -> str:
+        return self._build_cache_key(scope, rating_key, "section", section)
+
     def _invalidate_all_caches(self) -> None:
         self._invalidate_cached_client()
         if not self._redis or not self._redis.available:
@@ -378,56 +482,106 @@ class PlexService:
             self.HOME_SNAPSHOT_CACHE_NAMESPACE,
             self.METADATA_CACHE_NAMESPACE,
             self.SECTION_SNAPSHOTS_CACHE_NAMESPACE,
+            self.IMAGE_PLACEHOLDER_CACHE_NAMESPACE,
         ):
             self._redis.clear_namespace(namespace)
 
-    def _get_cached_client(
+    def _get_pooled_client(
         self,
         *,
         base_url: str,
         token: str,
         verify_ssl: bool,
-    ) -> Optional[Tuple[PlexClient, Dict[str, Any]]]:
-        state = getattr(self._client_local, "client_state", None)
-        if not isinstance(state, dict):
-            return None
-        if (
-            state.get("base_url") != base_url
-            or state.get("token") != token
-            or state.get("verify_ssl") is not verify_ssl
-        ):
-            return None
-        expires_at = state.get("expires_at")
-        if isinstance(expires_at, (int, float)) and time.monotonic() > expires_at:
+    ) -> PlexClient:
+        """Return the shared client for the active credentials, creating it once."""
+
+        pool_key = (base_url, token, verify_ssl)
+        stale: List[PlexClient] = []
+        with self._client_pool_lock:
+            client = self._client_pool.get(pool_key)
+            if client is None:
+                client, _actual_verify = self._build_client(base_url, token, verify_ssl)
+                for key in list(self._client_pool):
+                    stale.append(self._client_pool.pop(key))
+                    self._server_identities.pop(key, None)
+                self._client_pool[pool_key] = client
+        for previous in stale:
+            previous.close()
+        return client
+
+    def _server_identity_cache_key(self, base_url: str, token: str, verify_ssl: bool) -> str:
+        return self._build_cache_key(base_url.strip().lower(), token, verify_ssl, "identity")
+
+    def _get_cached_server_identity(
+        self,
+        *,
+        base_url: str,
+        token: str,
+        verify_ssl: bool,
+    ) -> Optional[Dict[str, Any]]:
+        pool_key = (base_url, token, verify_ssl)
+        with self._client_pool_lock:
+            state = self._server_identities.get(pool_key)
+        if isinstance(state, dict):
+            expires_at = state.get("expires_at")
+            if isinstance(expires_at, (int, float)) and time.monotonic() <= expires_at:
+                return state.get("snapshot")
+
+        if not self._redis or not self._redis.available:
             return None
-        client = state.get("client")
-        snapshot = state.get("snapshot")
-        if client is None or snapshot is None:
+        cached = self._redis.json_get(
+            self.SERVER_IDENTITY_CACHE_NAMESPACE,
+            self._server_identity_cache_key(base_url, token, verify_ssl),
+        )
+        snapshot = cached.get("snapshot") if isinstance(cached, dict) else None
+        if not isinstance(snapshot, dict):
             return None
-        return client, snapshot
+        self._store_server_identity(
+            snapshot=snapshot,
+            base_url=base_url,
+            token=token,
+            verify_ssl=verify_ssl,
+            publish=False,
+        )
+        return snapshot
 
-    def _store_cached_client(
+    def _store_server_identity(
         self,
         *,
-        client: PlexClient,
         snapshot: Dict[str, Any],
         base_url: str,
         token: str,
         verify_ssl: bool,
+        publish: bool = True,
     ) -> None:
-        state = {
-            "client": client,
-            "snapshot": snapshot,
-            "base_url": base_url,
-            "token": token,
-            "verify_ssl": verify_ssl,
-            "expires_at": time.monotonic() + self._client_cache_ttl,
-        }
-        self._client_local.client_state = state
+        pool_key = (base_url, token, verify_ssl)
+        with self._client_pool_lock:
+            self._server_identities[pool_key] = {
+                "snapshot": snapshot,
+                "expires_at": time.monotonic() + self._server_identity_ttl,
+            }
+        if publish and self._redis and self._redis.available:
+            self._redis.json_set(
+                self.SERVER_IDENTITY_CACHE_NAMESPACE,
+                self._server_identity_cache_key(base_url, token, verify_ssl),
+                {"snapshot": snapshot},
+                ttl=self._server_identity_ttl,
+            )
 
     def _invalidate_cached_client(self) -> None:
-        if hasattr(self._client_local, "client_state"):
-            self._client_local.client_state = {}
+        with self._client_pool_lock:
+            clients = list(self._client_pool.values())
+            identity_keys = list(self._server_identities)
+            self._client_pool.clear()
+            self._server_identities.clear()
+        for client in clients:
+            client.close()
+        if self._redis and self._redis.available:
+            for base_url, token, verify_ssl in identity_keys:
+                self._redis.delete(
+                    self.SERVER_IDENTITY_CACHE_NAMESPACE,
+                    self._server_identity_cache_key(base_url, token, verify_ssl),
+                )
 
     @staticmethod
     def _apply_hidden_flags(
@@ -1711,19 +1865,19 @@ class PlexService:
 
         cache_key: Optional[str] = None
         if scope:
-            signature = {
-                "section_id": str(section_id),
-                "offset": offset,
-                "limit": limit,
-                "sort": sort or "",
-                "letter": normalized_letter or "",
-                "search": title_query or "",
-                "watch_state": watch_state or "",
-                "genre": genre or "",
-                "collection": collection or "",
-                "year": year or "",
-            }
-            cache_key = self._build_cache_key(scope, signature)
+            cache_key = self._section_items_cache_key(
+                scope,
+                section_id,
+                offset=offset,
+                limit=limit,
+                sort=sort,
+                letter=normalized_letter,
+                search=title_query,
+                watch_state=watch_state,
+                genre=genre,
+                collection=collection,
+                year=year,
+            )
             if not force_refresh:
                 cached = self._cache_get(self.SECTION_ITEMS_CACHE_NAMESPACE, cache_key)
                 if cached:
@@ -1818,6 +1972,7 @@ class PlexService:
             self._serialize_item_overview(item, include_tags=False)
             for item in self._extract_items(container)
         ]
+        self._attach_image_placeholders(items, scope=scope)
 
         total_results = self._safe_int(self._value(container, "totalSize"))
         if total_results is None:
@@ -1875,6 +2030,152 @@ class PlexService:
         )
         return payload
 
+    def claim_section_prefetch(
+        self,
+        section_id: Any,
+        page: Mapping[str, Any],
+        *,
+        user_id: Any = None,
+        sort: Optional[str] = None,
+        letter: Optional[str] = None,
+        search: Optional[str] = None,
+        watch_state: Optional[str] = None,
+        genre: Optional[str] = None,
+        collection: Optional[str] = None,
+        year: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Reserve a warm-up of the page following ``page`` for background work.
+
+        Returns the ``section_items`` arguments for the next page, or ``None``
+        when there is no next page, it was already claimed, or the caller has
+        spent their prefetch budget for the current window.
+        """
+
+        if self._prefetch_budget <= 0 or not self._redis:
+            return None
+        scope = self._cache_scope()
+        if not scope or not isinstance(page, Mapping) or page.get("cache_required"):
+            return None
+
+        pagination = page.get("pagination") or {}
+        offset = self._safe_int(pagination.get("offset"))
+        limit = self._safe_int(pagination.get("limit"))
+        size = self._safe_int(pagination.get("size"))
+        total = self._safe_int(pagination.get("total"))
+        if offset is None or not limit or not size:
+            return None
+        next_offset = offset + size
+        if total is not None and next_offset >= total:
+            return None
+
+        normalized_letter = self._normalize_letter(letter)
+        title_query = search.strip() if isinstance(search, str) else None
+        cache_key = self._section_items_cache_key(
+            scope,
+            section_id,
+            offset=next_offset,
+            limit=limit,
+            sort=sort,
+            letter=normalized_letter,
+            search=title_query,
+            watch_state=watch_state,
+            genre=genre,
+            collection=collection,
+            year=year,
+        )
+        if not self._redis.claim(
+            self.PREFETCH_CLAIM_NAMESPACE,
+            cache_key,
+            ttl=self.PREFETCH_CLAIM_TTL_SECONDS,
+        ):
+            return None
+
+        budget_key = f"{scope}:{user_id if user_id is not None else 'anonymous'}"
+        spent = self._redis.increment(
+            self.PREFETCH_BUDGET_NAMESPACE,
+            budget_key,
+            window=self.PREFETCH_BUDGET_WINDOW_SECONDS,
+        )
+        if spent is None or spent > self._prefetch_budget:
+            self._redis.delete(self.PREFETCH_CLAIM_NAMESPACE, cache_key)
+            logger.debug(
+                "Skipping section prefetch (section=%s, offset=%s, user=%s): budget exhausted",
+                section_id,
+                next_offset,
+                user_id,
+            )
+            return None
+
+        return {
+            "section_id": section_id,
+            "sort": sort,
+            "letter": letter,
+            "search": search,
+            "watch_state": watch_state,
+            "genre": genre,
+            "collection": collection,
+            "year": year,
+            "offset": next_offset,
+            "limit": limit,
+        }
+
+    def prefetch_section_page(
+        self,
+        section_id: Any,
+        *,
+        sort: Optional[str] = None,
+        letter: Optional[str] = None,
+        search: Optional[str] = None,
+        watch_state: Optional[str] = None,
+        genre: Optional[str] = None,
+        collection: Optional[str] = None,
+        year: Optional[str] = None,
+        offset: int = 0,
+        limit: int = 60,
+    ) -> Dict[str, Any]:
+        """Warm the section items cache for one page and its grid posters."""
+
+        payload = self.section_items(
+            section_id,
+            sort=sort,
+            letter=letter,
+            search=search,
+            watch_state=watch_state,
+            genre=genre,
+            collection=collection,
+            year=year,
+            offset=offset,
+            limit=limit,
+        )
+        items = payload.get("items") or []
+        posters = 0
+        errors = 0
+        if self._image_cache_dir:
+            for item in items:
+                thumb = item.get("thumb") if isinstance(item, Mapping) else None
+                if not isinstance(thumb, str) or not thumb:
+                    continue
+                try:
+                    stats = self._precache_image(
+                        thumb,
+                        params=self.PREFETCH_GRID_PARAMS,
+                        ensure_grid=True,
+                    )
+                except PlexServiceError as exc:
+                    errors += 1
+                    logger.debug("Failed to prefetch Plex poster %s: %s", thumb, exc)
+                    continue
+                if stats.get("fetched") or stats.get("grid_created"):
+                    posters += 1
+
+        return {
+            "section_id": str(section_id),
+            "offset": offset,
+            "items": len(items),
+            "posters": posters,
+            "errors": errors,
+        }
+
     def cache_section_images(
         self,
         section_id: Any,
@@ -2038,6 +2339,8 @@ class PlexService:
             ):
                 break
 
+        placeholder_summary = self.apply_section_snapshot_placeholders(section_id)
+
         summary = {
             "section_id": str(section_id),
             "processed_items": processed_items,
@@ -2046,6 +2349,7 @@ class PlexService:
             "downloads": downloads,
             "skipped": skips,
             "grid_generated": grids_created,
+            "placeholders": placeholder_summary.get("placeholders", 0),
             "page_size": chunk_size,
             "max_items": max_items_value,
             "errors": errors,
@@ -2359,19 +2663,40 @@ class PlexService:
             },
         }
 
-    def item_details(self, rating_key: Any, *, force_refresh: bool = False) -> Dict[str, Any]:
-        """Return detailed metadata (including children) for a Plex item."""
+    def item_details(
+        self,
+        rating_key: Any,
+        *,
+        profile: str = DETAIL_PROFILE_FULL,
+        force_refresh: bool = False,
+    ) -> Dict[str, Any]:
+        """Return metadata for a Plex item at the requested detail profile.
+
+        ``minimal`` matches :meth:`item_details_many`, ``playback`` adds
+        chapters and markers, and ``full`` adds children, preferences and the
+        remaining stream detail. Related hubs, reviews and extras are loaded
+        separately through :meth:`item_detail_section`.
+        """
+
+        if profile not in self.DETAIL_PROFILES:
+            raise ValueError(f"Unsupported detail profile: {profile}")
+        if profile == self.DETAIL_PROFILE_MINIMAL:
+            summary = self.item_details_many([rating_key], force_refresh=force_refresh).get(str(rating_key))
+            if not summary:
+                raise PlexServiceError("Plex library item not found.")
+            return summary
 
         scope = self._cache_scope()
         cache_key: Optional[str] = None
         if scope:
-            cache_key = self._build_cache_key(scope, str(rating_key))
+            cache_key = self._metadata_profile_cache_key(scope, str(rating_key), profile)
             if not force_refresh:
                 cached = self._cache_get(self.METADATA_CACHE_NAMESPACE, cache_key)
                 if cached:
                     logger.info(
-                        "Serving cached Plex item details (rating_key=%s, scope=%s)",
+                        "Serving cached Plex item details (rating_key=%s, profile=%s, scope=%s)",
                         rating_key,
+                        profile,
                         scope[:8],
                     )
                     return cached
@@ -2379,14 +2704,17 @@ class PlexService:
         client, snapshot = self._connect_client()
         server_name = snapshot.get("name") or snapshot.get("machine_identifier") or "unknown"
         logger.info(
-            "Fetching Plex item details (rating_key=%s, server=%s)",
+            "Fetching Plex item details (rating_key=%s, profile=%s, server=%s)",
             rating_key,
+            profile,
             server_name,
         )
 
         path = f"/library/metadata/{rating_key}"
-        params = dict(self.METADATA_QUERY_FLAGS)
-        params["includeChildren"] = 1
+        if profile == self.DETAIL_PROFILE_PLAYBACK:
+            params = dict(self.PLAYBACK_QUERY_FLAGS)
+        else:
+            params = dict(self.METADATA_QUERY_FLAGS)
 
         try:
             container = client.get_container(path, params=params)
@@ -2401,32 +2729,172 @@ class PlexService:
             raise PlexServiceError("Plex library item not found.")
 
         item = items[0]
-        overview = self._serialize_item_overview(item, include_tags=True)
-        item_type = overview.get("type")
-        response = {
-            "server": snapshot,
-            "item": overview,
-            "media": self._serialize_media(item),
-            "children": self._child_overviews(client, rating_key, item_type),
-            "related": self._related_hubs(container),
-            "images": self._serialize_images(item),
-            "extras": self._serialize_extras(item),
-            "chapters": self._serialize_chapters(item),
-            "markers": self._serialize_markers(item),
-            "reviews": self._serialize_reviews(item),
-            "preferences": self._serialize_preferences(item),
-            "ratings": self._serialize_ratings(item),
-            "guids": self._serialize_guids(item),
-        }
-        colors = self._serialize_ultra_blur(item)
-        if colors:
-            response["ultra_blur"] = colors
+        response = self._serialize_item_summary(item, snapshot)
+        response["chapters"] = self._serialize_chapters(item)
+        response["markers"] = self._serialize_markers(item)
+        if profile == self.DETAIL_PROFILE_FULL:
+            item_type = response["item"].get("type")
+            response["children"] = self._child_overviews(client, rating_key, item_type)
+            response["preferences"] = self._serialize_preferences(item)
+
+        if cache_key:
+            self._cache_set(self.METADATA_CACHE_NAMESPACE, cache_key, response)
+
+        return response
+
+    def item_detail_section(
+        self,
+        rating_key: Any,
+        section: str,
+        *,
+        force_refresh: bool = False,
+    ) -> Dict[str, Any]:
+        """Return one lazily loaded detail section (related, reviews or extras)."""
+
+        flag = self.DETAIL_SECTION_FLAGS.get(section)
+        if flag is None:
+            raise ValueError(f"Unsupported detail section: {section}")
+
+        scope = self._cache_scope()
+        cache_key: Optional[str] = None
+        if scope:
+            cache_key = self._metadata_section_cache_key(scope, str(rating_key), section)
+            if not force_refresh:
+                cached = self._cache_get(self.METADATA_CACHE_NAMESPACE, cache_key)
+                if cached:
+                    return cached
+
+        client, _snapshot = self._connect_client()
+        params = dict(self.LIBRARY_QUERY_FLAGS)
+        params[flag] = 1
+        try:
+            container = client.get_container(f"/library/metadata/{rating_key}", params=params)
+        except PlexServiceError:
+            raise
+        except Exception as exc:  # pragma: no cover - depends on Plex availability
+            logger.exception("Failed to load Plex %s for %s: %s", section, rating_key, exc)
+            raise PlexServiceError("Plex library item not found.") from exc
+
+        items = self._extract_items(container)
+        if not items:
+            raise PlexServiceError("Plex library item not found.")
+
+        item = items[0]
+        if section == "related":
+            entries = self._related_hubs(container)
+        elif section == "reviews":
+            entries = self._serialize_reviews(item)
+        else:
+            entries = self._serialize_extras(item)
+        response = {"rating_key": str(rating_key), section: entries}
 
         if cache_key:
             self._cache_set(self.METADATA_CACHE_NAMESPACE, cache_key, response)
 
         return response
 
+    def item_details_many(
+        self,
+        rating_keys: Iterable[Any],
+        *,
+        force_refresh: bool = False,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Return summary metadata for several Plex items keyed by rating key.
+
+        Misses are fetched through Plex's comma-separated metadata endpoint
+        with every include flag disabled, so a batch costs one request per
+        ``METADATA_BATCH_SIZE`` keys, with up to ``METADATA_BATCH_WORKERS``
+        batches in flight at once. Summaries carry the item overview, media,
+        images, ratings and guids; cached playback or full details satisfy a
+        lookup too.
+        """
+
+        keys = [str(key).strip() for key in rating_keys if key is not None]
+        keys = list(dict.fromkeys(key for key in keys if key))
+        if not keys:
+            return {}
+
+        results: Dict[str, Dict[str, Any]] = {}
+        scope = self._cache_scope()
+        summary_keys: Dict[str, str] = {}
+        if scope:
+            summary_keys = {
+                key: self._metadata_profile_cache_key(scope, key, self.DETAIL_PROFILE_MINIMAL)
+                for key in keys
+            }
+            if not force_refresh and self._redis is not None:
+                cached = self._redis.cache_get_many(
+                    self.METADATA_CACHE_NAMESPACE,
+                    summary_keys.values(),
+                )
+                for key, cache_key in summary_keys.items():
+                    if cache_key in cached:
+                        results[key] = cached[cache_key]
+                pending = [key for key in keys if key not in results]
+                if pending:
+                    richer_keys = {
+                        (key, profile): self._metadata_profile_cache_key(scope, key, profile)
+                        for key in pending
+                        for profile in (self.DETAIL_PROFILE_PLAYBACK, self.DETAIL_PROFILE_FULL)
+                    }
+                    cached = self._redis.cache_get_many(
+                        self.METADATA_CACHE_NAMESPACE,
+                        richer_keys.values(),
+                    )
+                    for (key, _profile), cache_key in richer_keys.items():
+                        if key not in results and cache_key in cached:
+                            results[key] = cached[cache_key]
+
+        missing = [key for key in keys if key not in results]
+        if not missing:
+            logger.info(
+                "Serving cached Plex item summaries (count=%d, scope=%s)",
+                len(keys),
+                (scope or "")[:8],
+            )
+            return results
+
+        client, snapshot = self._connect_client()
+        server_name = snapshot.get("name") or snapshot.get("machine_identifier") or "unknown"
+        batch_size = max(1, int(self.METADATA_BATCH_SIZE))
+        batches = [missing[start:start + batch_size] for start in range(0, len(missing), batch_size)]
+
+        def fetch_batch(batch: List[str]) -> Any:
+            logger.info(
+                "Fetching Plex item summaries (count=%d, server=%s)",
+                len(batch),
+                server_name,
+            )
+            path = f"/library/metadata/{','.join(batch)}"
+            try:
+                return client.get_container(path, params=dict(self.LIBRARY_QUERY_FLAGS))
+            except PlexServiceError:
+                raise
+            except Exception as exc:  # pragma: no cover - depends on Plex availability
+                logger.exception("Failed to load Plex items %s: %s", ",".join(batch), exc)
+                raise PlexServiceError("Plex library items could not be loaded.") from exc
+
+        if len(batches) == 1:
+            containers = [(batches[0], fetch_batch(batches[0]))]
+        else:
+            workers = min(len(batches), max(1, int(self.METADATA_BATCH_WORKERS)))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="plex-metadata") as executor:
+                futures = {executor.submit(fetch_batch, batch): batch for batch in batches}
+                containers = [(futures[future], future.result()) for future in as_completed(futures)]
+
+        for batch, container in containers:
+            for item in self._extract_items(container):
+                rating_key = self._value(item, "ratingKey")
+                if rating_key is None or str(rating_key) not in batch:
+                    continue
+                summary = self._serialize_item_summary(item, snapshot)
+                results[str(rating_key)] = summary
+                cache_key = summary_keys.get(str(rating_key))
+                if cache_key:
+                    self._cache_set(self.METADATA_CACHE_NAMESPACE, cache_key, summary)
+
+        return results
+
     def refresh_sections(self) -> Dict[str, Any]:
         """Force-refresh the cached section listing."""
 
@@ -2467,6 +2935,18 @@ class PlexService:
     def refresh_item_details(self, rating_key: Any) -> Dict[str, Any]:
         """Refresh the cached payload for a specific Plex item."""
 
+        scope = self._cache_scope()
+        if scope:
+            for profile in self.DETAIL_PROFILES:
+                self._cache_delete(
+                    self.METADATA_CACHE_NAMESPACE,
+                    self._metadata_profile_cache_key(scope, str(rating_key), profile),
+                )
+            for section in self.DETAIL_SECTION_FLAGS:
+                self._cache_delete(
+                    self.METADATA_CACHE_NAMESPACE,
+                    self._metadata_section_cache_key(scope, str(rating_key), section),
+                )
         return self.item_details(rating_key, force_refresh=True)
 
     def resolve_media_source(self, rating_key: Any, *, part_id: Optional[Any] = None) -> Dict[str, Any]:
@@ -2475,8 +2955,7 @@ class PlexService:
         client, _snapshot = self._connect_client()
 
         path = f"/library/metadata/{rating_key}"
-        params = dict(self.METADATA_QUERY_FLAGS)
-        params["includeChildren"] = 0
+        params = dict(self.LIBRARY_QUERY_FLAGS)
 
         try:
             container = client.get_container(path, params=params)
@@ -3159,6 +3638,14 @@ class PlexService:
             except (TypeError, ValueError):
                 status_code_value = None
 
+        placeholder_created = False
+        if should_cache_grid:
+            placeholder_created = self._ensure_image_placeholder(
+                normalized,
+                cache_paths,
+                force=force,
+            )
+
         grid_created = False
         if should_cache_grid and grid_paths is not None:
             grid_exists = grid_paths.data_path.exists() and grid_paths.metadata_path.exists()
@@ -3191,8 +3678,115 @@ class PlexService:
             "fetched": fetched,
             "skipped": not fetched,
             "grid_created": grid_created,
+            "placeholder_created": placeholder_created,
         }
 
+    @staticmethod
+    def _normalize_image_path(path: str) -> str:
+        trimmed = path.strip()
+        return trimmed if trimmed.startswith(("http://", "https://", "/")) else f"/{trimmed}"
+
+    def _image_placeholder_key(self, scope: str, normalized_path: str) -> str:
+        base, _, _query = normalized_path.partition("?")
+        return self._build_cache_key(scope, "placeholder", base)
+
+    def _generate_placeholder_payload(self, source_path: Path) -> Optional[str]:
+        try:
+            with Image.open(source_path) as image:
+                image.load()
+                if image.mode != "RGB":
+                    image = image.convert("RGB")
+                resample_space = getattr(Image, "Resampling", Image)
+                resample_filter = getattr(resample_space, "BILINEAR", getattr(Image, "BILINEAR", Image.BICUBIC))
+                image.thumbnail(self.PLACEHOLDER_MAX_SIZE, resample=resample_filter)
+                buffer = BytesIO()
+                image.save(buffer, format="JPEG", quality=self.PLACEHOLDER_QUALITY, optimize=True)
+        except Exception as exc:  # pragma: no cover - best effort logging only
+            logger.warning("Failed to generate Plex image placeholder (%s): %s", source_path, exc)
+            return None
+        encoded = base64.b64encode(buffer.getvalue()).decode("ascii")
+        return f"data:image/jpeg;base64,{encoded}"
+
+    def _ensure_image_placeholder(
+        self,
+        normalized_path: str,
+        source_paths: Optional[_ImageCachePaths],
+        *,
+        force: bool = False,
+    ) -> bool:
+        """Store a tiny inline preview of a cached poster for instant grid paints."""
+
+        scope = self._cache_scope()
+        if not scope or source_paths is None or not source_paths.data_path.exists():
+            return False
+        key = self._image_placeholder_key(scope, normalized_path)
+        if not force and self._cache_get(self.IMAGE_PLACEHOLDER_CACHE_NAMESPACE, key):
+            return False
+        placeholder = self._generate_placeholder_payload(source_paths.data_path)
+        if not placeholder:
+            return False
+        self._cache_set(
+            self.IMAGE_PLACEHOLDER_CACHE_NAMESPACE,
+            key,
+            {"path": normalized_path, "placeholder": placeholder},
+        )
+        return True
+
+    def _attach_image_placeholders(
+        self,
+        items: Iterable[Dict[str, Any]],
+        *,
+        scope: Optional[str] = None,
+    ) -> int:
+        """Embed cached poster placeholders into serialized items, returning the hit count."""
+
+        scope = scope or self._cache_scope()
+        if not scope or not self._redis or not self._redis.available:
+            return 0
+        keyed_items: List[Tuple[str, Dict[str, Any]]] = []
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            thumb = item.get("thumb")
+            if not thumb or not isinstance(thumb, str):
+                continue
+            normalized = self._normalize_image_path(thumb)
+            keyed_items.append((self._image_placeholder_key(scope, normalized), item))
+        if not keyed_items:
+            return 0
+        cached = self._redis.cache_get_many(
+            self.IMAGE_PLACEHOLDER_CACHE_NAMESPACE,
+            (key for key, _item in keyed_items),
+        )
+        attached = 0
+        for key, item in keyed_items:
+            entry = cached.get(key)
+            placeholder = entry.get("placeholder") if isinstance(entry, dict) else None
+            if placeholder:
+                item["thumb_placeholder"] = placeholder
+                attached += 1
+        return attached
+
+    def apply_section_snapshot_placeholders(self, section_id: Any) -> Dict[str, Any]:
+        """Fold cached poster placeholders into the stored section snapshot items."""
+
+        scope = self._cache_scope()
+        snapshot = self._get_section_snapshot(scope, section_id)
+        items = snapshot.get("items") if isinstance(snapshot, dict) else None
+        if not scope or not isinstance(items, list):
+            return {"section_id": str(section_id), "items": 0, "placeholders": 0}
+        attached = self._attach_image_placeholders(items, scope=scope)
+        if attached:
+            key = self._snapshot_key(scope, section_id)
+            self._cache_set(self.SECTION_SNAPSHOTS_CACHE_NAMESPACE, key, snapshot)
+        logger.info(
+            "Applied poster placeholders to section snapshot (section=%s, items=%s, placeholders=%s)",
+            section_id,
+            len(items),
+            attached,
+        )
+        return {"section_id": str(section_id), "items": len(items), "placeholders": attached}
+
     def _filter_image_headers(self, headers: Any) -> Dict[str, str]:
         filtered: Dict[str, str] = {}
         for header in self.IMAGE_HEADER_WHITELIST:
@@ -3248,13 +3842,6 @@ class PlexService:
         for key, value in values.items():
             self._settings.set_system_setting(SettingsService.PLEX_NAMESPACE, key, value)
 
-    def _get_token(self) -> str:
-        settings = self._settings.get_system_settings(SettingsService.PLEX_NAMESPACE)
-        token = settings.get("auth_token")
-        if not token:
-            raise PlexNotConnectedError("Plex account is not connected.")
-        return str(token)
-
     def _create_client(self, *, base_url: str, token: str, verify_ssl: bool) -> PlexClient:
         headers = self._build_headers()
         return PlexClient(
@@ -3263,6 +3850,7 @@ class PlexService:
             headers,
             timeout=self._request_timeout,
             verify=verify_ssl,
+            pool_maxsize=self._http_pool_size,
         )
 
     def _build_client(self, base_url: str, token: str, verify_ssl: bool) -> Tuple[PlexClient, bool]:
@@ -3299,24 +3887,46 @@ class PlexService:
             return None
         return self._serialize_account(data)
 
+    def _connection_settings(self) -> Tuple[str, str, bool]:
+        settings = self._settings.get_system_settings(SettingsService.PLEX_NAMESPACE)
+        base_url = settings.get("server_base_url") or self._server_base_url
+        if not base_url:
+            raise PlexNotConnectedError("Plex server host is not configured.")
+        token = settings.get("auth_token")
+        if not token:
+            raise PlexNotConnectedError("Plex account is not connected.")
+        verify = settings.get("verify_ssl")
+        verify_ssl = verify if isinstance(verify, bool) else True
+        return self._normalize_server_url(base_url), str(token), verify_ssl
+
     def _connect_client(self, *, force_refresh: bool = False) -> Tuple[PlexClient, Dict[str, Any]]:
-        base_url = self._get_server_base_url()
-        token = self._get_token()
-        verify_ssl = self._get_verify_ssl()
+        base_url, token, verify_ssl = self._connection_settings()
 
-        if not force_refresh:
-            cached = self._get_cached_client(base_url=base_url, token=token, verify_ssl=verify_ssl)
-            if cached:
-                return cached
+        if force_refresh:
+            self._invalidate_cached_client()
+
+        try:
+            client = self._get_pooled_client(base_url=base_url, token=token, verify_ssl=verify_ssl)
+        except Exception as exc:  # pragma: no cover - defensive
+            logger.exception("Failed to prepare Plex client using stored configuration: %s", exc)
+            raise PlexServiceError("Unable to connect to the stored Plex server.") from exc
+
+        cached_snapshot = self._get_cached_server_identity(
+            base_url=base_url,
+            token=token,
+            verify_ssl=verify_ssl,
+        )
+        if cached_snapshot is not None:
+            return client, cached_snapshot
 
         try:
-            client, actual_verify = self._build_client(base_url, token, verify_ssl)
             identity = client.get_container("/identity")
         except Exception as exc:  # pragma: no cover - depends on Plex availability
             logger.exception("Failed to connect to Plex server using stored configuration: %s", exc)
             self._invalidate_cached_client()
             raise PlexServiceError("Unable to connect to the stored Plex server.") from exc
 
+        actual_verify = client.verify
         snapshot = self._build_snapshot(identity, base_url=base_url, verify_ssl=actual_verify)
         updates: Dict[str, Any] = {
             "server": snapshot,
@@ -3332,29 +3942,14 @@ class PlexService:
                 updates["account"] = account_info
 
         self._update_settings(updates)
-        self._store_cached_client(
-            client=client,
+        self._store_server_identity(
             snapshot=snapshot,
             base_url=base_url,
             token=token,
-            verify_ssl=actual_verify,
+            verify_ssl=verify_ssl,
         )
         return client, snapshot
 
-    def _get_server_base_url(self) -> str:
-        settings = self._settings.get_system_settings(SettingsService.PLEX_NAMESPACE)
-        base_url = settings.get("server_base_url") or self._server_base_url
-        if not base_url:
-            raise PlexNotConnectedError("Plex server host is not configured.")
-        return self._normalize_server_url(base_url)
-
-    def _get_verify_ssl(self) -> bool:
-        settings = self._settings.get_system_settings(SettingsService.PLEX_NAMESPACE)
-        verify = settings.get("verify_ssl")
-        if isinstance(verify, bool):
-            return verify
-        return True
-
     def _normalize_server_url(self, raw: str) -> str:
         candidate = str(raw or "").strip()
         if not candidate:
@@ -3720,6 +4315,20 @@ class PlexService:
 
         return data
 
+    def _serialize_item_summary(self, item: Any, snapshot: Mapping[str, Any]) -> Dict[str, Any]:
+        summary = {
+            "server": snapshot,
+            "item": self._serialize_item_overview(item, include_tags=True),
+            "media": self._serialize_media(item),
+            "images": self._serialize_images(item),
+            "ratings": self._serialize_ratings(item),
+            "guids": self._serialize_guids(item),
+        }
+        colors = self._serialize_ultra_blur(item)
+        if colors:
+            summary["ultra_blur"] = colors
+        return summary
+
     def _tag_list(self, tags: Any) -> List[Dict[str, Any]]:
         items: List[Dict[str, Any]] = []
         for tag in self._ensure_list(tags):
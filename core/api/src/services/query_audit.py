@@ -0,0 +1,225 @@
+"""Index maintenance and EXPLAIN-based audits of the API's hot queries."""
+from __future__ import annotations
+
+import logging
+import re
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional, Sequence
+
+from sqlalchemy import Select, inspect, select
+from sqlalchemy.engine import Engine
+
+from ..app.providers import db
+from ..models import ChatReaction, QueueItem, SystemSetting, UserSetting
+from .chat_service import ChatService
+from .permission_cache import PermissionCache
+from .queue_service import QueueService
+
+LOGGER = logging.getLogger(__name__)
+
+# Indexes a composite index replaced, keyed by the replacement's name.
+_SUPERSEDED_INDEXES = {
+    "ix_queue_items_position_id": ("ix_queue_items_position",),
+}
+
+_LIMIT = re.compile(r"\bLIMIT\b", re.IGNORECASE)
+_WHERE = re.compile(r"\bWHERE\b", re.IGNORECASE)
+
+
+def ensure_indexes() -> List[str]:
+    """Create indexes declared on the models that an existing database lacks.
+
+    ``create_all`` only creates indexes together with new tables, so
+    composite indexes added later would otherwise never reach deployed
+    databases. Indexes a composite one supersedes are dropped once it exists.
+    """
+
+    engine = db.get_engine()
+    inspector = inspect(engine)
+    existing_tables = set(inspector.get_table_names())
+    created: List[str] = []
+    for table in db.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+        present = {index.get("name") for index in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if not index.name:
+                continue
+            if index.name not in present:
+                index.create(bind=engine)
+                present.add(index.name)
+                created.append(index.name)
+                LOGGER.info("Created index %s on %s", index.name, table.name)
+            for stale in _SUPERSEDED_INDEXES.get(index.name, ()):
+                if stale in present:
+                    _drop_index(engine, table.name, stale)
+                    present.discard(stale)
+    return created
+
+
+def _drop_index(engine: Engine, table_name: str, index_name: str) -> None:
+    statement = f"DROP INDEX {index_name}"
+    if engine.dialect.name in {"mysql", "mariadb"}:
+        statement += f" ON {table_name}"
+    with engine.begin() as conn:
+        conn.exec_driver_sql(statement)
+    LOGGER.info("Dropped index %s on %s; superseded by a composite index", index_name, table_name)
+
+
+@dataclass(frozen=True)
+class AuditedQuery:
+    """A named query the API issues on a hot path, with representative parameters."""
+
+    name: str
+    build: Callable[[], Select]
+
+
+@dataclass
+class QueryPlan:
+    name: str
+    sql: str
+    plan: List[str] = field(default_factory=list)
+    full_scans: List[str] = field(default_factory=list)
+    sorts: List[str] = field(default_factory=list)
+
+    @property
+    def flagged(self) -> bool:
+        return bool(self.full_scans)
+
+
+def _queue_neighbour() -> Select:
+    return (
+        select(QueueItem)
+        .filter(
+            (QueueItem.position > 1024)
+            | ((QueueItem.position == 1024) & (QueueItem.id > 1))
+        )
+        .order_by(QueueItem.position.asc(), QueueItem.id.asc())
+        .limit(1)
+    )
+
+
+AUDITED_QUERIES: Sequence[AuditedQuery] = (
+    AuditedQuery("queue.list", lambda: QueueService._base_query()),
+    AuditedQuery("queue.next", lambda: QueueService._base_query().limit(1)),
+    AuditedQuery("queue.neighbour", _queue_neighbour),
+    AuditedQuery("queue.position_bounds", lambda: QueueService._bounds_query()),
+    AuditedQuery("chat.page_latest", lambda: ChatService.page_query()),
+    AuditedQuery("chat.page_before", lambda: ChatService.page_query(before_id=1000)),
+    AuditedQuery("chat.page_after", lambda: ChatService.page_query(after_id=1000)),
+    AuditedQuery(
+        "chat.reaction_lookup",
+        lambda: select(ChatReaction).filter_by(message_id=1, user_id=1, emoji="+1").limit(1),
+    ),
+    AuditedQuery(
+        "settings.system_namespace",
+        lambda: select(SystemSetting).filter(SystemSetting.namespace == "chat"),
+    ),
+    AuditedQuery(
+        "settings.system_key",
+        lambda: select(SystemSetting).filter_by(namespace="chat", key="enabled").limit(1),
+    ),
+    AuditedQuery(
+        "settings.user_namespace",
+        lambda: select(UserSetting)
+        .filter(UserSetting.user_id == 1)
+        .filter(UserSetting.namespace == "chat"),
+    ),
+    AuditedQuery(
+        "settings.user_key",
+        lambda: select(UserSetting).filter_by(user_id=1, namespace="chat", key="enabled").limit(1),
+    ),
+    AuditedQuery("auth.permissions", lambda: PermissionCache.query_for(1)),
+)
+
+
+def explain(engine: Engine, query: AuditedQuery) -> QueryPlan:
+    """Run the dialect's EXPLAIN for ``query`` and flag full scans and sorts."""
+
+    stmt = query.build()
+    sql = str(stmt.compile(dialect=engine.dialect, compile_kwargs={"literal_binds": True}))
+    result = QueryPlan(name=query.name, sql=sql)
+    dialect = engine.dialect.name
+    with engine.connect() as conn:
+        if dialect == "sqlite":
+            scans: List[str] = []
+            for row in conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}"):
+                detail = str(row[-1])
+                result.plan.append(detail)
+                upper = detail.upper()
+                if upper.startswith("SCAN ") and "USING" not in upper and "CONSTANT ROW" not in upper:
+                    scans.append(detail)
+                if "TEMP B-TREE" in upper:
+                    result.sorts.append(detail)
+            # An unfiltered, unsorted scan under LIMIT walks the rowid order and
+            # stops early (e.g. the newest chat page); it is not a full scan.
+            bounded = bool(_LIMIT.search(sql)) and not _WHERE.search(sql) and not result.sorts
+            if not bounded:
+                result.full_scans.extend(scans)
+        elif dialect == "postgresql":
+            transaction = conn.begin()
+            try:
+                # Tiny tables make a sequential scan the cheapest plan; disabling
+                # it shows whether an index could serve the query at all.
+                conn.exec_driver_sql("SET LOCAL enable_seqscan = off")
+                for row in conn.exec_driver_sql(f"EXPLAIN {sql}"):
+                    line = str(row[0])
+                    result.plan.append(line)
+                    if "Seq Scan" in line:
+                        result.full_scans.append(line.strip())
+                    if line.strip().removeprefix("->").strip().startswith(("Sort", "Incremental Sort")):
+                        result.sorts.append(line.strip())
+            finally:
+                transaction.rollback()
+        else:
+            for row in conn.exec_driver_sql(f"EXPLAIN {sql}").mappings():
+                line = ", ".join(f"{key}={value}" for key, value in row.items())
+                result.plan.append(line)
+                if str(row.get("type", "")).upper() == "ALL":
+                    result.full_scans.append(line)
+                if "filesort" in str(row.get("Extra", "")).lower():
+                    result.sorts.append(line)
+    return result
+
+
+def audit_queries(
+    engine: Optional[Engine] = None,
+    queries: Sequence[AuditedQuery] = AUDITED_QUERIES,
+) -> List[QueryPlan]:
+    """EXPLAIN every registered query against ``engine`` (the app database by default)."""
+
+    engine = engine or db.get_engine()
+    plans: List[QueryPlan] = []
+    for query in queries:
+        try:
+            plans.append(explain(engine, query))
+        except Exception as exc:  # pragma: no cover - depends on the database
+            LOGGER.warning("EXPLAIN failed for %s: %s", query.name, exc)
+            plans.append(QueryPlan(name=query.name, sql="", plan=[f"error: {exc}"]))
+    return plans
+
+
+def format_report(plans: Sequence[QueryPlan]) -> str:
+    lines: List[str] = []
+    for plan in plans:
+        status = "FULL SCAN" if plan.flagged else ("sort" if plan.sorts else "ok")
+        lines.append(f"[{status}] {plan.name}")
+        lines.extend(f"    {detail}" for detail in plan.plan)
+    flagged = [plan.name for plan in plans if plan.flagged]
+    lines.append("")
+    lines.append(
+        f"{len(flagged)} of {len(plans)} queries use full scans"
+        + (f": {', '.join(flagged)}" if flagged else "")
+    )
+    return "\n".join(lines)
+
+
+__all__ = [
+    "AUDITED_QUERIES",
+    "AuditedQuery",
+    "QueryPlan",
+    "audit_queries",
+    "ensure_indexes",
+    "explain",
+    "format_report",
+]
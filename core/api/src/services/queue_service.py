@@ -8,12 +8,12 @@ from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
 from typing import TYPE_CHECKING, Any, Iterable, List, Mapping, MutableMapping, Optional, Tuple
 
-from sqlalchemy import Select, select
+from sqlalchemy import Select, func, select
 from sqlalchemy.orm import joinedload
 
 from ..app.providers import db
 from ..models import QueueItem, User
-from .playback_coordinator import PlaybackCoordinator, PlaybackCoordinatorError, PlaybackResult
+from .playback_coordinator import PlaybackCoordinator, PlaybackCoordinatorError, PlaybackResult, StandbyPlayback
 from .playback_state import PlaybackState
 from .plex_service import PlexService, PlexServiceError
 
@@ -75,6 +75,13 @@ class QueueService:
     """Central coordinator for queue persistence and orchestration."""
 
     PENDING_SESSION_TIMEOUT_SECONDS = 60
+    # Positions are sparse so inserts and moves only write the affected row.
+    # The queue is renumbered when two neighbours leave no room between them.
+    POSITION_GAP = 1024
+    POSITION_LIMIT = 2**31 - 1
+    BULK_ENQUEUE_LIMIT = 500
+    # Start encoding the next item into a standby session this close to the end.
+    PREROLL_SECONDS = 20
 
     def __init__(
         self,
@@ -94,6 +101,8 @@ class QueueService:
         self._active_session_id: Optional[str] = None
         self._pending_session_id: Optional[str] = None
         self._pending_started_at: Optional[str] = None
+        # Pre-roll record used when Redis is unavailable; see _load_preroll().
+        self._preroll: Optional[dict[str, Any]] = None
 
     # ------------------------------------------------------------------
     # Public API
@@ -137,9 +146,15 @@ class QueueService:
         playback_snapshot = self._playback_state.snapshot()
         items = self._ordered_items()
         schedule = self._build_schedule(playback_snapshot, items)
+        backfill = self._backfill_details(items)
         serialized_items = [
-            self._serialize_item(item, schedule.get(item.id))
-            for item in items
+            self._serialize_item(
+                item,
+                schedule.get(item.id),
+                backfill.get(item.rating_key),
+                position=index,
+            )
+            for index, item in enumerate(items, start=1)
         ]
         state_payload = self.auto_advance_state()
         return {
@@ -222,10 +237,7 @@ class QueueService:
         item_payload = self._build_item_payload(details)
 
         with self._acquire_lock():
-            items = self._ordered_items_locked()
-            position = self._determine_insert_position(mode, index, len(items))
-            if position <= len(items):
-                self._bump_positions_locked(position)
+            position = self._determine_insert_positions(mode, index, 1)[0]
             queue_item = QueueItem(
                 rating_key=rating_key,
                 part_id=part_id,
@@ -240,8 +252,6 @@ class QueueService:
                 requested_by_id=requested_by.id if requested_by else None,
             )
             db.session.add(queue_item)
-            db.session.flush()
-            self._resequence_locked()
             db.session.commit()
             db.session.refresh(queue_item)
 
@@ -254,35 +264,108 @@ class QueueService:
         snapshot = self._playback_state.snapshot()
         ordered_items = self._ordered_items()
         schedule_map = self._build_schedule(snapshot, ordered_items)
-        for item in ordered_items:
+        for ordinal, item in enumerate(ordered_items, start=1):
             if item.id == queue_item.id:
-                return self._serialize_item(item, schedule_map.get(item.id))
+                return self._serialize_item(item, schedule_map.get(item.id), position=ordinal)
         return self._serialize_item(queue_item)
 
+    def enqueue_many(
+        self,
+        entries: Iterable[Mapping[str, Any]],
+        *,
+        mode: str = "last",
+        index: Optional[int] = None,
+        requested_by: Optional[User] = None,
+    ) -> Tuple[List[Mapping[str, Any]], List[str]]:
+        """Insert several items in order under a single lock and commit.
+
+        ``entries`` are mappings with ``rating_key`` and optional ``part_id``.
+        Metadata is resolved in one batched Plex lookup before the lock is
+        taken. Returns the serialized items and the rating keys that could
+        not be resolved.
+        """
+
+        requested: List[Tuple[str, Optional[str]]] = []
+        for entry in entries:
+            rating_key = str(entry.get("rating_key") or "").strip()
+            if not rating_key:
+                raise QueueError("rating_key is required for every item", status_code=400)
+            part_id = entry.get("part_id")
+            requested.append((rating_key, str(part_id) if part_id else None))
+        if not requested:
+            raise QueueError("No items to enqueue", status_code=400)
+        if len(requested) > self.BULK_ENQUEUE_LIMIT:
+            raise QueueError(
+                f"Cannot enqueue more than {self.BULK_ENQUEUE_LIMIT} items at once",
+                status_code=400,
+            )
+
+        details_map = self._fetch_details_many(rating_key for rating_key, _part in requested)
+        resolved = [
+            (rating_key, part_id, details_map[rating_key])
+            for rating_key, part_id in requested
+            if isinstance(details_map.get(rating_key), Mapping)
+        ]
+        skipped = [rating_key for rating_key, _part in requested if rating_key not in details_map]
+        if not resolved:
+            raise QueueError("Failed to load item details", status_code=502)
+
+        with self._acquire_lock():
+            positions = self._determine_insert_positions(mode, index, len(resolved))
+            queue_items: List[QueueItem] = []
+            for (rating_key, part_id, details), position in zip(resolved, positions):
+                item_payload = self._build_item_payload(details)
+                queue_items.append(
+                    QueueItem(
+                        rating_key=rating_key,
+                        part_id=part_id,
+                        library_section_id=item_payload.get("library_section_id"),
+                        duration_ms=_coerce_duration_ms(details),
+                        title=item_payload.get("title"),
+                        grandparent_title=item_payload.get("grandparent_title"),
+                        thumb=item_payload.get("thumb"),
+                        art=item_payload.get("art"),
+                        data=item_payload,
+                        position=position,
+                        requested_by_id=requested_by.id if requested_by else None,
+                    )
+                )
+            db.session.add_all(queue_items)
+            db.session.commit()
+            inserted_ids = {queue_item.id for queue_item in queue_items}
+
+        LOGGER.info(
+            "Enqueued %s item(s) (mode=%s, skipped=%s)",
+            len(inserted_ids),
+            mode,
+            len(skipped),
+        )
+        if skipped:
+            LOGGER.warning("Skipped unresolved queue items: %s", ",".join(skipped))
+        snapshot = self._playback_state.snapshot()
+        ordered_items = self._ordered_items()
+        schedule_map = self._build_schedule(snapshot, ordered_items)
+        serialized = [
+            self._serialize_item(item, schedule_map.get(item.id), position=ordinal)
+            for ordinal, item in enumerate(ordered_items, start=1)
+            if item.id in inserted_ids
+        ]
+        return serialized, skipped
+
     def move_item(self, item_id: int, direction: str) -> bool:
+        if direction not in {"up", "down"}:
+            raise QueueError("Unsupported move direction", status_code=400)
         with self._acquire_lock():
-            items = self._ordered_items_locked()
-            if not items:
+            current_item = self._get_item_locked(item_id)
+            if not current_item:
                 return False
-            index_map = {item.id: idx for idx, item in enumerate(items)}
-            if item_id not in index_map:
+            target_item = self._neighbour_locked(current_item, before=direction == "up")
+            if not target_item:
                 return False
-            idx = index_map[item_id]
-            if direction == "up":
-                if idx == 0:
-                    return False
-                target_idx = idx - 1
-            elif direction == "down":
-                if idx >= len(items) - 1:
-                    return False
-                target_idx = idx + 1
-            else:
-                raise QueueError("Unsupported move direction", status_code=400)
-
-            current_item = items[idx]
-            target_item = items[target_idx]
+            if current_item.position == target_item.position:
+                # Legacy rows can share a position; spread them out first.
+                self._rebalance_locked()
             current_item.position, target_item.position = target_item.position, current_item.position
-            self._resequence_locked()
             db.session.commit()
             LOGGER.debug(
                 "Moved queue item id=%s direction=%s (new position=%s)",
@@ -298,7 +381,6 @@ class QueueService:
             if not item:
                 return False
             db.session.delete(item)
-            self._resequence_locked()
             db.session.commit()
             LOGGER.info("Removed queue item id=%s", item_id)
             return True
@@ -371,6 +453,10 @@ class QueueService:
                     "Queue auto-advance confirmed active playback (session=%s)",
                     next_session,
                 )
+                adopted = self._adopt_standby(session_hint)
+                if adopted is not None:
+                    return adopted
+                self._maybe_preroll(status_payload, next_session)
             return None
 
         if pending_session_id:
@@ -412,6 +498,9 @@ class QueueService:
         empty_queue = False
         serialized: Optional[Mapping[str, Any]] = None
         with self._acquire_lock():
+            preroll = self._load_preroll()
+            if preroll is not None:
+                self._store_preroll(None)
             next_item = self._next_item_locked()
             if not next_item:
                 self._set_auto_advance_state(
@@ -423,9 +512,8 @@ class QueueService:
                 )
                 empty_queue = True
             else:
-                serialized = self._serialize_item(next_item)
+                serialized = self._serialize_item(next_item, position=1)
                 db.session.delete(next_item)
-                self._resequence_locked()
                 db.session.commit()
 
         if empty_queue:
@@ -446,27 +534,28 @@ class QueueService:
             pending_session,
         )
 
-        session_id = uuid.uuid4().hex
-        retain_sessions: list[str] = []
-        if previous_session:
-            retain_sessions.append(previous_session)
-        segment_prefix = f"sessions/{session_id}"
-        session_payload = {
-            "id": session_id,
-            "segment_prefix": segment_prefix,
-        }
-        if retain_sessions:
-            session_payload["retain"] = retain_sessions
-        LOGGER.info(
-            "Queue session %s prepared (retain=%s)",
-            session_id,
-            ",".join(retain_sessions) if retain_sessions else "none",
-        )
+        standby_result: Optional[PlaybackResult] = None
+        standby_session = preroll.get("session_id") if preroll is not None else None
+        if standby_session and preroll.get("item_id") == serialized["id"]:
+            standby_result = self._coordinator.promote_standby(
+                standby_session,
+                standby=self._standby_from(preroll),
+            )
+        if standby_result is not None:
+            session_id = standby_session
+            LOGGER.info("Queue session %s promoted from standby", session_id)
+        else:
+            session_id = uuid.uuid4().hex
+            LOGGER.info(
+                "Queue session %s prepared (retain=%s)",
+                session_id,
+                previous_session or "none",
+            )
         try:
-            result = self._coordinator.start_playback(
+            result = standby_result or self._coordinator.start_playback(
                 serialized["rating_key"],
                 part_id=serialized.get("part_id"),
-                session=session_payload,
+                session=self._session_payload(session_id, previous_session),
             )
         except PlaybackCoordinatorError as exc:
             LOGGER.error(
@@ -529,6 +618,164 @@ class QueueService:
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
+    @staticmethod
+    def _session_payload(session_id: str, previous_session: Optional[str]) -> dict[str, Any]:
+        session_payload: dict[str, Any] = {
+            "id": session_id,
+            "segment_prefix": f"sessions/{session_id}",
+        }
+        if previous_session:
+            session_payload["retain"] = [previous_session]
+        return session_payload
+
+    def _remaining_seconds(self, status_payload: Optional[Mapping[str, Any]]) -> Optional[float]:
+        snapshot = self._playback_state.snapshot()
+        if not isinstance(snapshot, Mapping):
+            return None
+        duration_ms = _coerce_duration_ms(snapshot.get("details"))
+        if duration_ms is None:
+            duration_ms = _coerce_duration_ms(snapshot.get("source"))
+        if not duration_ms:
+            return None
+        elapsed: Optional[float] = None
+        session = status_payload.get("session") if isinstance(status_payload, Mapping) else None
+        telemetry = session.get("telemetry") if isinstance(session, Mapping) else None
+        if isinstance(telemetry, Mapping):
+            out_time = telemetry.get("out_time_seconds")
+            if isinstance(out_time, (int, float)):
+                elapsed = float(out_time)
+        if elapsed is None:
+            started = _parse_iso_datetime(snapshot.get("started_at"))
+            if started is None:
+                return None
+            elapsed = (_utc_now() - started).total_seconds()
+        return duration_ms / 1000 - elapsed
+
+    def _maybe_preroll(
+        self,
+        status_payload: Optional[Mapping[str, Any]],
+        active_session: Optional[str],
+    ) -> None:
+        """Pre-roll the next queue item into a standby session near the end of the current one.
+
+        The pre-roll record lives in the shared auto-advance state and is
+        checked under the queue lock, so only one worker prepares a standby
+        and any worker can adopt it.
+        """
+
+        with self._acquire_lock():
+            next_item = self._next_item_locked()
+            preroll = self._load_preroll()
+            if preroll is not None:
+                if next_item is not None and preroll.get("item_id") == next_item.id:
+                    return
+                # The queue changed after the pre-roll; the standby is for the wrong item.
+                self._store_preroll(None)
+                if preroll.get("session_id"):
+                    LOGGER.info("Discarding standby session %s; queue head changed", preroll["session_id"])
+                    self._coordinator.discard_standby(force=True)
+            if next_item is None:
+                return
+            remaining = self._remaining_seconds(status_payload)
+            if remaining is None or remaining > self.PREROLL_SECONDS:
+                return
+
+            session_id = uuid.uuid4().hex
+            LOGGER.info(
+                "Pre-rolling queue item id=%s rating_key=%s into standby session %s (remaining=%.1fs)",
+                next_item.id,
+                next_item.rating_key,
+                session_id,
+                remaining,
+            )
+            # A record without a session marks a failed pre-roll that is not retried for that item.
+            record: dict[str, Any] = {"item_id": next_item.id, "session_id": None}
+            try:
+                standby = self._coordinator.prepare_standby(
+                    next_item.rating_key,
+                    part_id=next_item.part_id,
+                    session=self._session_payload(session_id, active_session),
+                )
+            except PlaybackCoordinatorError as exc:
+                LOGGER.warning("Unable to pre-roll queue item id=%s: %s", next_item.id, exc)
+                self._store_preroll(record)
+                return
+            record.update(
+                session_id=session_id,
+                rating_key=standby.rating_key,
+                part_id=standby.part_id,
+                source=dict(standby.source),
+                details=dict(standby.details) if standby.details is not None else None,
+            )
+            self._store_preroll(record)
+
+    def _adopt_standby(self, session_id: Optional[str]) -> Optional[PlaybackResult]:
+        """Record a standby run the transcoder promoted at the end of the previous item."""
+
+        if not session_id:
+            return None
+        with self._acquire_lock():
+            preroll = self._load_preroll()
+            if preroll is None or preroll.get("session_id") != session_id:
+                return None
+            self._store_preroll(None)
+            result = self._coordinator.promote_standby(
+                session_id,
+                standby=self._standby_from(preroll),
+                already_promoted=True,
+            )
+            if result is None:
+                return None
+            item = self._get_item_locked(preroll["item_id"])
+            if item is not None:
+                db.session.delete(item)
+                db.session.commit()
+        LOGGER.info("Queue adopted standby session %s for item id=%s", session_id, preroll["item_id"])
+        return result
+
+    def _load_preroll(self) -> Optional[dict[str, Any]]:
+        if self._redis and self._redis.available:
+            try:
+                payload = self._redis.json_get("queue", "auto_advance_preroll")
+            except Exception:  # pragma: no cover - defensive
+                LOGGER.debug("Failed to load pre-roll state from redis", exc_info=True)
+                return None
+            if isinstance(payload, Mapping) and isinstance(payload.get("item_id"), int):
+                return dict(payload)
+            return None
+        with self._lock:
+            return dict(self._preroll) if self._preroll is not None else None
+
+    def _store_preroll(self, record: Optional[Mapping[str, Any]]) -> None:
+        if self._redis and self._redis.available:
+            try:
+                if record is None:
+                    self._redis.delete("queue", "auto_advance_preroll")
+                else:
+                    self._redis.json_set("queue", "auto_advance_preroll", dict(record))
+            except Exception:  # pragma: no cover - defensive
+                LOGGER.debug("Failed to persist pre-roll state to redis", exc_info=True)
+        with self._lock:
+            self._preroll = dict(record) if record is not None else None
+
+    @staticmethod
+    def _standby_from(record: Mapping[str, Any]) -> Optional[StandbyPlayback]:
+        """Rebuild the standby another worker prepared from its pre-roll record."""
+
+        rating_key = record.get("rating_key")
+        session_id = record.get("session_id")
+        if not isinstance(rating_key, str) or not isinstance(session_id, str):
+            return None
+        source = record.get("source")
+        details = record.get("details")
+        return StandbyPlayback(
+            rating_key=rating_key,
+            part_id=record.get("part_id"),
+            session_id=session_id,
+            source=source if isinstance(source, Mapping) else {},
+            details=details if isinstance(details, Mapping) else None,
+        )
+
     def _set_auto_advance_state(
         self,
         *,
@@ -590,10 +837,6 @@ class QueueService:
         stmt = self._base_query()
         return list(db.session.execute(stmt).scalars().unique())
 
-    def _ordered_items_locked(self) -> List[QueueItem]:
-        stmt = self._base_query()
-        return list(db.session.execute(stmt).scalars().unique())
-
     def _snapshot_is_active(
         self,
         snapshot: Optional[Mapping[str, Any]],
@@ -672,47 +915,135 @@ class QueueService:
         )
         return db.session.execute(stmt).scalar_one_or_none()
 
-    def _resequence_locked(self) -> None:
+    def _neighbour_locked(self, item: QueueItem, *, before: bool) -> Optional[QueueItem]:
+        if before:
+            stmt = (
+                select(QueueItem)
+                .filter(
+                    (QueueItem.position < item.position)
+                    | ((QueueItem.position == item.position) & (QueueItem.id < item.id))
+                )
+                .order_by(QueueItem.position.desc(), QueueItem.id.desc())
+            )
+        else:
+            stmt = (
+                select(QueueItem)
+                .filter(
+                    (QueueItem.position > item.position)
+                    | ((QueueItem.position == item.position) & (QueueItem.id > item.id))
+                )
+                .order_by(QueueItem.position.asc(), QueueItem.id.asc())
+            )
+        return db.session.execute(stmt.limit(1)).scalar_one_or_none()
+
+    def _rebalance_locked(self, *, reserve_at: Optional[int] = None, reserve: int = 0) -> None:
+        """Renumber the queue, leaving room for ``reserve`` rows before ``reserve_at``."""
+
         stmt = self._base_query()
         items = list(db.session.execute(stmt).scalars().unique())
         for index, item in enumerate(items, start=1):
-            if item.position != index:
-                item.position = index
+            slot = index
+            if reserve_at is not None and index >= reserve_at:
+                slot += reserve
+            position = slot * self.POSITION_GAP
+            if item.position != position:
+                item.position = position
         db.session.flush()
+        LOGGER.info("Rebalanced queue positions for %s item(s)", len(items))
 
-    def _bump_positions_locked(self, start_position: int) -> None:
-        stmt = (
-            select(QueueItem)
-            .filter(QueueItem.position >= start_position)
-            .order_by(QueueItem.position.desc())
+    @staticmethod
+    def _bounds_query() -> Select:
+        # Separate subqueries let each aggregate read one end of the position
+        # index; a combined MIN/MAX scans the table on SQLite.
+        return select(
+            select(func.min(QueueItem.position)).scalar_subquery(),
+            select(func.max(QueueItem.position)).scalar_subquery(),
         )
-        for item in db.session.execute(stmt).scalars():
-            item.position += 1
-        db.session.flush()
 
-    def _determine_insert_position(self, mode: str, index: Optional[int], length: int) -> int:
+    def _position_bounds_locked(self) -> Tuple[Optional[int], Optional[int]]:
+        lowest, highest = db.session.execute(self._bounds_query()).one()
+        return lowest, highest
+
+    def _positions_around_locked(self, ordinal: int) -> Tuple[Optional[int], Optional[int]]:
+        """Return the positions of the items at ``ordinal - 1`` and ``ordinal``."""
+
+        stmt = select(QueueItem.position).order_by(QueueItem.position.asc(), QueueItem.id.asc())
+        if ordinal <= 1:
+            rows = db.session.execute(stmt.limit(1)).scalars().all()
+            return None, rows[0] if rows else None
+        rows = db.session.execute(stmt.offset(ordinal - 2).limit(2)).scalars().all()
+        before = rows[0] if rows else None
+        after = rows[1] if len(rows) > 1 else None
+        return before, after
+
+    def _positions_between_locked(self, ordinal: int, count: int) -> List[int]:
+        """Allocate ``count`` ascending positions ahead of the item at ``ordinal``."""
+
+        gap = self.POSITION_GAP
+        for attempt in range(2):
+            before, after = self._positions_around_locked(ordinal)
+            if before is None and after is None:
+                return [gap * step for step in range(1, count + 1)]
+            if after is None:
+                positions = [before + gap * step for step in range(1, count + 1)]
+                if positions[-1] <= self.POSITION_LIMIT:
+                    return positions
+            elif before is None:
+                positions = [after - gap * step for step in range(count, 0, -1)]
+                if positions[0] >= -self.POSITION_LIMIT:
+                    return positions
+            else:
+                spacing = (after - before) // (count + 1)
+                if spacing >= 1:
+                    return [before + spacing * step for step in range(1, count + 1)]
+            if attempt == 0:
+                self._rebalance_locked(reserve_at=ordinal, reserve=count)
+        raise QueueError("Unable to allocate a queue position", status_code=500)
+
+    def _determine_insert_positions(self, mode: str, index: Optional[int], count: int) -> List[int]:
         if mode == "next":
-            return 1
+            return self._positions_between_locked(1, count)
         if mode == "last":
-            return length + 1
+            _lowest, highest = self._position_bounds_locked()
+            if highest is None:
+                highest = 0
+            elif highest + self.POSITION_GAP * count > self.POSITION_LIMIT:
+                self._rebalance_locked()
+                _lowest, highest = self._position_bounds_locked()
+            return [(highest or 0) + self.POSITION_GAP * step for step in range(1, count + 1)]
         if mode == "index":
+            length = db.session.execute(select(func.count(QueueItem.id))).scalar_one()
             target = index if index is not None else length
-            if target < 0:
-                target = 0
-            if target > length:
-                target = length
-            return target + 1
+            target = min(max(target, 0), length)
+            return self._positions_between_locked(target + 1, count)
         raise QueueError("Unsupported queue insert mode", status_code=400)
 
     def _fetch_details(self, rating_key: str) -> Mapping[str, Any]:
-        try:
-            details = self._plex.item_details(rating_key)
-        except PlexServiceError as exc:
-            raise QueueError(str(exc), status_code=502) from exc
+        details = self._fetch_details_many([rating_key]).get(str(rating_key))
         if not isinstance(details, Mapping):
             raise QueueError("Failed to load item details", status_code=502)
         return details
 
+    def _fetch_details_many(self, rating_keys: Iterable[str]) -> Mapping[str, Mapping[str, Any]]:
+        try:
+            return self._plex.item_details_many(rating_keys)
+        except PlexServiceError as exc:
+            raise QueueError(str(exc), status_code=502) from exc
+
+    def _backfill_details(self, items: Iterable[QueueItem]) -> Mapping[str, Mapping[str, Any]]:
+        missing = [
+            item.rating_key
+            for item in items
+            if not (isinstance(item.data, Mapping) and isinstance(item.data.get("details"), Mapping))
+        ]
+        if not missing:
+            return {}
+        try:
+            return self._fetch_details_many(missing)
+        except QueueError as exc:
+            LOGGER.warning("Unable to backfill queue item details: %s", exc)
+            return {}
+
     @staticmethod
     def _build_item_payload(details: Mapping[str, Any]) -> Mapping[str, Any]:
         item = details.get("item") if isinstance(details, Mapping) else {}
@@ -793,6 +1124,9 @@ class QueueService:
         self,
         item: QueueItem,
         schedule_entry: Optional[Mapping[str, Optional[str]]] = None,
+        fallback_details: Optional[Mapping[str, Any]] = None,
+        *,
+        position: Optional[int] = None,
     ) -> Mapping[str, Any]:
         requested_by = item.requested_by
         requester_data = None
@@ -807,6 +1141,8 @@ class QueueService:
             }
         schedule_entry = schedule_entry or {}
         details_payload = item.data.get("details") if isinstance(item.data, Mapping) else None
+        if not isinstance(details_payload, Mapping):
+            details_payload = fallback_details
         details_item = details_payload.get("item") if isinstance(details_payload, Mapping) else {}
         stored_summary = None
         stored_year = None
@@ -822,7 +1158,7 @@ class QueueService:
             "rating_key": item.rating_key,
             "part_id": item.part_id,
             "library_section_id": item.library_section_id,
-            "position": item.position,
+            "position": position if position is not None else item.position,
             "title": item.title,
             "grandparent_title": item.grandparent_title,
             "thumb": item.thumb,
@@ -838,7 +1174,7 @@ class QueueService:
         }
 
     def _insert_front_locked(self, serialized_item: Mapping[str, Any]) -> None:
-        self._bump_positions_locked(1)
+        position = self._positions_between_locked(1, 1)[0]
         queue_item = QueueItem(
             rating_key=serialized_item.get("rating_key"),
             part_id=serialized_item.get("part_id"),
@@ -849,12 +1185,10 @@ class QueueService:
             thumb=serialized_item.get("thumb"),
             art=serialized_item.get("art"),
             data=None,
-            position=1,
+            position=position,
             requested_by_id=(serialized_item.get("requested_by") or {}).get("id"),
         )
         db.session.add(queue_item)
-        db.session.flush()
-        self._resequence_locked()
         db.session.commit()
 
 
@@ -6,7 +6,7 @@ import logging
 import threading
 import time
 from contextlib import contextmanager
-from typing import Any, Dict, Iterator, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
 try:  # pragma: no cover - optional dependency
     import redis
@@ -181,7 +181,40 @@ class RedisService:
             logger.debug("Failed to decode cached payload for %s", redis_key)
             return None
 
-    def cache_set(self, namespace: str, key: str, value: Dict[str, Any]) -> None:
+    def cache_get_many(self, namespace: str, keys: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """Return cached payloads for ``keys`` using a single MGET round-trip."""
+
+        client = self._client
+        unique_keys = list(dict.fromkeys(key for key in keys if key))
+        if not client or not unique_keys:
+            return {}
+        redis_keys = [self._cache_key(namespace, key) for key in unique_keys]
+        try:
+            payloads = client.mget(redis_keys)
+        except RedisError as exc:  # pragma: no cover - network dependent
+            logger.debug("Redis MGET failed for namespace %s: %s", namespace, exc)
+            return {}
+        results: Dict[str, Dict[str, Any]] = {}
+        for key, payload in zip(unique_keys, payloads or []):
+            if payload is None:
+                continue
+            try:
+                decoded = json.loads(payload)
+            except json.JSONDecodeError:  # pragma: no cover - defensive
+                logger.debug("Failed to decode cached payload for %s:%s", namespace, key)
+                continue
+            if isinstance(decoded, dict):
+                results[key] = decoded
+        return results
+
+    def cache_set(
+        self,
+        namespace: str,
+        key: str,
+        value: Dict[str, Any],
+        *,
+        ttl: Optional[int] = None,
+    ) -> None:
         client = self._client
         if not client:
             return
@@ -192,7 +225,8 @@ class RedisService:
             return
 
         redis_key = self._cache_key(namespace, key)
-        ttl = self.ttl_seconds
+        if ttl is None or ttl <= 0:
+            ttl = self.ttl_seconds
         try:
             if ttl > 0:
                 client.set(redis_key, payload, ex=ttl)
@@ -270,6 +304,230 @@ class RedisService:
         except RedisError:  # pragma: no cover - defensive
             return
 
+    def hash_get(
+        self,
+        namespace: str,
+        key: str,
+        fields: Optional[Iterable[str]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Return JSON-decoded hash fields, or ``None`` when the hash is missing."""
+
+        client = self._client
+        if not client:
+            return None
+        redis_key = self._cache_key(namespace, key)
+        try:
+            if fields is None:
+                raw = client.hgetall(redis_key)
+            else:
+                names = list(fields)
+                if not names:
+                    return {}
+                raw = dict(zip(names, client.hmget(redis_key, names)))
+        except RedisError as exc:  # pragma: no cover - network dependent
+            logger.debug("Redis hash read failed for %s: %s", redis_key, exc)
+            return None
+        if not raw:
+            return None
+        decoded: Dict[str, Any] = {}
+        for name, value in raw.items():
+            if value is None:
+                continue
+            if isinstance(name, bytes):
+                name = name.decode("utf-8")
+            if isinstance(value, bytes):
+                value = value.decode("utf-8")
+            try:
+                decoded[name] = json.loads(value)
+            except json.JSONDecodeError:
+                logger.debug("Discarding invalid hash field %s for %s", name, redis_key)
+        return decoded
+
+    def hash_set(
+        self,
+        namespace: str,
+        key: str,
+        fields: Dict[str, Any],
+        *,
+        replace: bool = False,
+        version_key: Optional[str] = None,
+    ) -> Optional[int]:
+        """Write JSON-encoded ``fields`` into a hash in one round-trip.
+
+        ``replace`` drops the existing hash first. When ``version_key`` is
+        given, a counter under the same namespace is incremented in the same
+        transaction and its new value is returned.
+        """
+
+        client = self._client
+        if not client:
+            return None
+        redis_key = self._cache_key(namespace, key)
+        try:
+            encoded = {
+                name: json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+                for name, value in fields.items()
+            }
+        except (TypeError, ValueError):  # pragma: no cover - defensive
+            logger.debug("Unable to serialize hash fields for %s", redis_key)
+            return None
+        try:
+            pipe = client.pipeline()
+            if replace:
+                pipe.delete(redis_key)
+            if encoded:
+                pipe.hset(redis_key, mapping=encoded)
+            if version_key:
+                pipe.incr(self._cache_key(namespace, version_key))
+            result = pipe.execute()
+        except RedisError as exc:  # pragma: no cover - network dependent
+            logger.debug("Redis hash write failed for %s: %s", redis_key, exc)
+            return None
+        if version_key and result:
+            return int(result[-1])
+        return None
+
+    def hash_delete(self, namespace: str, key: str, fields: Iterable[str]) -> None:
+        client = self._client
+        names = list(fields)
+        if not client or not names:
+            return
+        redis_key = self._cache_key(namespace, key)
+        try:
+            client.hdel(redis_key, *names)
+        except RedisError as exc:  # pragma: no cover - network dependent
+            logger.debug("Redis HDEL failed for %s: %s", redis_key, exc)
+
+    # ------------------------------------------------------------------
+    # Sorted-set helpers
+    # ------------------------------------------------------------------
+    def zset_touch(self, namespace: str, key: str, member: str, score: float) -> Optional[bool]:
+        """Set ``member``'s score; return ``True`` when it was not present before."""
+
+        client = self._client
+        if not client:
+            return None
+        redis_key = self._cache_key(namespace, key)
+        try:
+            return bool(client.zadd(redis_key, {member: score}))
+        except RedisError as exc:  # pragma: no cover - network dependent
+            logger.debug("Redis ZADD failed for %s: %s", redis_key, exc)
+            return None
+
+    def zset_members(self, namespace: str, key: str, *, min_score: float) -> Optional[List[str]]:
+        """Return members scored at or above ``min_score``."""
+
+        client = self._client
+        if not client:
+            return None
+        redis_key = self._cache_key(namespace, key)
+        try:
+            raw = client.zrangebyscore(redis_key, min_score, "+inf")
+        except RedisError as exc:  # pragma: no cover - network dependent
+            logger.debug("Redis ZRANGEBYSCORE failed for %s: %s", redis_key, exc)
+            return None
+        return [item.decode("utf-8") if isinstance(item, bytes) else str(item) for item in raw]
+
+    def zset_expire(self, namespace: str, key: str, *, max_score: float) -> List[str]:
+        """Atomically remove and return members scored at or below ``max_score``."""
+
+        client = self._client
+        if not client:
+            return []
+        redis_key = self._cache_key(namespace, key)
+        try:
+            pipe = client.pipeline(transaction=True)
+            pipe.zrangebyscore(redis_key, "-inf", max_score)
+            pipe.zremrangebyscore(redis_key, "-inf", max_score)
+            raw, _removed = pipe.execute()
+        except RedisError as exc:  # pragma: no cover - network dependent
+            logger.debug("Redis sorted-set expiry failed for %s: %s", redis_key, exc)
+            return []
+        return [item.decode("utf-8") if isinstance(item, bytes) else str(item) for item in raw]
+
+    # ------------------------------------------------------------------
+    # Pub/sub helpers
+    # ------------------------------------------------------------------
+    def publish(self, namespace: str, channel: str, message: Dict[str, Any]) -> None:
+        client = self._client
+        if not client:
+            return
+        redis_channel = self._cache_key(namespace, channel)
+        try:
+            client.publish(redis_channel, json.dumps(message, separators=(",", ":")))
+        except (RedisError, TypeError, ValueError) as exc:  # pragma: no cover - network dependent
+            logger.debug("Redis PUBLISH failed for %s: %s", redis_channel, exc)
+
+    def subscribe(self, namespace: str, channel: str) -> Any:
+        """Return a pub/sub handle subscribed to ``channel``, or ``None``."""
+
+        client = self._client
+        if not client:
+            return None
+        pubsub = client.pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(self._cache_key(namespace, channel))
+        return pubsub
+
+    # ------------------------------------------------------------------
+    # Coordination helpers
+    # ------------------------------------------------------------------
+    def claim(self, namespace: str, key: str, *, ttl: int) -> bool:
+        """Atomically mark ``key`` as taken for ``ttl`` seconds (SET NX)."""
+
+        client = self._client
+        if not client:
+            return False
+        redis_key = self._cache_key(namespace, key)
+        try:
+            return bool(client.set(redis_key, "1", nx=True, ex=max(1, int(ttl))))
+        except RedisError as exc:  # pragma: no cover - network dependent
+            logger.debug("Redis SET NX failed for %s: %s", redis_key, exc)
+            return False
+
+    def increment(self, namespace: str, key: str, *, window: int) -> Optional[int]:
+        """Increment a counter that resets ``window`` seconds after first use."""
+
+        client = self._client
+        if not client:
+            return None
+        redis_key = self._cache_key(namespace, key)
+        try:
+            count = client.incr(redis_key)
+            if count == 1:
+                client.expire(redis_key, max(1, int(window)))
+        except RedisError as exc:  # pragma: no cover - network dependent
+            logger.debug("Redis INCR failed for %s: %s", redis_key, exc)
+            return None
+        return int(count)
+
+    def counter_get(self, namespace: str, key: str) -> Optional[int]:
+        """Return a plain (non-expiring) counter, ``0`` if unset, or ``None`` without Redis."""
+
+        client = self._client
+        if not client:
+            return None
+        redis_key = self._cache_key(namespace, key)
+        try:
+            value = client.get(redis_key)
+        except RedisError as exc:  # pragma: no cover - network dependent
+            logger.debug("Redis GET failed for %s: %s", redis_key, exc)
+            return None
+        try:
+            return int(value) if value is not None else 0
+        except (TypeError, ValueError):
+            return 0
+
+    def counter_bump(self, namespace: str, key: str) -> Optional[int]:
+        client = self._client
+        if not client:
+            return None
+        redis_key = self._cache_key(namespace, key)
+        try:
+            return int(client.incr(redis_key))
+        except RedisError as exc:  # pragma: no cover - network dependent
+            logger.debug("Redis INCR failed for %s: %s", redis_key, exc)
+            return None
+
     # ------------------------------------------------------------------
     # Locking
     # ------------------------------------------------------------------
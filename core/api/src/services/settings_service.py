@@ -43,6 +43,11 @@ class SettingsService:
         "notification_sound": "notification_chat.mp3",
         "notification_volume": 0.6,
         "notify_scope": "mentions",
+        # Live history limits; 0 disables a limit. Older messages are
+        # archived (or dropped when archiving is off) by the retention job.
+        "retention_days": 90,
+        "retention_max_messages": 20000,
+        "retention_archive": True,
     }
 
     DEFAULT_USERS_SETTINGS: Mapping[str, Any] = {
@@ -160,6 +165,17 @@ class SettingsService:
                 "kwargs": {"force_refresh": True},
                 "run_on_start": True,
             },
+            {
+                "id": "chat-retention",
+                "name": "Archive and Compact Chat History",
+                "task": "core.api.src.celery_app.tasks.chat.enforce_chat_retention",
+                "schedule_seconds": 3600,
+                "enabled": True,
+                "queue": "transcoder",
+                "args": [],
+                "kwargs": {},
+                "run_on_start": False,
+            },
         ],
         "refresh_interval_seconds": 15,
     }
@@ -626,6 +642,25 @@ class SettingsService:
         raw = self.get_system_settings(self.PLAYER_NAMESPACE)
         return self.sanitize_player_settings(raw)
 
+    def get_chat_retention_settings(self) -> Dict[str, Any]:
+        defaults = self.DEFAULT_CHAT_SETTINGS
+        raw = self.get_system_settings(self.CHAT_NAMESPACE)
+        return {
+            "retention_days": self._normalize_positive_int(
+                raw.get("retention_days"),
+                fallback=int(defaults["retention_days"]),
+                maximum=36_500,
+            ),
+            "retention_max_messages": self._normalize_positive_int(
+                raw.get("retention_max_messages"),
+                fallback=int(defaults["retention_max_messages"]),
+            ),
+            "retention_archive": self._coerce_bool(
+                raw.get("retention_archive"),
+                bool(defaults["retention_archive"]),
+            ),
+        }
+
     def sanitize_tasks_settings(self, overrides: Optional[Mapping[str, Any]] = None) -> Dict[str, Any]:
         defaults = self.DEFAULT_TASKS_SETTINGS
         merged_jobs: list[dict[str, Any]] = []
@@ -705,6 +740,30 @@ class SettingsService:
                 }
             )
 
+        # Built-in jobs added after a schedule was saved still get registered;
+        # they can be disabled but not dropped.
+        if merged_jobs:
+            for default_job in default_jobs:
+                if not isinstance(default_job, Mapping):
+                    continue
+                default_id = str(default_job.get("id") or default_job.get("task") or "").strip()
+                if default_id and default_id not in seen_ids:
+                    seen_ids.add(default_id)
+                    merged_jobs.append(
+                        {
+                            "id": default_id,
+                            "name": str(default_job.get("name") or default_id),
+                            "task": str(default_job.get("task") or ""),
+                            "schedule_seconds": int(default_job.get("schedule_seconds") or default_schedule_seconds),
+                            "enabled": bool(default_job.get("enabled", True)),
+                            "queue": str(default_job.get("queue") or "").strip() or None,
+                            "priority": None,
+                            "args": list(default_job.get("args") or []),
+                            "kwargs": dict(default_job.get("kwargs") or {}),
+                            "run_on_start": bool(default_job.get("run_on_start", False)),
+                        }
+                    )
+
         if not merged_jobs and default_jobs:
             fallback_job = default_jobs[0]
             if isinstance(fallback_job, Mapping):
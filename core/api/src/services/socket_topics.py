@@ -0,0 +1,136 @@
+"""Socket.IO topic rooms and rate-limited fan-out helpers."""
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Optional
+
+from flask_socketio import SocketIO
+
+LOGGER = logging.getLogger(__name__)
+
+TOPIC_CHAT = "chat"
+TOPIC_QUEUE = "queue"
+TOPIC_STATUS = "status"
+TOPIC_VIEWERS = "viewers"
+TOPICS = frozenset({TOPIC_CHAT, TOPIC_QUEUE, TOPIC_STATUS, TOPIC_VIEWERS})
+
+# Send-rate tiers a client may pick for state-like topics. ``0`` is the live
+# room that receives every snapshot and delta; the others receive only the
+# newest full snapshot at most once per interval.
+RATE_TIERS_MS = (0, 1000, 5000)
+DEFAULT_RATE_MS = 1000
+THROTTLED_TOPICS = frozenset({TOPIC_STATUS})
+
+
+def topic_room(topic: str, interval_ms: int = 0) -> str:
+    """Return the Socket.IO room name for ``topic`` at ``interval_ms``."""
+
+    if interval_ms:
+        return f"topic:{topic}@{interval_ms}"
+    return f"topic:{topic}"
+
+
+def topic_rooms(topic: str) -> Iterable[str]:
+    """Return every room a subscriber of ``topic`` may have joined."""
+
+    if topic in THROTTLED_TOPICS:
+        return [topic_room(topic, interval) for interval in RATE_TIERS_MS]
+    return [topic_room(topic)]
+
+
+def resolve_rate(requested: Any) -> int:
+    """Map a requested interval onto the nearest tier that is not faster."""
+
+    try:
+        interval = int(requested)
+    except (TypeError, ValueError):
+        return DEFAULT_RATE_MS
+    for tier in RATE_TIERS_MS:
+        if interval <= tier:
+            return tier
+    return RATE_TIERS_MS[-1]
+
+
+@dataclass
+class _RoomSlot:
+    next_at: float = 0.0
+    pending: Optional[Dict[str, Any]] = None
+    timer: Optional[threading.Timer] = None
+
+
+class ThrottledEmitter:
+    """Emit ``event`` to rooms no faster than each room's interval.
+
+    Payloads offered while a room is cooling down replace each other, so only
+    the latest state is delivered when the interval elapses.
+    """
+
+    def __init__(self, socketio: SocketIO, event: str) -> None:
+        self._socketio = socketio
+        self._event = event
+        self._lock = threading.Lock()
+        self._slots: Dict[str, _RoomSlot] = {}
+
+    def offer(self, room: str, interval_ms: int, payload: Dict[str, Any]) -> None:
+        interval = max(0, interval_ms) / 1000
+        now = time.monotonic()
+        with self._lock:
+            slot = self._slots.setdefault(room, _RoomSlot())
+            if slot.timer is None and now >= slot.next_at:
+                slot.next_at = now + interval
+                emit_now = True
+            else:
+                slot.pending = payload
+                emit_now = False
+                if slot.timer is None:
+                    timer = threading.Timer(slot.next_at - now, self._flush, args=(room, interval))
+                    timer.daemon = True
+                    slot.timer = timer
+                    timer.start()
+        if emit_now:
+            self._emit(room, payload)
+
+    def close(self) -> None:
+        with self._lock:
+            slots = list(self._slots.values())
+            self._slots = {}
+        for slot in slots:
+            if slot.timer is not None:
+                slot.timer.cancel()
+
+    def _flush(self, room: str, interval: float) -> None:
+        with self._lock:
+            slot = self._slots.get(room)
+            if slot is None:
+                return
+            payload = slot.pending
+            slot.pending = None
+            slot.timer = None
+            slot.next_at = time.monotonic() + interval
+        if payload is not None:
+            self._emit(room, payload)
+
+    def _emit(self, room: str, payload: Dict[str, Any]) -> None:
+        try:
+            self._socketio.emit(self._event, payload, to=room)
+        except Exception:  # pragma: no cover - defensive
+            LOGGER.debug("Failed to emit %s to %s", self._event, room, exc_info=True)
+
+
+__all__ = [
+    "DEFAULT_RATE_MS",
+    "RATE_TIERS_MS",
+    "THROTTLED_TOPICS",
+    "TOPICS",
+    "TOPIC_CHAT",
+    "TOPIC_QUEUE",
+    "TOPIC_STATUS",
+    "TOPIC_VIEWERS",
+    "ThrottledEmitter",
+    "resolve_rate",
+    "topic_room",
+    "topic_rooms",
+]
@@ -71,6 +71,15 @@ class TranscoderClient:
     def stop(self) -> Tuple[int, Optional[MutableMapping[str, Any]]]:
         return self._request("POST", "/transcode/stop")
 
+    def prepare_standby(self, body: Mapping[str, Any]) -> Tuple[int, Optional[MutableMapping[str, Any]]]:
+        return self._request("POST", "/transcode/standby", json=body)
+
+    def promote_standby(self, session_id: str) -> Tuple[int, Optional[MutableMapping[str, Any]]]:
+        return self._request("POST", "/transcode/standby/promote", json={"session_id": session_id})
+
+    def discard_standby(self) -> Tuple[int, Optional[MutableMapping[str, Any]]]:
+        return self._request("DELETE", "/transcode/standby")
+
     def task_status(self, task_id: str) -> Tuple[int, Optional[MutableMapping[str, Any]]]:
         return self._request("GET", f"/tasks/{task_id}")
 
@@ -3,7 +3,10 @@ from __future__ import annotations
 
 import json
 import logging
+import os
+import socket
 import threading
+import uuid
 from datetime import datetime, timezone
 from http import HTTPStatus
 from typing import Any, Callable, Dict, MutableMapping, Optional, Tuple
@@ -11,15 +14,17 @@ from typing import Any, Callable, Dict, MutableMapping, Optional, Tuple
 try:  # pragma: no cover - optional dependency
     import redis
     from redis import Redis
-    from redis.exceptions import RedisError
+    from redis.exceptions import RedisError, ResponseError
 except Exception:  # pragma: no cover - redis not installed
     redis = None  # type: ignore[assignment]
     Redis = None  # type: ignore[assignment]
     RedisError = Exception  # type: ignore[assignment]
+    ResponseError = Exception  # type: ignore[assignment]
 
 from flask_socketio import SocketIO
 
 from .redis_service import RedisService
+from .socket_topics import RATE_TIERS_MS, TOPIC_STATUS, ThrottledEmitter, topic_room
 from .transcoder_client import TranscoderClient
 
 LOGGER = logging.getLogger(__name__)
@@ -54,10 +59,17 @@ class TranscoderStatusService:
             return HTTPStatus.OK, cached
         return self._client.status()
 
+    def cached_snapshot(self) -> Optional[MutableMapping[str, Any]]:
+        """Return the full status snapshot stored in Redis when it is fresh."""
+
+        return self._read_redis()
+
     def _read_redis(self) -> Optional[MutableMapping[str, Any]]:
         if not self._redis.available:
             return None
-        payload = self._redis.json_get(self._namespace, self._key)
+        heartbeat_key = f"{self._key}:heartbeat"
+        entries = self._redis.cache_get_many(self._namespace, [self._key, heartbeat_key])
+        payload = entries.get(self._key)
         if not isinstance(payload, dict):
             return None
         payload_dict: Dict[str, Any] = dict(payload)
@@ -77,6 +89,15 @@ class TranscoderStatusService:
         except ValueError:
             LOGGER.debug("Transcoder status has invalid updated_at %r", updated_at)
             return None
+        # Unchanged heartbeats only refresh the liveness key, so the snapshot
+        # is as fresh as the newer of the two timestamps.
+        heartbeat = entries.get(heartbeat_key)
+        heartbeat_at = heartbeat.get("updated_at") if isinstance(heartbeat, dict) else None
+        if isinstance(heartbeat_at, str):
+            try:
+                updated = max(updated, datetime.fromisoformat(heartbeat_at))
+            except (TypeError, ValueError):
+                LOGGER.debug("Transcoder heartbeat has invalid updated_at %r", heartbeat_at)
         now = datetime.now(timezone.utc)
         delta = (now - updated).total_seconds()
         if delta > self._stale_after:
@@ -91,32 +112,74 @@ class TranscoderStatusService:
 
 
 class TranscoderStatusSubscriber:
-    """Relay Redis pub/sub status updates to connected Socket.IO clients."""
+    """Relay transcoder status events from a Redis Stream to Socket.IO clients.
+
+    The transcoder appends sequenced ``snapshot`` and ``delta`` messages to a
+    capped stream. The subscriber reads it through a consumer group with a
+    blocking ``XREADGROUP``, so entries published while the API was down are
+    replayed from the group's last delivered ID on reconnect. It keeps the
+    merged session, re-emits full snapshots as ``transcoder:status`` and
+    compact deltas as ``transcoder:status:delta``. On a sequence gap it
+    resynchronises from ``snapshot_loader``.
+
+    Every API worker runs a subscriber, but only the holder of a Redis lease
+    reads the stream, so each status is relayed once through the Socket.IO
+    message queue and in order. The others wait to take over. Events go to
+    the status topic rooms only: the live room gets every snapshot and delta,
+    and slower rate tiers get the newest snapshot once per interval.
+    """
+
+    BLOCK_MILLISECONDS = 5000
+    READ_COUNT = 100
+    RECONNECT_DELAY_SECONDS = 1.0
+    MAX_RECONNECT_DELAY_SECONDS = 30.0
+    LEASE_SECONDS = 15
+    _RENEW_SCRIPT = (
+        "if redis.call('get', KEYS[1]) == ARGV[1] then "
+        "return redis.call('pexpire', KEYS[1], ARGV[2]) else return 0 end"
+    )
+    _RELEASE_SCRIPT = (
+        "if redis.call('get', KEYS[1]) == ARGV[1] then "
+        "return redis.call('del', KEYS[1]) else return 0 end"
+    )
 
     def __init__(
         self,
         *,
         redis_url: Optional[str],
-        channel: Optional[str],
+        stream: Optional[str],
         socketio: SocketIO,
+        group: str = "api",
+        consumer: str = "relay",
+        leader_key: Optional[str] = None,
         status_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+        snapshot_loader: Optional[Callable[[], Optional[MutableMapping[str, Any]]]] = None,
     ) -> None:
         self._redis_url = (redis_url or "").strip()
-        self._channel = channel.strip() if isinstance(channel, str) else None
+        self._stream = stream.strip() if isinstance(stream, str) else None
+        self._group = group.strip() or "api"
+        self._consumer = (consumer or "").strip() or "relay"
+        self._leader_key = (leader_key or "").strip() or f"{self._stream}:relay"
+        self._identity = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._leading = False
         self._socketio = socketio
+        self._throttle = ThrottledEmitter(socketio, "transcoder:status")
         self._thread: Optional[threading.Thread] = None
         self._stop = threading.Event()
-        self._pubsub = None
+        self._client: Optional[Redis] = None
         self._logger = LOGGER.getChild("subscriber")
         self._callback = status_callback
+        self._snapshot_loader = snapshot_loader
+        self._state: Optional[Dict[str, Any]] = None
+        self._sequence: Optional[int] = None
 
     def start(self) -> None:
-        if not self._redis_url or not self._channel:
+        if not self._redis_url or not self._stream:
             return
         if self._thread and self._thread.is_alive():
             return
         if redis is None:
-            self._logger.warning("Redis package not available; cannot subscribe to status channel")
+            self._logger.warning("Redis package not available; cannot read transcoder status stream")
             return
         self._stop.clear()
         thread = threading.Thread(target=self._run, name="transcoder-status-subscriber", daemon=True)
@@ -125,12 +188,9 @@ class TranscoderStatusSubscriber:
 
     def stop(self) -> None:
         self._stop.set()
-        if self._pubsub is not None:
-            try:
-                self._pubsub.close()
-            except Exception:  # pragma: no cover - defensive
-                pass
-            self._pubsub = None
+        self._release_lease()
+        self._close_client()
+        self._throttle.close()
         if self._thread and self._thread.is_alive():
             self._thread.join(timeout=2.0)
         self._thread = None
@@ -140,60 +200,216 @@ class TranscoderStatusSubscriber:
     # Internal helpers
     # ------------------------------------------------------------------
     def _run(self) -> None:
-        client: Optional[Redis] = None
-        try:
-            client = redis.from_url(
-                self._redis_url,
-                socket_timeout=3,
-                health_check_interval=30,
+        delay = self.RECONNECT_DELAY_SECONDS
+        while not self._stop.is_set():
+            try:
+                self._consume()
+                delay = self.RECONNECT_DELAY_SECONDS
+            except Exception as exc:  # pragma: no cover - network dependent
+                if self._stop.is_set():
+                    break
+                self._logger.warning(
+                    "Transcoder status stream read failed: %s; retrying in %.0fs",
+                    exc,
+                    delay,
+                )
+            finally:
+                self._close_client()
+            if self._stop.wait(delay):
+                break
+            delay = min(delay * 2, self.MAX_RECONNECT_DELAY_SECONDS)
+
+    def _consume(self) -> None:
+        client = redis.from_url(
+            self._redis_url,
+            socket_timeout=self.BLOCK_MILLISECONDS / 1000 + 5,
+            health_check_interval=30,
+        )
+        self._client = client
+        while not self._stop.is_set():
+            if self._hold_lease(client):
+                self._relay(client)
+            elif self._stop.wait(self.LEASE_SECONDS / 3):
+                break
+
+    def _relay(self, client: Redis) -> None:
+        self._ensure_group(client)
+        self._logger.info(
+            "Relaying %s as %s/%s (%s)",
+            self._stream,
+            self._group,
+            self._consumer,
+            self._identity,
+        )
+        # Followers do not track the stream; the first delta resyncs.
+        self._state = None
+        self._sequence = None
+        # The consumer name is shared by every leader, so entries a previous
+        # leader read but never acknowledged are replayed first.
+        cursor = "0"
+        while not self._stop.is_set():
+            if not self._hold_lease(client):
+                self._logger.info("Lost transcoder status relay lease")
+                return
+            response = client.xreadgroup(
+                self._group,
+                self._consumer,
+                {self._stream: cursor},
+                count=self.READ_COUNT,
+                block=None if cursor != ">" else self.BLOCK_MILLISECONDS,
             )
-            pubsub = client.pubsub(ignore_subscribe_messages=True)
-            pubsub.subscribe(self._channel)
-            self._pubsub = pubsub
-            self._logger.debug("Subscribed to %s for transcoder status events", self._channel)
-            while not self._stop.is_set():
-                message = pubsub.get_message(timeout=1.0)
-                if not message:
-                    continue
-                if message.get("type") != "message":
+            entries = response[0][1] if response else []
+            if cursor != ">" and not entries:
+                # Pending history is drained; switch to new entries.
+                cursor = ">"
+                continue
+            for entry_id, fields in entries:
+                if cursor != ">" and not fields:
+                    # Pending entry that was trimmed from the capped stream.
+                    client.xack(self._stream, self._group, entry_id)
                     continue
-                data = message.get("data")
-                if isinstance(data, bytes):
-                    data = data.decode("utf-8", errors="replace")
-                if not data:
-                    continue
-                payload = self._parse_payload(data)
-                if payload is None:
-                    continue
-                payload.setdefault("source", payload.get("origin", "redis"))
-                self._socketio.emit("transcoder:status", payload)
-                if self._callback is not None:
-                    try:
-                        LOGGER.info(
-                            "TranscoderStatusSubscriber forwarding payload (running=%s session=%s)",
-                            payload.get("session", {}).get("running"),
-                            payload.get("session", {}).get("id")
-                            or payload.get("session", {}).get("session_id")
-                            or payload.get("session", {}).get("sessionId"),
-                        )
-                        self._callback(payload)
-                    except Exception:  # pragma: no cover - defensive
-                        self._logger.debug("Status callback raised an exception", exc_info=True)
-        except Exception as exc:  # pragma: no cover - network dependent
-            if not self._stop.is_set():
-                self._logger.warning("Transcoder status subscriber stopped unexpectedly: %s", exc)
-        finally:
-            if self._pubsub is not None:
-                try:
-                    self._pubsub.close()
-                except Exception:  # pragma: no cover - defensive
-                    pass
-                self._pubsub = None
-            if client is not None:
-                try:
-                    client.close()
-                except Exception:  # pragma: no cover - defensive
-                    pass
+                self._handle_entry(fields)
+                client.xack(self._stream, self._group, entry_id)
+            if cursor != ">":
+                cursor = self._decode(entries[-1][0]) or ">"
+
+    def _hold_lease(self, client: Redis) -> bool:
+        """Acquire or renew the relay lease; return whether it is held."""
+
+        ttl_ms = self.LEASE_SECONDS * 1000
+        if self._leading:
+            self._leading = bool(client.eval(self._RENEW_SCRIPT, 1, self._leader_key, self._identity, ttl_ms))
+        else:
+            self._leading = bool(client.set(self._leader_key, self._identity, nx=True, px=ttl_ms))
+        return self._leading
+
+    def _release_lease(self) -> None:
+        client = self._client
+        if client is None or not self._leading:
+            return
+        self._leading = False
+        try:
+            client.eval(self._RELEASE_SCRIPT, 1, self._leader_key, self._identity)
+        except Exception:  # pragma: no cover - network dependent
+            self._logger.debug("Failed to release transcoder status relay lease", exc_info=True)
+
+    def _ensure_group(self, client: Redis) -> None:
+        try:
+            client.xgroup_create(self._stream, self._group, id="$", mkstream=True)
+        except ResponseError as exc:
+            if "BUSYGROUP" not in str(exc):
+                raise
+
+    def _handle_entry(self, fields: Any) -> None:
+        data = None
+        if isinstance(fields, dict):
+            data = fields.get(b"payload", fields.get("payload"))
+        data = self._decode(data)
+        if not data:
+            return
+        message_payload = self._parse_payload(data)
+        if message_payload is None:
+            return
+        applied = self._apply_message(message_payload)
+        if applied is None:
+            return
+        payload, delta = applied
+        payload.setdefault("source", payload.get("origin", "redis"))
+        live_room = topic_room(TOPIC_STATUS)
+        if delta is not None:
+            self._socketio.emit("transcoder:status:delta", delta, to=live_room)
+        else:
+            self._socketio.emit("transcoder:status", payload, to=live_room)
+        for interval in RATE_TIERS_MS:
+            if interval:
+                self._throttle.offer(topic_room(TOPIC_STATUS, interval), interval, dict(payload))
+        if self._callback is not None:
+            try:
+                LOGGER.info(
+                    "TranscoderStatusSubscriber forwarding payload (running=%s session=%s)",
+                    payload.get("session", {}).get("running"),
+                    payload.get("session", {}).get("id")
+                    or payload.get("session", {}).get("session_id")
+                    or payload.get("session", {}).get("sessionId"),
+                )
+                self._callback(payload)
+            except Exception:  # pragma: no cover - defensive
+                self._logger.debug("Status callback raised an exception", exc_info=True)
+
+    def _close_client(self) -> None:
+        client = self._client
+        self._client = None
+        if client is None:
+            return
+        try:
+            client.close()
+        except Exception:  # pragma: no cover - defensive
+            pass
+
+    @staticmethod
+    def _decode(value: Any) -> Optional[str]:
+        if isinstance(value, bytes):
+            return value.decode("utf-8", errors="replace")
+        if isinstance(value, str):
+            return value
+        return None
+
+    def _apply_message(
+        self,
+        message: Dict[str, Any],
+    ) -> Optional[Tuple[Dict[str, Any], Optional[Dict[str, Any]]]]:
+        """Merge ``message`` into the tracked state.
+
+        Returns the full payload plus the delta to emit, or ``None`` for the
+        delta when a full snapshot should be emitted instead.
+        """
+
+        sequence = message.get("seq")
+        if message.get("type") != "delta":
+            state = {key: value for key, value in message.items() if key not in {"type", "event"}}
+            self._state = state
+            self._sequence = sequence if isinstance(sequence, int) else None
+            return dict(state), None
+
+        if (
+            self._state is None
+            or self._sequence is None
+            or not isinstance(sequence, int)
+            or sequence != self._sequence + 1
+        ):
+            if isinstance(sequence, int) and self._sequence is not None and sequence <= self._sequence:
+                return None
+            return self._resync()
+
+        session = dict(self._state.get("session") or {})
+        changes = message.get("session")
+        if isinstance(changes, dict):
+            session.update(changes)
+        for key in message.get("removed") or []:
+            session.pop(key, None)
+        state = {"session": session, "metadata": message.get("metadata") or {}, "seq": sequence}
+        self._state = state
+        self._sequence = sequence
+        delta = {key: value for key, value in message.items() if key != "type"}
+        return dict(state), delta
+
+    def _resync(self) -> Optional[Tuple[Dict[str, Any], Optional[Dict[str, Any]]]]:
+        loader = self._snapshot_loader
+        snapshot = None
+        if loader is not None:
+            try:
+                snapshot = loader()
+            except Exception:  # pragma: no cover - defensive
+                self._logger.debug("Failed to reload transcoder status snapshot", exc_info=True)
+        if not isinstance(snapshot, MutableMapping):
+            self._state = None
+            self._sequence = None
+            return None
+        state = dict(snapshot)
+        sequence = state.get("seq")
+        self._state = state
+        self._sequence = sequence if isinstance(sequence, int) else None
+        return dict(state), None
 
     @staticmethod
     def _parse_payload(raw: Any) -> Optional[Dict[str, Any]]:
@@ -7,6 +7,7 @@ import secrets
 
 from sqlalchemy import func, inspect, select, text
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import lazyload
 from werkzeug.security import check_password_hash, generate_password_hash
 
 from ..app.providers import db
@@ -45,6 +46,11 @@ class UserService:
     def get_by_id(self, user_id: int) -> Optional[User]:
         return db.session.get(User, user_id)
 
+    def get_for_session(self, user_id: int) -> Optional[User]:
+        """Load a user for request authentication without eager group loads."""
+
+        return db.session.get(User, user_id, options=[lazyload(User.groups)])
+
     def get_by_username(self, username: str) -> Optional[User]:
         if not username:
             return None
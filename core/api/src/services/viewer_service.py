@@ -1,14 +1,20 @@
-"""In-memory tracking helpers for active viewers and guests."""
+"""Presence tracking for active viewers and guests."""
 from __future__ import annotations
 
+import logging
 import secrets
 import threading
 import time
 from dataclasses import dataclass
-from typing import Dict, Iterable, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Mapping, Optional
 
 from ..models import User
 
+if TYPE_CHECKING:  # pragma: no cover - typing helper
+    from .redis_service import RedisService
+
+LOGGER = logging.getLogger(__name__)
+
 
 @dataclass
 class ViewerRecord:
@@ -21,14 +27,63 @@ class ViewerRecord:
     user_id: Optional[int] = None
     is_admin: bool = False
 
+    def identity(self) -> Dict[str, Any]:
+        return {
+            "username": self.username,
+            "is_guest": self.is_guest,
+            "user_id": self.user_id,
+            "is_admin": self.is_admin,
+        }
+
+    @classmethod
+    def from_identity(cls, token: str, last_seen: float, payload: Mapping[str, Any]) -> "ViewerRecord":
+        user_id = payload.get("user_id")
+        return cls(
+            token=token,
+            last_seen=last_seen,
+            username=str(payload.get("username") or ""),
+            is_guest=bool(payload.get("is_guest", user_id is None)),
+            user_id=int(user_id) if isinstance(user_id, int) else None,
+            is_admin=bool(payload.get("is_admin")),
+        )
+
 
 class ViewerService:
-    """Tracks active viewers (authenticated users and guests)."""
+    """Tracks active viewers (authenticated users and guests).
+
+    With Redis available, presence is shared by every API worker: a sorted
+    set scores viewer tokens by last-seen time and a hash holds each token's
+    identity. Expired viewers are removed by score range at most once per
+    ``SWEEP_INTERVAL_SECONDS`` across the cluster. The ``list_active``
+    aggregate is cached in Redis and dropped whenever membership changes, and
+    ``on_change`` receives the fresh aggregate (coalesced over
+    ``NOTIFY_DELAY_SECONDS``) so clients need not poll.
+    """
+
+    REDIS_NAMESPACE = "viewers"
+    PRESENCE_KEY = "presence"
+    RECORDS_KEY = "records"
+    SUMMARY_KEY = "summary"
+    SWEEP_KEY = "sweep"
+    SWEEP_INTERVAL_SECONDS = 5
+    NOTIFY_DELAY_SECONDS = 1.0
 
-    def __init__(self, *, ttl_seconds: int = 30) -> None:
+    def __init__(
+        self,
+        *,
+        ttl_seconds: int = 30,
+        redis_service: Optional["RedisService"] = None,
+        on_change: Optional[Callable[[Dict[str, object]], None]] = None,
+    ) -> None:
         self._records: Dict[str, ViewerRecord] = {}
         self._ttl = ttl_seconds
-        self._lock = threading.Lock()
+        # Re-entrant: the local sweep schedules notifications while holding it.
+        self._lock = threading.RLock()
+        self._redis = redis_service
+        self._on_change = on_change
+        self._summary: Optional[Dict[str, object]] = None
+        self._swept_at = 0.0
+        self._notify_timer: Optional[threading.Timer] = None
 
     @staticmethod
     def generate_guest_name() -> str:
@@ -37,86 +92,216 @@ class ViewerService:
     def _generate_token(self) -> str:
         return secrets.token_urlsafe(24)
 
-    def _cleanup(self, now: Optional[float] = None) -> None:
-        current = now or time.time()
-        expired: Iterable[str] = [
-            token for token, record in self._records.items() if current - record.last_seen > self._ttl
-        ]
-        for token in expired:
-            self._records.pop(token, None)
-
     def register(self, *, user: Optional[User], username: str, token: Optional[str] = None) -> ViewerRecord:
         """Register (or refresh) a viewer and return the active record."""
 
         now = time.time()
-        with self._lock:
-            self._cleanup(now)
-            record_token = token or self._generate_token()
-            record = ViewerRecord(
-                token=record_token,
-                last_seen=now,
-                username=username,
-                is_guest=user is None,
-                user_id=None if user is None else int(user.id),
-                is_admin=bool(getattr(user, "is_admin", False)) if user is not None else False,
+        record = self._build_record(token or self._generate_token(), now, user=user, username=username)
+        if self._use_redis():
+            self._redis.hash_set(  # type: ignore[union-attr]
+                self.REDIS_NAMESPACE, self.RECORDS_KEY, {record.token: record.identity()}
             )
-            self._records[record_token] = record
+            self._redis.zset_touch(self.REDIS_NAMESPACE, self.PRESENCE_KEY, record.token, now)  # type: ignore[union-attr]
+            self._changed()
+            self._maybe_sweep(now)
             return record
 
+        with self._lock:
+            self._sweep_local(now)
+            self._records[record.token] = record
+            self._summary = None
+        self._changed()
+        return record
+
     def heartbeat(self, token: str, *, user: Optional[User] = None, username: Optional[str] = None) -> Optional[ViewerRecord]:
         now = time.time()
+        if self._use_redis():
+            return self._heartbeat_redis(token, now, user=user, username=username)
+
+        changed = False
         with self._lock:
             record = self._records.get(token)
             if not record:
                 if username is None:
                     return None
-                record = ViewerRecord(
-                    token=token,
-                    last_seen=now,
-                    username=username,
-                    is_guest=user is None,
-                    user_id=None if user is None else int(user.id),
-                    is_admin=bool(getattr(user, "is_admin", False)) if user is not None else False,
-                )
+                record = self._build_record(token, now, user=user, username=username)
                 self._records[token] = record
-                return record
-            if username:
-                record.username = username
-            if user is not None:
-                record.user_id = int(user.id)
-                record.is_guest = False
-                record.is_admin = bool(getattr(user, "is_admin", False))
-            record.last_seen = now
-            return record
+                changed = True
+            else:
+                updated = self._apply_identity(record, user=user, username=username)
+                updated.last_seen = now
+                changed = updated.identity() != record.identity()
+                record = updated
+                self._records[token] = record
+            if changed:
+                self._summary = None
+        if changed:
+            self._changed()
+        return record
 
     def list_active(self) -> Dict[str, object]:
         now = time.time()
+        if self._use_redis():
+            cached = self._redis.json_get(self.REDIS_NAMESPACE, self.SUMMARY_KEY)  # type: ignore[union-attr]
+            if isinstance(cached, dict):
+                return cached
+            members = self._redis.zset_members(  # type: ignore[union-attr]
+                self.REDIS_NAMESPACE, self.PRESENCE_KEY, min_score=now - self._ttl
+            )
+            if members is not None:
+                identities = self._redis.hash_get(  # type: ignore[union-attr]
+                    self.REDIS_NAMESPACE, self.RECORDS_KEY, members
+                ) or {}
+                summary = self._summarize(
+                    ViewerRecord.from_identity(token, now, payload)
+                    for token, payload in identities.items()
+                    if isinstance(payload, Mapping)
+                )
+                # Bounded by the sweep interval so silently expired viewers drop out.
+                self._redis.json_set(  # type: ignore[union-attr]
+                    self.REDIS_NAMESPACE, self.SUMMARY_KEY, summary, ttl=self.SWEEP_INTERVAL_SECONDS
+                )
+                return summary
+
         with self._lock:
-            self._cleanup(now)
-            users_dict: Dict[int, ViewerRecord] = {}
-            guest_count = 0
-            for record in self._records.values():
-                if record.user_id is not None:
-                    users_dict.setdefault(record.user_id, record)
-                else:
-                    guest_count += 1
-            users = [
-                {
-                    "user_id": record.user_id,
-                    "username": record.username,
-                    "is_admin": record.is_admin,
-                }
-                for record in users_dict.values()
-            ]
-            users.sort(key=lambda item: item["username"].lower())
-            signed_in_count = len(users)
-            total_count = signed_in_count + guest_count
-            return {
-                "users": users,
-                "guest_count": guest_count,
-                "signed_in_count": signed_in_count,
-                "total_count": total_count,
+            self._sweep_local(now)
+            if self._summary is None:
+                self._summary = self._summarize(self._records.values())
+            return self._summary
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+    def _heartbeat_redis(
+        self,
+        token: str,
+        now: float,
+        *,
+        user: Optional[User],
+        username: Optional[str],
+    ) -> Optional[ViewerRecord]:
+        stored = self._redis.hash_get(self.REDIS_NAMESPACE, self.RECORDS_KEY, [token]) or {}  # type: ignore[union-attr]
+        identity = stored.get(token)
+        if isinstance(identity, Mapping):
+            existing = ViewerRecord.from_identity(token, now, identity)
+            record = self._apply_identity(existing, user=user, username=username)
+        elif username is None:
+            return None
+        else:
+            existing = None
+            record = self._build_record(token, now, user=user, username=username)
+
+        changed = existing is None or record.identity() != existing.identity()
+        if changed:
+            self._redis.hash_set(  # type: ignore[union-attr]
+                self.REDIS_NAMESPACE, self.RECORDS_KEY, {token: record.identity()}
+            )
+        added = self._redis.zset_touch(self.REDIS_NAMESPACE, self.PRESENCE_KEY, token, now)  # type: ignore[union-attr]
+        if changed or added:
+            self._changed()
+        self._maybe_sweep(now)
+        return record
+
+    @staticmethod
+    def _build_record(token: str, now: float, *, user: Optional[User], username: str) -> ViewerRecord:
+        return ViewerRecord(
+            token=token,
+            last_seen=now,
+            username=username,
+            is_guest=user is None,
+            user_id=None if user is None else int(user.id),
+            is_admin=bool(getattr(user, "is_admin", False)) if user is not None else False,
+        )
+
+    @staticmethod
+    def _apply_identity(record: ViewerRecord, *, user: Optional[User], username: Optional[str]) -> ViewerRecord:
+        updated = ViewerRecord(**record.__dict__)
+        if username:
+            updated.username = username
+        if user is not None:
+            updated.user_id = int(user.id)
+            updated.is_guest = False
+            updated.is_admin = bool(getattr(user, "is_admin", False))
+        return updated
+
+    def _maybe_sweep(self, now: float) -> None:
+        if not self._redis.claim(  # type: ignore[union-attr]
+            self.REDIS_NAMESPACE, self.SWEEP_KEY, ttl=self.SWEEP_INTERVAL_SECONDS
+        ):
+            return
+        expired = self._redis.zset_expire(  # type: ignore[union-attr]
+            self.REDIS_NAMESPACE, self.PRESENCE_KEY, max_score=now - self._ttl
+        )
+        if expired:
+            self._redis.hash_delete(self.REDIS_NAMESPACE, self.RECORDS_KEY, expired)  # type: ignore[union-attr]
+            self._changed()
+
+    def _sweep_local(self, now: float) -> None:
+        if now - self._swept_at < self.SWEEP_INTERVAL_SECONDS:
+            return
+        self._swept_at = now
+        expired = [token for token, record in self._records.items() if now - record.last_seen > self._ttl]
+        for token in expired:
+            self._records.pop(token, None)
+        if expired:
+            self._summary = None
+            self._schedule_notify()
+
+    def _changed(self) -> None:
+        if self._use_redis():
+            self._redis.delete(self.REDIS_NAMESPACE, self.SUMMARY_KEY)  # type: ignore[union-attr]
+        self._schedule_notify()
+
+    def _schedule_notify(self) -> None:
+        if self._on_change is None:
+            return
+        with self._lock:
+            if self._notify_timer is not None:
+                return
+            timer = threading.Timer(self.NOTIFY_DELAY_SECONDS, self._notify)
+            timer.daemon = True
+            self._notify_timer = timer
+            timer.start()
+
+    def _notify(self) -> None:
+        with self._lock:
+            self._notify_timer = None
+        callback = self._on_change
+        if callback is None:
+            return
+        try:
+            callback(self.list_active())
+        except Exception:  # pragma: no cover - defensive
+            LOGGER.debug("Viewer change callback failed", exc_info=True)
+
+    @staticmethod
+    def _summarize(records: Iterable[ViewerRecord]) -> Dict[str, object]:
+        users_dict: Dict[int, ViewerRecord] = {}
+        guest_count = 0
+        for record in records:
+            if record.user_id is not None:
+                users_dict.setdefault(record.user_id, record)
+            else:
+                guest_count += 1
+        users = [
+            {
+                "user_id": record.user_id,
+                "username": record.username,
+                "is_admin": record.is_admin,
             }
+            for record in users_dict.values()
+        ]
+        users.sort(key=lambda item: item["username"].lower())
+        signed_in_count = len(users)
+        return {
+            "users": users,
+            "guest_count": guest_count,
+            "signed_in_count": signed_in_count,
+            "total_count": signed_in_count + guest_count,
+        }
+
+    def _use_redis(self) -> bool:
+        return bool(self._redis and self._redis.available)
 
 
 __all__ = ["ViewerService", "ViewerRecord"]
@@ -9,6 +9,7 @@ from .config import (
 )
 from .encoder import FFmpegDashEncoder
 from .pipeline import DashTranscodePipeline, LiveEncodingHandle
+from .progress import FFmpegProgressReader
 from .tracks import MediaTrack, MediaType
 
 __all__ = [
@@ -17,6 +18,7 @@ __all__ = [
     "DashTranscodePipeline",
     "EncoderSettings",
     "FFmpegDashEncoder",
+    "FFmpegProgressReader",
     "LiveEncodingHandle",
     "MediaTrack",
     "MediaType",
@@ -15,6 +15,7 @@ from typing import Any, Callable, Iterable, List, Optional, Sequence, Tuple
 from .config import EncoderSettings, PackagerOptions
 from .encoder import FFmpegDashEncoder
 from .packager import PackagerJob, PackagerStream
+from .progress import FFmpegProgressReader
 from .tracks import MediaTrack, MediaType
 
 LOGGER = logging.getLogger(__name__)
@@ -36,6 +37,7 @@ class LiveEncodingHandle:
     process: subprocess.Popen[str]
     packager_process: Optional[subprocess.Popen[str]] = None
     cleanup_callbacks: Sequence[Callable[[], None]] = field(default_factory=tuple)
+    progress: Optional[FFmpegProgressReader] = None
 
     def wait(self) -> int:
         """Wait for FFmpeg (and Packager) to exit, then run cleanup callbacks."""
@@ -56,6 +58,8 @@ class LiveEncodingHandle:
 
     def _wait_internal(self) -> int:
         ffmpeg_rc = self.process.wait()
+        if self.progress is not None:
+            self.progress.join(timeout=1.0)
         if self.packager_process is not None:
             try:
                 self.packager_process.wait()
@@ -99,13 +103,20 @@ class DashTranscodePipeline:
         self._bindings: list[_StreamBinding] = []
         self._output_dirs: set[Path] = set()
         self._subtitle_metadata: list[dict[str, Any]] = []
+        # Glob pattern -> (directory mtime_ns, highest segment index) for latest_segment_number().
+        self._latest_segments: dict[Path, tuple[int, Optional[int]]] = {}
 
     def start_live(
         self,
         poll_interval: Optional[float] = None,  # retained for compatibility
         static_assets: Optional[Iterable[Path]] = None,
+        progress_callback: Optional[Callable[[dict[str, Any]], None]] = None,
     ) -> LiveEncodingHandle:
-        """Start FFmpeg and Shaka Packager for a live session."""
+        """Start FFmpeg and Shaka Packager for a live session.
+
+        FFmpeg's ``-progress`` output is read from its stdout; each parsed
+        block is passed to ``progress_callback`` when provided.
+        """
 
         del poll_interval  # no longer required; kept for interface compatibility
         self._prepare_directories()
@@ -148,7 +159,13 @@ class DashTranscodePipeline:
 
         ffmpeg_cmd = self._build_ffmpeg_command(bindings)
         LOGGER.info("Starting FFmpeg: %s", shlex.join(ffmpeg_cmd))
-        ffmpeg_process = subprocess.Popen(ffmpeg_cmd, text=True)
+        ffmpeg_process = subprocess.Popen(ffmpeg_cmd, text=True, stdout=subprocess.PIPE)
+        progress_reader = None
+        if ffmpeg_process.stdout is not None:
+            progress_reader = FFmpegProgressReader(
+                ffmpeg_process.stdout,
+                on_update=progress_callback,
+            ).start()
 
         if static_assets:
             self._record_static_assets(static_assets)
@@ -157,6 +174,7 @@ class DashTranscodePipeline:
             process=ffmpeg_process,
             packager_process=packager_process,
             cleanup_callbacks=tuple(cleanup_callbacks),
+            progress=progress_reader,
         )
 
     def cleanup_output(self) -> list[Path]:
@@ -465,6 +483,8 @@ class DashTranscodePipeline:
         cmd: list[str] = [self.settings.ffmpeg_binary]
         # Always force overwrite so FFmpeg will write to the pre-created FIFO pipes.
         cmd.append("-y")
+        # Machine-readable progress goes to stdout; outputs are written to FIFOs.
+        cmd.extend(["-progress", "pipe:1", "-nostats"])
         if self.settings.realtime_input:
             cmd.append("-re")
         if self.settings.copy_timestamps:
@@ -528,15 +548,22 @@ class DashTranscodePipeline:
 
         return _cleanup
 
-    def _segment_glob_patterns(self) -> list[Path]:
-        patterns: list[Path] = []
+    def _media_segment_patterns(self) -> list[Path]:
+        """Return the glob patterns of the video and audio segments."""
+
         video_template = self._layout.get("video_segment_template") or "video_$Number$.m4s"
         audio_template = self._layout.get("audio_segment_template") or "audio_$Number$.m4s"
-        patterns.append(self._output_root / self._to_glob_pattern(video_template))
-        patterns.append(self._output_root / self._to_glob_pattern(audio_template))
+        return [
+            self._output_root / self._to_glob_pattern(video_template),
+            self._output_root / self._to_glob_pattern(audio_template),
+        ]
+
+    def _segment_glob_patterns(self) -> list[Path]:
         subtitle_template = self._layout.get("subtitle_segment_template") or "text_$Number$.vtt"
-        patterns.append(self._output_root / self._to_glob_pattern(subtitle_template))
-        return patterns
+        return [
+            *self._media_segment_patterns(),
+            self._output_root / self._to_glob_pattern(subtitle_template),
+        ]
 
     @staticmethod
     def _to_glob_pattern(template: str) -> str:
@@ -549,6 +576,36 @@ class DashTranscodePipeline:
 
         return [dict(entry) for entry in self._subtitle_metadata]
 
+    def latest_segment_number(self) -> Optional[int]:
+        """Return the highest segment number the packager has written so far.
+
+        Telemetry asks for this on every heartbeat and status request, so
+        each directory is only globbed again once its mtime has changed.
+        """
+
+        latest: Optional[int] = None
+        for pattern in self._media_segment_patterns():
+            highest = self._highest_segment_index(pattern)
+            if highest is not None and (latest is None or highest > latest):
+                latest = highest
+        return latest
+
+    def _highest_segment_index(self, pattern: Path) -> Optional[int]:
+        try:
+            mtime_ns = pattern.parent.stat().st_mtime_ns
+        except OSError:
+            return None
+        cached = self._latest_segments.get(pattern)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+        highest: Optional[int] = None
+        for candidate in pattern.parent.glob(pattern.name):
+            index = self._segment_index(candidate)
+            if index >= 0 and (highest is None or index > highest):
+                highest = index
+        self._latest_segments[pattern] = (mtime_ns, highest)
+        return highest
+
     @staticmethod
     def _segment_index(path: Path) -> int:
         stem = path.stem
@@ -0,0 +1,122 @@
+"""Readers for FFmpeg's machine-readable ``-progress`` output."""
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import IO, Any, Callable, Optional
+
+LOGGER = logging.getLogger(__name__)
+
+
+def _parse_float(value: str) -> Optional[float]:
+    text = value.strip().rstrip("x")
+    if not text or text == "N/A":
+        return None
+    try:
+        return float(text)
+    except ValueError:
+        return None
+
+
+def _parse_int(value: str) -> Optional[int]:
+    text = value.strip()
+    if not text or text == "N/A":
+        return None
+    try:
+        return int(text)
+    except ValueError:
+        return None
+
+
+def _parse_bitrate(value: str) -> Optional[float]:
+    """Convert FFmpeg's ``1234.5kbits/s`` notation into kbit/s."""
+
+    text = value.strip()
+    if text.endswith("kbits/s"):
+        text = text[: -len("kbits/s")]
+    return _parse_float(text)
+
+
+class FFmpegProgressReader:
+    """Consume ``key=value`` blocks written by ``ffmpeg -progress`` on a pipe.
+
+    FFmpeg emits one block per stats period terminated by ``progress=continue``
+    (or ``progress=end``). The reader keeps the latest complete block and
+    notifies ``on_update`` after each one.
+    """
+
+    def __init__(
+        self,
+        stream: IO[str],
+        *,
+        on_update: Optional[Callable[[dict[str, Any]], None]] = None,
+    ) -> None:
+        self._stream = stream
+        self._on_update = on_update
+        self._lock = threading.Lock()
+        self._latest: dict[str, Any] = {}
+        self._thread = threading.Thread(target=self._run, name="ffmpeg-progress", daemon=True)
+
+    def start(self) -> "FFmpegProgressReader":
+        self._thread.start()
+        return self
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        if self._thread.is_alive():
+            self._thread.join(timeout=timeout)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the most recent complete progress block."""
+
+        with self._lock:
+            return dict(self._latest)
+
+    def _run(self) -> None:
+        block: dict[str, str] = {}
+        try:
+            for line in self._stream:
+                key, sep, value = line.strip().partition("=")
+                if not sep:
+                    continue
+                if key != "progress":
+                    block[key] = value
+                    continue
+                snapshot = self._normalize(block, value.strip())
+                block = {}
+                with self._lock:
+                    self._latest = snapshot
+                callback = self._on_update
+                if callback is not None:
+                    try:
+                        callback(dict(snapshot))
+                    except Exception:  # pragma: no cover - defensive
+                        LOGGER.debug("FFmpeg progress callback failed", exc_info=True)
+        except (OSError, ValueError):  # pragma: no cover - pipe closed underneath us
+            LOGGER.debug("FFmpeg progress stream closed", exc_info=True)
+        finally:
+            try:
+                self._stream.close()
+            except Exception:  # pragma: no cover - defensive
+                pass
+
+    @staticmethod
+    def _normalize(block: dict[str, str], state: str) -> dict[str, Any]:
+        out_time_us = _parse_int(block.get("out_time_us", "") or block.get("out_time_ms", ""))
+        speed = _parse_float(block.get("speed", ""))
+        return {
+            "state": state,
+            "frame": _parse_int(block.get("frame", "")),
+            "fps": _parse_float(block.get("fps", "")),
+            "bitrate_kbps": _parse_bitrate(block.get("bitrate", "")),
+            "total_size": _parse_int(block.get("total_size", "")),
+            "out_time_seconds": out_time_us / 1_000_000 if out_time_us is not None else None,
+            "speed": speed,
+            "realtime": speed >= 1.0 if speed is not None else None,
+            "drop_frames": _parse_int(block.get("drop_frames", "")),
+            "dup_frames": _parse_int(block.get("dup_frames", "")),
+            "updated_at": time.time(),
+        }
+
+
+__all__ = ["FFmpegProgressReader"]
@@ -1,15 +1,16 @@
 import { useCallback, useEffect, useMemo, useRef, useState } from 'react';
 import { FontAwesomeIcon } from '@fortawesome/react-fontawesome';
 import { faFaceSmile, faPen, faTrash, faTimesCircle } from '@fortawesome/free-solid-svg-icons';
-import { io } from 'socket.io-client';
 import emojiDictionary from 'emoji-dictionary';
 import LazyRender from './LazyRender.jsx';
 import notificationSound from '../audio/notification_chat.mp3';
 import { fetchChatMentions } from '../lib/api.js';
 import EmojiPicker from './EmojiPicker.jsx';
 import { getGroupTextColor } from '../lib/groupColors.js';
+import { useBackendSocket } from '../hooks/useBackendSocket.js';
 
 const MESSAGE_LIMIT = 50;
+const CHAT_TOPICS = ['chat'];
 const MAX_ATTACHMENTS = 6;
 const TOP_SCROLL_THRESHOLD = 120;
 const BOTTOM_SCROLL_THRESHOLD = 160;
@@ -153,7 +154,6 @@ function ChatPanelBody({
   const [isSending, setIsSending] = useState(false);
   const [sendError, setSendError] = useState(null);
   const [loadError, setLoadError] = useState(null);
-  const [connectionState, setConnectionState] = useState('connecting');
   const [editingMessageId, setEditingMessageId] = useState(null);
   const [emojiSuggestions, setEmojiSuggestions] = useState(null);
   const [mentionCandidates, setMentionCandidates] = useState([]);
@@ -162,7 +162,6 @@ function ChatPanelBody({
   const [reactionPicker, setReactionPicker] = useState(null);
 
   const listRef = useRef(null);
-  const socketRef = useRef(null);
   const messageIdsRef = useRef(new Set());
   const autoScrollRef = useRef(true);
   const composerRef = useRef(null);
@@ -174,31 +173,7 @@ function ChatPanelBody({
   const composerPickerRef = useRef(null);
 
   const baseUrl = useMemo(() => backendBase.replace(/\/$/, ''), [backendBase]);
-  const socketTargets = useMemo(() => {
-    const candidates = [];
-    try {
-      const parsed = new URL(baseUrl);
-      const origin = `${parsed.protocol}//${parsed.host}`;
-      const basePath = parsed.pathname.replace(/\/+$/, '');
-      const primaryPath = `${basePath ? basePath : ''}/socket.io`.replace(/\/{2,}/g, '/');
-      const normalizedPrimary = primaryPath.startsWith('/') ? primaryPath : `/${primaryPath}`;
-      candidates.push({ origin, path: normalizedPrimary });
-      if (normalizedPrimary !== '/socket.io') {
-        candidates.push({ origin, path: '/socket.io' });
-      }
-    } catch {
-      candidates.push({ origin: baseUrl, path: '/socket.io' });
-    }
-    const seen = new Set();
-    return candidates.filter(({ origin, path }) => {
-      const key = `${origin}|${path}`;
-      if (seen.has(key)) {
-        return false;
-      }
-      seen.add(key);
-      return true;
-    });
-  }, [baseUrl]);
+  const { socket, connectionState } = useBackendSocket(backendBase, CHAT_TOPICS);
   const currentUserId = user?.id ?? null;
   const currentSenderKey = useMemo(() => {
     if (viewer?.senderKey) {
@@ -438,6 +413,34 @@ function ChatPanelBody({
     [mentionSuggestions, resizeComposer],
   );
 
+  const normalizeReactions = useCallback(
+    (rawReactions) =>
+      Array.isArray(rawReactions)
+        ? rawReactions
+            .map((reaction) => {
+              const emoji = reaction?.emoji ?? '';
+              if (!emoji) {
+                return null;
+              }
+              const userIds = Array.isArray(reaction?.user_ids)
+                ? reaction.user_ids.map((id) => Number(id))
+                : [];
+              const usernames = Array.isArray(reaction?.users)
+                ? reaction.users.map(String)
+                : [];
+              return {
+                emoji,
+                count: Number(reaction?.count ?? 0),
+                userIds,
+                usernames,
+                reacted: currentUserId != null && userIds.includes(currentUserId),
+              };
+            })
+            .filter(Boolean)
+        : [],
+    [currentUserId],
+  );
+
   const normalizeMessages = useCallback(
     (rawMessages) => {
       if (!Array.isArray(rawMessages)) {
@@ -462,12 +465,21 @@ function ChatPanelBody({
                   if (!relativeUrl) {
                     return null;
                   }
-                  const absoluteUrl = relativeUrl.startsWith('http')
-                    ? relativeUrl
-                    : `${baseUrl}${relativeUrl.startsWith('/') ? '' : '/'}${relativeUrl}`;
+                  const toAbsolute = (value) => {
+                    const candidate = String(value ?? '');
+                    if (!candidate) {
+                      return null;
+                    }
+                    return candidate.startsWith('http')
+                      ? candidate
+                      : `${baseUrl}${candidate.startsWith('/') ? '' : '/'}${candidate}`;
+                  };
+                  const absoluteUrl = toAbsolute(relativeUrl);
                   return {
                     id: attachmentId,
                     url: absoluteUrl,
+                    largeUrl: toAbsolute(attachment?.preview_url),
+                    originalUrl: toAbsolute(attachment?.original_url) ?? absoluteUrl,
                     mimeType: String(attachment?.mime_type ?? ''),
                     fileSize: Number(attachment?.file_size ?? 0),
                     originalName: attachment?.original_name ?? null,
@@ -475,29 +487,7 @@ function ChatPanelBody({
                 })
                 .filter(Boolean)
             : [];
-          const reactions = Array.isArray(raw?.reactions)
-            ? raw.reactions
-                .map((reaction) => {
-                  const emoji = reaction?.emoji ?? '';
-                  if (!emoji) {
-                    return null;
-                  }
-                  const userIds = Array.isArray(reaction?.user_ids)
-                    ? reaction.user_ids.map((id) => Number(id))
-                    : [];
-                  const usernames = Array.isArray(reaction?.users)
-                    ? reaction.users.map(String)
-                    : [];
-                  return {
-                    emoji,
-                    count: Number(reaction?.count ?? 0),
-                    userIds,
-                    usernames,
-                    reacted: currentUserId != null && userIds.includes(currentUserId),
-                  };
-                })
-                .filter(Boolean)
-            : [];
+          const reactions = normalizeReactions(raw?.reactions);
 
           const senderKey = typeof raw?.sender_key === 'string' && raw.sender_key ? raw.sender_key : null;
           const isGuest = Boolean(raw?.is_guest);
@@ -563,7 +553,7 @@ function ChatPanelBody({
         })
         .filter((message) => Number.isFinite(message.id) && message.id > 0);
     },
-    [baseUrl, currentUserId, currentSenderKey],
+    [baseUrl, currentUserId, currentSenderKey, normalizeReactions],
   );
 
   const fetchMessages = useCallback(
@@ -635,6 +625,44 @@ function ChatPanelBody({
     [scrollToBottom],
   );
 
+  const applyReactions = useCallback((messageId, reactions) => {
+    setMessages((prev) => {
+      if (!prev.some((message) => message.id === messageId)) {
+        return prev;
+      }
+      return prev.map((message) => (message.id === messageId ? { ...message, reactions } : message));
+    });
+  }, []);
+
+  const fetchNewerMessages = useCallback(
+    async (afterId) => {
+      const collected = [];
+      let cursor = afterId;
+      // Catch-up pages run forwards until the server reports nothing more.
+      for (;;) {
+        const params = new URLSearchParams({ limit: String(MESSAGE_LIMIT), after_id: String(cursor) });
+        const response = await fetch(`${baseUrl}/chat/messages?${params.toString()}`, {
+          credentials: 'include',
+        });
+        if (response.status === 401) {
+          onUnauthorized?.();
+          return collected;
+        }
+        if (!response.ok) {
+          return collected;
+        }
+        const payload = await response.json();
+        collected.push(...normalizeMessages(payload?.messages));
+        const nextAfter = Number(payload?.next_after_id ?? cursor);
+        if (!payload?.has_more || nextAfter <= cursor) {
+          return collected;
+        }
+        cursor = nextAfter;
+      }
+    },
+    [baseUrl, normalizeMessages, onUnauthorized],
+  );
+
   const removeMessage = useCallback((messageId) => {
     setMessages((prev) => {
       if (!prev.some((message) => message.id === messageId)) {
@@ -797,113 +825,112 @@ function ChatPanelBody({
   }, [currentSenderKey]);
 
   useEffect(() => {
+    if (!socket) {
+      return undefined;
+    }
     let disposed = false;
-    let activeSocket = null;
-    let cleanupSocket = () => {};
-
-    const targets = socketTargets.length
-      ? socketTargets
-      : [{ origin: baseUrl, path: '/socket.io' }];
 
-    const connectWithTarget = (index) => {
-      if (disposed) {
-        return;
-      }
-      const candidate = targets[index];
-      if (!candidate) {
-        setConnectionState('error');
-        return;
-      }
-
-      let manualClose = false;
-      let hasConnected = false;
+    const handleMessage = (payload) => {
+      const normalized = normalizeMessages(Array.isArray(payload) ? payload : [payload]);
+      ingestMessages(normalized);
+      playNotification(normalized);
+    };
 
-      const socket = io(candidate.origin, {
-        path: candidate.path,
-        withCredentials: true,
-      });
+    const handleUpdate = (payload) => {
+      const normalized = normalizeMessages([payload]);
+      ingestMessages(normalized, { allowUpdate: true });
+    };
 
-      activeSocket = socket;
-      socketRef.current = socket;
-      setConnectionState('connecting');
+    const handleDelete = (payload) => {
+      const messageId = Number(payload?.id ?? 0);
+      if (messageId > 0) {
+        removeMessage(messageId);
+      }
+    };
 
-      const handleConnect = () => {
-        hasConnected = true;
-        setConnectionState('connected');
-      };
+    const handleReactions = (payload) => {
+      const messageId = Number(payload?.id ?? 0);
+      if (messageId > 0) {
+        applyReactions(messageId, normalizeReactions(payload?.reactions));
+      }
+    };
 
-      const handleDisconnect = (reason) => {
-        if (disposed || manualClose) {
-          manualClose = false;
-          return;
-        }
-        setConnectionState(reason === 'io server disconnect' ? 'error' : 'disconnected');
-      };
+    const batchHandlers = {
+      'chat:message:update': handleUpdate,
+      'chat:message:delete': handleDelete,
+      'chat:reactions': handleReactions,
+    };
 
-      const handleConnectError = () => {
-        if (disposed) {
+    const handleBatch = (payload) => {
+      const events = Array.isArray(payload?.events) ? payload.events : [];
+      const created = [];
+      events.forEach((entry) => {
+        if (entry?.event === 'chat:message') {
+          created.push(entry.data);
           return;
         }
-        if (hasConnected) {
-          setConnectionState('error');
-          return;
+        if (created.length) {
+          // Keep ordering: flush new messages before an update that may target them.
+          handleMessage(created.splice(0));
         }
-        if (index + 1 < targets.length) {
-          manualClose = true;
-          cleanupSocket();
-          socket.disconnect();
-          connectWithTarget(index + 1);
-        } else {
-          setConnectionState('error');
-        }
-      };
-
-      const handleMessage = (payload) => {
-        const normalized = normalizeMessages([payload]);
-        ingestMessages(normalized);
-        playNotification(normalized);
-      };
-
-      const handleUpdate = (payload) => {
-        const normalized = normalizeMessages([payload]);
-        ingestMessages(normalized, { allowUpdate: true });
-      };
+        batchHandlers[entry?.event]?.(entry?.data);
+      });
+      if (created.length) {
+        handleMessage(created);
+      }
+      // Acknowledge so the server keeps sending; a silent client is skipped and resynced.
+      socket.emit('chat:ack', { seq: payload?.seq ?? null });
+    };
 
-      const handleDelete = (payload) => {
-        const messageId = Number(payload?.id ?? 0);
-        if (messageId > 0) {
-          removeMessage(messageId);
+    const handleResync = async () => {
+      const known = Array.from(messageIdsRef.current);
+      if (!known.length) {
+        return;
+      }
+      try {
+        const newer = await fetchNewerMessages(Math.max(...known));
+        ingestMessages(newer);
+        // Edits, deletes and reactions missed while skipped: refresh the newest page.
+        const latest = await fetchMessages();
+        if (!latest || disposed) {
+          return;
         }
-      };
-
-      cleanupSocket = () => {
-        socket.off('connect', handleConnect);
-        socket.off('disconnect', handleDisconnect);
-        socket.off('connect_error', handleConnectError);
-        socket.off('chat:message', handleMessage);
-        socket.off('chat:message:update', handleUpdate);
-        socket.off('chat:message:delete', handleDelete);
-      };
-
-      socket.on('connect', handleConnect);
-      socket.on('disconnect', handleDisconnect);
-      socket.on('connect_error', handleConnectError);
-      socket.on('chat:message', handleMessage);
-      socket.on('chat:message:update', handleUpdate);
-      socket.on('chat:message:delete', handleDelete);
+        ingestMessages(latest.messages, { allowUpdate: true });
+        const present = new Set(latest.messages.map((message) => message.id));
+        const oldest = latest.messages.length ? latest.messages[0].id : Infinity;
+        known.filter((id) => id >= oldest && !present.has(id)).forEach(removeMessage);
+      } catch {
+        // The next batch or reconnect will try again.
+      }
     };
 
-    connectWithTarget(0);
+    socket.on('chat:message', handleMessage);
+    socket.on('chat:message:update', handleUpdate);
+    socket.on('chat:message:delete', handleDelete);
+    socket.on('chat:reactions', handleReactions);
+    socket.on('chat:batch', handleBatch);
+    socket.on('chat:resync', handleResync);
 
     return () => {
       disposed = true;
-      cleanupSocket();
-      if (activeSocket) {
-        activeSocket.disconnect();
-      }
-      socketRef.current = null;
+      socket.off('chat:message', handleMessage);
+      socket.off('chat:message:update', handleUpdate);
+      socket.off('chat:message:delete', handleDelete);
+      socket.off('chat:reactions', handleReactions);
+      socket.off('chat:batch', handleBatch);
+      socket.off('chat:resync', handleResync);
     };
-  }, [socketTargets, baseUrl, ingestMessages, normalizeMessages, playNotification, removeMessage]);
+  }, [
+    socket,
+    applyReactions,
+    fetchMessages,
+    fetchNewerMessages,
+    ingestMessages,
+    normalizeMessages,
+    normalizeReactions,
+    playNotification,
+    removeMessage,
+  ]);
 
   const handleLoadMore = useCallback(async () => {
     if (!hasMore || loadingMore || !nextBeforeId) {
@@ -1746,13 +1773,15 @@ function MessageBubble({
           {message.attachments.map((attachment) => (
             <a
               key={attachment.id}
-              href={attachment.url}
+              href={attachment.originalUrl ?? attachment.url}
               target="_blank"
               rel="noopener noreferrer"
               className="block max-w-[18rem] overflow-hidden rounded-xl border border-border bg-black/50"
             >
               <img
                 src={attachment.url}
+                srcSet={attachment.largeUrl ? `${attachment.url} 640w, ${attachment.largeUrl} 1600w` : undefined}
+                sizes="18rem"
                 alt={attachment.originalName ?? 'Chat attachment'}
                 className="h-auto w-full max-h-64 object-contain"
                 loading="lazy"
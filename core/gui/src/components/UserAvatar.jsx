@@ -7,15 +7,21 @@ const SIZE_CLASSES = {
   lg: 'h-12 w-12 text-base',
 };
 
+// Largest avatar here is 48px; the server's 96px render covers 2x screens.
+const AVATAR_RENDER_SIZE = 96;
+
 function getAvatarUrl(user, backendBase) {
   if (!user?.avatar_url) {
     return null;
   }
-  if (user.avatar_url.startsWith('http')) {
-    return user.avatar_url;
+  const sized = user.avatar_url.includes('?')
+    ? user.avatar_url
+    : `${user.avatar_url}?size=${AVATAR_RENDER_SIZE}`;
+  if (sized.startsWith('http')) {
+    return sized;
   }
   const base = (backendBase || '').replace(/\/$/, '');
-  const relativePath = user.avatar_url.startsWith('/') ? user.avatar_url : `/${user.avatar_url}`;
+  const relativePath = sized.startsWith('/') ? sized : `/${sized}`;
   return `${base}${relativePath}`;
 }
 
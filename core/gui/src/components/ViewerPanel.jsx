@@ -1,7 +1,11 @@
 import { useCallback, useEffect, useState } from 'react';
 import { backendFetch } from '../lib/backend.js';
+import { useBackendSocket } from '../hooks/useBackendSocket.js';
 
-const REFRESH_INTERVAL_MS = 5000;
+// Live counts arrive over Socket.IO; polling only covers a dropped socket.
+const REFRESH_INTERVAL_MS = 30000;
+
+const VIEWER_TOPICS = ['viewers'];
 
 export default function ViewerPanel({ backendBase, viewer, viewerReady, loadingViewer }) {
   const [activeUsers, setActiveUsers] = useState([]);
@@ -10,6 +14,30 @@ export default function ViewerPanel({ backendBase, viewer, viewerReady, loadingV
   const [totalCount, setTotalCount] = useState(0);
   const [error, setError] = useState(null);
   const [pending, setPending] = useState(false);
+  const { socket } = useBackendSocket(backendBase, VIEWER_TOPICS);
+
+  const applyViewers = useCallback((payload) => {
+    const users = Array.isArray(payload?.users)
+      ? payload.users
+          .map((userItem) => ({
+            userId: userItem?.user_id ?? null,
+            username: userItem?.username ?? 'Unknown',
+            isAdmin: Boolean(userItem?.is_admin),
+          }))
+      : [];
+    setActiveUsers(users);
+    const guestTotal = Number.isFinite(payload?.guest_count) ? Number(payload.guest_count) : 0;
+    const signedTotal = Number.isFinite(payload?.signed_in_count)
+      ? Number(payload.signed_in_count)
+      : users.length;
+    const aggregate = Number.isFinite(payload?.total_count)
+      ? Number(payload.total_count)
+      : signedTotal + guestTotal;
+    setGuestCount(guestTotal);
+    setSignedInCount(signedTotal);
+    setTotalCount(aggregate);
+    setError(null);
+  }, []);
 
   const loadViewers = useCallback(async () => {
     try {
@@ -18,32 +46,13 @@ export default function ViewerPanel({ backendBase, viewer, viewerReady, loadingV
       if (!response.ok) {
         throw new Error(payload?.error || `Viewer list failed (${response.status})`);
       }
-      const users = Array.isArray(payload?.users)
-        ? payload.users
-            .map((userItem) => ({
-              userId: userItem?.user_id ?? null,
-              username: userItem?.username ?? 'Unknown',
-              isAdmin: Boolean(userItem?.is_admin),
-            }))
-        : [];
-      setActiveUsers(users);
-      const guestTotal = Number.isFinite(payload?.guest_count) ? Number(payload.guest_count) : 0;
-      const signedTotal = Number.isFinite(payload?.signed_in_count)
-        ? Number(payload.signed_in_count)
-        : users.length;
-      const aggregate = Number.isFinite(payload?.total_count)
-        ? Number(payload.total_count)
-        : signedTotal + guestTotal;
-      setGuestCount(guestTotal);
-      setSignedInCount(signedTotal);
-      setTotalCount(aggregate);
-      setError(null);
+      applyViewers(payload);
     } catch (err) {
       setError(err instanceof Error ? err.message : 'Unable to load viewers');
     } finally {
       setPending(false);
     }
-  }, [backendBase]);
+  }, [applyViewers, backendBase]);
 
   useEffect(() => {
     if (!viewerReady) {
@@ -64,6 +73,16 @@ export default function ViewerPanel({ backendBase, viewer, viewerReady, loadingV
     };
   }, [loadViewers, viewerReady]);
 
+  useEffect(() => {
+    if (!socket) {
+      return undefined;
+    }
+    socket.on('viewers:update', applyViewers);
+    return () => {
+      socket.off('viewers:update', applyViewers);
+    };
+  }, [applyViewers, socket]);
+
   return (
     <div className="flex min-h-0 flex-1 flex-col bg-transparent">
       <header className="flex items-center justify-between border-b border-border/80 px-6 py-4">
@@ -9,6 +9,7 @@ export default function LibraryGridImage({ item, shouldLoad }) {
   const [posterError, setPosterError] = useState(false);
   const [posterSrc, setPosterSrc] = useState(null);
   const posterPath = item?.thumb ?? null;
+  const inlinePlaceholder = item?.thumb_placeholder ?? null;
   const showUnavailableMessage = shouldLoad && (posterError || !posterPath);
 
   useEffect(() => {
@@ -31,12 +32,12 @@ export default function LibraryGridImage({ item, shouldLoad }) {
   return (
     <div className="relative aspect-[2/3] w-full overflow-hidden bg-border/40">
       <img
-        src={placeholderPoster}
+        src={inlinePlaceholder ?? placeholderPoster}
         alt=""
         aria-hidden="true"
         className={`absolute inset-0 h-full w-full object-cover transition-opacity duration-300 ${
-          imageLoaded && !posterError ? 'opacity-0' : 'opacity-100'
-        }`}
+          inlinePlaceholder ? 'scale-110 blur-md' : ''
+        } ${imageLoaded && !posterError ? 'opacity-0' : 'opacity-100'}`}
       />
       {posterSrc ? (
         <img
@@ -1,4 +1,4 @@
-import { useMemo } from 'react';
+import { useEffect, useMemo, useState } from 'react';
 import { FontAwesomeIcon } from '@fortawesome/react-fontawesome';
 import { faChevronLeft, faCircleNotch } from '@fortawesome/free-solid-svg-icons';
 import StatList from '../components/StatList.jsx';
@@ -6,6 +6,7 @@ import TagList from '../components/TagList.jsx';
 import ChildList from '../components/ChildList.jsx';
 import RelatedGroup from '../components/RelatedGroup.jsx';
 import PeopleCarousel from '../components/PeopleCarousel.jsx';
+import { fetchPlexItemSection } from '../../../lib/api.js';
 import {
   childGroupLabel,
   detectRatingProvider,
@@ -37,6 +38,35 @@ export default function LibraryDetailsPane({
   playPending,
   playError,
 }) {
+  const [lazyRelated, setLazyRelated] = useState({ ratingKey: null, hubs: [] });
+  const detailsRatingKey = detailsState?.data?.item?.rating_key ?? null;
+  const embeddedRelated = detailsState?.data?.related;
+
+  useEffect(() => {
+    if (!detailsRatingKey || Array.isArray(embeddedRelated)) {
+      return undefined;
+    }
+    let cancelled = false;
+    (async () => {
+      try {
+        const data = await fetchPlexItemSection(detailsRatingKey, 'related');
+        if (!cancelled) {
+          setLazyRelated({
+            ratingKey: detailsRatingKey,
+            hubs: Array.isArray(data?.related) ? data.related : [],
+          });
+        }
+      } catch (error) {
+        if (!cancelled) {
+          setLazyRelated({ ratingKey: detailsRatingKey, hubs: [] });
+        }
+      }
+    })();
+    return () => {
+      cancelled = true;
+    };
+  }, [detailsRatingKey, embeddedRelated]);
+
   const {
     heroImage,
     posterImage,
@@ -182,7 +212,12 @@ export default function LibraryDetailsPane({
     const timelineStats = filterStatEntries(timelineStatEntries);
 
     const children = details.children ?? {};
-    const relatedHubs = Array.isArray(details.related) ? details.related : [];
+    let relatedHubs = [];
+    if (Array.isArray(details.related)) {
+      relatedHubs = details.related;
+    } else if (lazyRelated.ratingKey && lazyRelated.ratingKey === details.item?.rating_key) {
+      relatedHubs = lazyRelated.hubs;
+    }
 
     const crewMap = new Map();
     const addPeople = (list, roleLabel) => {
@@ -236,7 +271,7 @@ export default function LibraryDetailsPane({
       relatedHubs,
       crewPeople,
     };
-  }, [detailsState?.data, selectedItem]);
+  }, [detailsState?.data, lazyRelated, selectedItem]);
 
   if (!selectedItem) {
     return <div className="flex flex-1 items-center justify-center text-sm text-muted">Select an item to view details.</div>;
@@ -0,0 +1,155 @@
+import { useEffect, useState } from 'react';
+import { io } from 'socket.io-client';
+
+// One Socket.IO connection per backend, shared by every panel that needs live
+// events. Each consumer joins its own topics on it and detaches its handlers.
+const connections = new Map();
+
+export function socketTargets(backendBase) {
+  const baseUrl = (backendBase || '').replace(/\/$/, '');
+  const candidates = [];
+  try {
+    const parsed = new URL(baseUrl);
+    const origin = `${parsed.protocol}//${parsed.host}`;
+    const basePath = parsed.pathname.replace(/\/+$/, '');
+    const primaryPath = `${basePath ? basePath : ''}/socket.io`.replace(/\/{2,}/g, '/');
+    const normalizedPrimary = primaryPath.startsWith('/') ? primaryPath : `/${primaryPath}`;
+    candidates.push({ origin, path: normalizedPrimary });
+    if (normalizedPrimary !== '/socket.io') {
+      candidates.push({ origin, path: '/socket.io' });
+    }
+  } catch {
+    candidates.push({ origin: baseUrl || undefined, path: '/socket.io' });
+  }
+  const seen = new Set();
+  return candidates.filter(({ origin, path }) => {
+    const key = `${origin}|${path}`;
+    if (seen.has(key)) {
+      return false;
+    }
+    seen.add(key);
+    return true;
+  });
+}
+
+function openConnection(baseUrl) {
+  const targets = socketTargets(baseUrl);
+  const connection = {
+    socket: null,
+    state: 'connecting',
+    refs: 0,
+    closed: false,
+    listeners: new Set(),
+  };
+
+  const setState = (state) => {
+    connection.state = state;
+    connection.listeners.forEach((listener) => listener());
+  };
+
+  const connectWithTarget = (index) => {
+    const candidate = targets[index];
+    if (!candidate) {
+      setState('error');
+      return;
+    }
+    let hasConnected = false;
+    let manualClose = false;
+    const socket = io(candidate.origin, { path: candidate.path, withCredentials: true });
+    connection.socket = socket;
+    setState('connecting');
+
+    socket.on('connect', () => {
+      hasConnected = true;
+      setState('connected');
+    });
+    socket.on('disconnect', (reason) => {
+      if (connection.closed || manualClose) {
+        return;
+      }
+      setState(reason === 'io server disconnect' ? 'error' : 'disconnected');
+    });
+    socket.on('connect_error', () => {
+      if (connection.closed) {
+        return;
+      }
+      if (hasConnected) {
+        setState('error');
+        return;
+      }
+      if (index + 1 < targets.length) {
+        // Consumers move their handlers over when they see the new socket.
+        manualClose = true;
+        socket.removeAllListeners();
+        socket.disconnect();
+        connectWithTarget(index + 1);
+      } else {
+        setState('error');
+      }
+    });
+  };
+
+  connection.close = () => {
+    connection.closed = true;
+    connection.socket?.disconnect();
+  };
+  connectWithTarget(0);
+  return connection;
+}
+
+export function useBackendSocket(backendBase, topics = []) {
+  const baseUrl = (backendBase || '').replace(/\/$/, '');
+  const topicKey = topics.join(',');
+  const [snapshot, setSnapshot] = useState({ socket: null, connectionState: 'connecting' });
+
+  useEffect(() => {
+    let connection = connections.get(baseUrl);
+    if (!connection) {
+      connection = openConnection(baseUrl);
+      connections.set(baseUrl, connection);
+    }
+    connection.refs += 1;
+    const sync = () => {
+      setSnapshot({ socket: connection.socket, connectionState: connection.state });
+    };
+    connection.listeners.add(sync);
+    sync();
+    return () => {
+      connection.listeners.delete(sync);
+      connection.refs -= 1;
+      // Deferred so switching between panels hands the socket over instead of reconnecting.
+      window.setTimeout(() => {
+        if (connection.refs <= 0 && connections.get(baseUrl) === connection) {
+          connections.delete(baseUrl);
+          connection.close();
+        }
+      }, 0);
+    };
+  }, [baseUrl]);
+
+  const { socket } = snapshot;
+  useEffect(() => {
+    const subscribed = topicKey ? topicKey.split(',') : [];
+    if (!socket || !subscribed.length) {
+      return undefined;
+    }
+    // Rooms are per-connection, so resubscribe after every (re)connect.
+    const subscribe = () => {
+      socket.emit('subscribe', { topics: subscribed });
+    };
+    socket.on('connect', subscribe);
+    if (socket.connected) {
+      subscribe();
+    }
+    return () => {
+      socket.off('connect', subscribe);
+      if (socket.connected) {
+        socket.emit('unsubscribe', { topics: subscribed });
+      }
+    };
+  }, [socket, topicKey]);
+
+  return snapshot;
+}
+
+export default useBackendSocket;
@@ -310,6 +310,12 @@ export async function fetchPlexItemDetails(ratingKey) {
   return apiRequest(`/library/plex/items/${encodeURIComponent(ratingKey)}`);
 }
 
+export async function fetchPlexItemSection(ratingKey, section) {
+  return apiRequest(
+    `/library/plex/items/${encodeURIComponent(ratingKey)}/${encodeURIComponent(section)}`,
+  );
+}
+
 export async function refreshPlexItemDetails(ratingKey) {
   return apiRequest(`/library/plex/items/${encodeURIComponent(ratingKey)}/refresh`, {
     method: 'POST',
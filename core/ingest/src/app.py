@@ -1,17 +1,30 @@
 from __future__ import annotations
 
+import base64
+import hashlib
 import logging
 import os
 import shutil
+import tempfile
 from pathlib import Path
-from typing import Tuple
+from typing import IO, Optional, Tuple
 
 from flask import Flask, Response, abort, jsonify, request, send_file
 
 from .logging_config import configure_logging
+from .segment_cache import CachedFile, SegmentCache, cache_control, classify, env_int
 
 LOGGER = logging.getLogger(__name__)
 
+CHUNK_SIZE = 1024 * 1024
+TEMP_SUFFIX = ".part"
+DIGEST_ALGORITHMS = {"sha-256": "sha256", "sha-512": "sha512", "md5": "md5"}
+
+
+class UploadRejected(Exception):
+    """Raised when an upload does not match its declared length or digest."""
+
+
 def _resolve_root() -> Path:
     env_root = (
         os.getenv("INGEST_ROOT")
@@ -31,18 +44,110 @@ def _within_root(root: Path, target: Path) -> bool:
         return False
 
 
+def _parse_digest(header: Optional[str]) -> Optional[Tuple[str, bytes]]:
+    """Return the first supported ``(algorithm, digest)`` from an RFC 3230 ``Digest`` header."""
+
+    if not header:
+        return None
+    for entry in header.split(","):
+        name, sep, value = entry.strip().partition("=")
+        algorithm = DIGEST_ALGORITHMS.get(name.strip().lower())
+        if not sep or algorithm is None:
+            continue
+        try:
+            return algorithm, base64.b64decode(value.strip(), validate=True)
+        except ValueError:
+            raise UploadRejected(f"malformed {name} digest") from None
+    return None
+
+
+def _write_atomic(
+    target: Path,
+    stream: IO[bytes],
+    *,
+    expected_length: Optional[int] = None,
+    expected_digest: Optional[Tuple[str, bytes]] = None,
+    capture: bool = False,
+) -> Optional[Tuple[bytes, os.stat_result]]:
+    """Stream ``stream`` into a sibling temp file and rename it over ``target``.
+
+    Readers see either the previous file or the complete new one, never a
+    partial write. The upload is discarded if it does not match
+    ``expected_length`` or ``expected_digest``. With ``capture`` the body is
+    also returned, with the stat of the published file, so it can be cached.
+    """
+
+    hasher = hashlib.new(expected_digest[0]) if expected_digest else None
+    fd, temp_name = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.", suffix=TEMP_SUFFIX)
+    temp_path = Path(temp_name)
+    captured: Optional[list[bytes]] = [] if capture else None
+    try:
+        written = 0
+        with os.fdopen(fd, "wb") as fh:
+            while True:
+                chunk = stream.read(CHUNK_SIZE)
+                if not chunk:
+                    break
+                fh.write(chunk)
+                written += len(chunk)
+                if hasher is not None:
+                    hasher.update(chunk)
+                if captured is not None:
+                    captured.append(chunk)
+        if expected_length is not None and written != expected_length:
+            raise UploadRejected(f"expected {expected_length} bytes, received {written}")
+        if hasher is not None and hasher.digest() != expected_digest[1]:  # type: ignore[index]
+            raise UploadRejected("digest mismatch")
+        os.chmod(temp_path, 0o644)
+        # Taken before the rename: the inode and mtime carry over to ``target``.
+        info = temp_path.stat()
+        os.replace(temp_path, target)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+    return (b"".join(captured), info) if captured is not None else None
+
+
+def _cached_response(entry: CachedFile) -> Response:
+    """Serve a cached file, honouring ETags, ranges and gzip for manifests."""
+
+    use_gzip = entry.gzipped is not None and request.accept_encodings["gzip"] > 0
+    body = entry.gzipped if use_gzip else entry.body
+    response = Response(body, mimetype=entry.mimetype)
+    response.set_etag(f"{entry.etag}-gz" if use_gzip else entry.etag)
+    response.last_modified = entry.last_modified
+    response.headers["Cache-Control"] = cache_control(entry.kind)
+    if entry.gzipped is not None:
+        response.vary.add("Accept-Encoding")
+    if use_gzip:
+        response.headers["Content-Encoding"] = "gzip"
+    return response.make_conditional(request, accept_ranges=not use_gzip, complete_length=None if use_gzip else len(body))
+
+
 def create_app() -> Flask:
     configure_logging()
     app = Flask(__name__)
     root = _resolve_root()
     app.config["INGEST_ROOT"] = root
     LOGGER.info("Ingest root set to %s", root)
+    cache = SegmentCache(
+        segments_per_dir=env_int("INGEST_CACHE_SEGMENTS", 8),
+        max_bytes=env_int("INGEST_CACHE_MAX_BYTES", 256 * 1024 * 1024),
+        max_item_bytes=env_int("INGEST_CACHE_MAX_ITEM_BYTES", 16 * 1024 * 1024),
+    )
+    app.extensions["segment_cache"] = cache
+    if cache.enabled:
+        LOGGER.info(
+            "Origin cache keeps %d segments per session (max %d bytes)",
+            cache.segments_per_dir,
+            cache.max_bytes,
+        )
 
     @app.after_request
     def _apply_cors_headers(response: Response) -> Response:
         response.headers.setdefault("Access-Control-Allow-Origin", "*")
         response.headers.setdefault(
-            "Access-Control-Allow-Methods", "GET,HEAD,OPTIONS,PUT,DELETE"
+            "Access-Control-Allow-Methods", "GET,HEAD,OPTIONS,PUT,POST,DELETE"
         )
         response.headers.setdefault(
             "Access-Control-Allow-Headers",
@@ -60,17 +165,87 @@ def create_app() -> Flask:
         files: list[str] = []
         directories: list[str] = []
         for entry in sorted(path.iterdir()):
+            if entry.name.startswith(".") and entry.name.endswith(TEMP_SUFFIX):
+                continue
             if entry.is_dir():
                 directories.append(entry.name)
             else:
                 files.append(entry.name)
         return directories, files
 
+    def _send_from_disk(path: Path) -> Response:
+        response = send_file(path, conditional=True)
+        response.headers["Cache-Control"] = cache_control(classify(path.name))
+        return response
+
+    def _store_upload(
+        full_path: Path,
+        stream: IO[bytes],
+        *,
+        expected_length: Optional[int],
+        digest_header: Optional[str],
+    ) -> None:
+        cache_key = full_path.relative_to(root).as_posix()
+        full_path.parent.mkdir(parents=True, exist_ok=True)
+        captured = _write_atomic(
+            full_path,
+            stream,
+            expected_length=expected_length,
+            expected_digest=_parse_digest(digest_header),
+            capture=cache.accepts(cache_key, expected_length),
+        )
+        if captured is not None:
+            cache.store(cache_key, *captured)
+        else:
+            cache.discard(cache_key)
+
+    @app.route("/media/", defaults={"requested_path": ""}, methods=["POST"])
+    @app.route("/media/<path:requested_path>", methods=["POST"])
+    def batch_handler(requested_path: str) -> Response:
+        """Store every part of a multipart body as a file below ``requested_path``.
+
+        Each part's field name is the file path relative to the request path.
+        An optional per-part ``Digest`` header is verified like on PUT. Every
+        file is published atomically on its own and reported individually;
+        the response is 200 when all succeeded and 207 otherwise.
+        """
+
+        base = _resolve_path(requested_path)
+        if base.exists() and not base.is_dir():
+            return Response(status=409)
+        results: list[dict[str, object]] = []
+        for name, upload in request.files.items(multi=True):
+            entry: dict[str, object] = {"path": name}
+            candidate = (base / name).resolve()
+            if not name or not _within_root(root, candidate) or candidate == root:
+                entry.update(status=403, error="path outside ingest root")
+            elif candidate.is_dir():
+                entry.update(status=409, error="path is a directory")
+            else:
+                length = upload.headers.get("Content-Length")
+                try:
+                    _store_upload(
+                        candidate,
+                        upload.stream,
+                        expected_length=int(length) if length and length.isdigit() else None,
+                        digest_header=upload.headers.get("Digest"),
+                    )
+                except UploadRejected as exc:
+                    LOGGER.warning("Rejected batch entry %s/%s: %s", requested_path, name, exc)
+                    entry.update(status=400, error=str(exc))
+                else:
+                    entry["status"] = 201
+            results.append(entry)
+        if not results:
+            return jsonify({"error": "no files in request", "results": []}), 400
+        failed = any(entry["status"] != 201 for entry in results)
+        return jsonify({"results": results}), 207 if failed else 200
+
     @app.route("/media/", defaults={"requested_path": ""}, methods=["OPTIONS"])
     @app.route("/media/<path:requested_path>", methods=["OPTIONS"])
     def options_handler(requested_path: str) -> Response:
         response = Response(status=204)
-        response.headers["Allow"] = "GET,HEAD,OPTIONS,PUT,DELETE,MKCOL"
+        response.headers["Allow"] = "GET,HEAD,OPTIONS,PUT,POST,DELETE,MKCOL"
         return response
 
     @app.route(
@@ -84,6 +259,7 @@ def create_app() -> Flask:
     )
     def media_handler(requested_path: str) -> Response:
         full_path = _resolve_path(requested_path)
+        cache_key = full_path.relative_to(root).as_posix()
         method = request.method
 
         if method == "MKCOL":
@@ -100,12 +276,20 @@ def create_app() -> Flask:
         if method == "PUT":
             if full_path.exists() and full_path.is_dir():
                 return Response(status=409)
-            full_path.parent.mkdir(parents=True, exist_ok=True)
-            with full_path.open("wb") as fh:
-                shutil.copyfileobj(request.stream, fh)
+            try:
+                _store_upload(
+                    full_path,
+                    request.stream,
+                    expected_length=request.content_length,
+                    digest_header=request.headers.get("Digest"),
+                )
+            except UploadRejected as exc:
+                LOGGER.warning("Rejected upload to %s: %s", requested_path, exc)
+                return Response(str(exc), status=400)
             return Response(status=201)
 
         if method == "DELETE":
+            cache.discard_tree(cache_key)
             if not full_path.exists():
                 return Response(status=404)
             if full_path.is_dir():
@@ -114,15 +298,19 @@ def create_app() -> Flask:
                 full_path.unlink()
             return Response(status=204)
 
+        cached = cache.get(cache_key, full_path)
+        if cached is not None:
+            return _cached_response(cached)
+
         if method == "HEAD":
             if not full_path.exists() or not full_path.is_file():
                 return Response(status=404)
-            return send_file(full_path, conditional=True)
+            return _send_from_disk(full_path)
 
         if not full_path.exists():
             return Response(status=404)
         if full_path.is_file():
-            return send_file(full_path, conditional=True)
+            return _send_from_disk(full_path)
         directories, files = _list_directory(full_path)
         return jsonify({"directories": directories, "files": files})
 
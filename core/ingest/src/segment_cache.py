@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+import gzip
+import hashlib
+import mimetypes
+import os
+import stat
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path, PurePosixPath
+from typing import Dict, Optional, Tuple
+
+MANIFEST_SUFFIXES = {".mpd", ".m3u8"}
+SEGMENT_SUFFIXES = {".m4s", ".mp4", ".m4a", ".m4v", ".ts", ".vtt", ".webm", ".cmfv", ".cmfa"}
+MIME_OVERRIDES = {
+    ".mpd": "application/dash+xml",
+    ".m3u8": "application/vnd.apple.mpegurl",
+    ".m4s": "video/iso.segment",
+    ".vtt": "text/vtt",
+}
+
+KIND_MANIFEST = "manifest"
+KIND_INIT = "init"
+KIND_SEGMENT = "segment"
+KIND_OTHER = "other"
+
+
+def env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+MANIFEST_MAX_AGE = env_int("INGEST_MANIFEST_MAX_AGE", 1)
+SEGMENT_MAX_AGE = env_int("INGEST_SEGMENT_MAX_AGE", 31_536_000)
+
+
+def classify(path: str) -> str:
+    """Return the delivery class of ``path`` based on its file name."""
+
+    name = PurePosixPath(path).name.lower()
+    suffix = PurePosixPath(name).suffix
+    if suffix in MANIFEST_SUFFIXES:
+        return KIND_MANIFEST
+    if suffix in SEGMENT_SUFFIXES:
+        return KIND_INIT if "init" in name else KIND_SEGMENT
+    return KIND_OTHER
+
+
+def cache_control(kind: str) -> str:
+    """Return the ``Cache-Control`` value for a delivery class.
+
+    Session output lives in per-session directories, so segment and init
+    names are never reused for different bytes and can be immutable.
+    Manifests change every segment and must be revalidated.
+    """
+
+    if kind in (KIND_SEGMENT, KIND_INIT):
+        return f"public, max-age={SEGMENT_MAX_AGE}, immutable"
+    if kind == KIND_MANIFEST:
+        return f"public, max-age={MANIFEST_MAX_AGE}, must-revalidate"
+    return "no-cache"
+
+
+def file_identity(info: os.stat_result) -> Tuple[int, int, int]:
+    """Return what changes whenever a file is replaced: inode, mtime and size."""
+
+    return info.st_ino, info.st_mtime_ns, info.st_size
+
+
+def guess_mimetype(path: str) -> str:
+    suffix = PurePosixPath(path).suffix.lower()
+    if suffix in MIME_OVERRIDES:
+        return MIME_OVERRIDES[suffix]
+    return mimetypes.guess_type(path)[0] or "application/octet-stream"
+
+
+@dataclass(frozen=True)
+class CachedFile:
+    body: bytes
+    etag: str
+    kind: str
+    mimetype: str
+    last_modified: float
+    identity: Tuple[int, int, int]
+    gzipped: Optional[bytes] = None
+
+
+class SegmentCache:
+    """Bounded in-memory copy of the live edge of every session directory.
+
+    Per directory it keeps the current manifests, pinned init segments and
+    the newest ``segments_per_dir`` media segments. Once ``max_bytes`` is
+    exceeded, media segments are evicted oldest-first across all
+    directories, then manifests and init segments least recently stored.
+
+    Each worker process has its own cache, filled from the uploads it
+    handled and from disk reads. Entries remember the file's identity
+    (inode, mtime, size) and are dropped when the file on disk no longer
+    matches, so a file replaced or deleted through another worker is never
+    served stale. Uploads use ``os.replace``, which always yields a new
+    inode, so one ``stat`` per read is enough.
+    """
+
+    def __init__(self, *, segments_per_dir: int, max_bytes: int, max_item_bytes: int) -> None:
+        self.segments_per_dir = max(0, segments_per_dir)
+        self.max_bytes = max(0, max_bytes)
+        self.max_item_bytes = max(0, max_item_bytes)
+        self._lock = threading.Lock()
+        self._entries: Dict[str, CachedFile] = {}
+        self._segments: "OrderedDict[str, None]" = OrderedDict()
+        self._pinned: "OrderedDict[str, None]" = OrderedDict()
+        self._per_dir: Dict[str, "OrderedDict[str, None]"] = {}
+        self._bytes = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.segments_per_dir > 0 and self.max_bytes > 0
+
+    def accepts(self, path: str, size: Optional[int]) -> bool:
+        """Return whether an upload of ``size`` bytes to ``path`` should be captured."""
+
+        if not self.enabled or classify(path) == KIND_OTHER:
+            return False
+        return size is None or size <= self.max_item_bytes
+
+    def get(self, path: str, source: Path) -> Optional[CachedFile]:
+        """Return the entry for ``path`` if ``source`` on disk is still the file it holds.
+
+        On a miss a cacheable ``source`` is read into the cache, so every
+        worker serves the same bytes and ETag.
+        """
+
+        with self._lock:
+            entry = self._entries.get(path)
+        if entry is not None:
+            try:
+                current = file_identity(os.stat(source))
+            except OSError:
+                current = None
+            if current == entry.identity:
+                return entry
+            self.discard(path)
+            if current is None:
+                return None
+        return self._load(path, source)
+
+    def store(self, path: str, body: bytes, info: os.stat_result) -> None:
+        """Cache ``body`` as the content of ``path``, whose file on disk has ``info``."""
+
+        kind = classify(path)
+        if not self.enabled or kind == KIND_OTHER or len(body) > self.max_item_bytes:
+            self.discard(path)
+            return
+        entry = CachedFile(
+            body=body,
+            etag=hashlib.blake2b(body, digest_size=16).hexdigest(),
+            kind=kind,
+            mimetype=guess_mimetype(path),
+            last_modified=info.st_mtime,
+            identity=file_identity(info),
+            gzipped=gzip.compress(body, compresslevel=6) if kind == KIND_MANIFEST else None,
+        )
+        directory = str(PurePosixPath(path).parent)
+        with self._lock:
+            self._remove_locked(path)
+            self._entries[path] = entry
+            self._bytes += len(body)
+            if kind == KIND_SEGMENT:
+                self._segments[path] = None
+                recent = self._per_dir.setdefault(directory, OrderedDict())
+                recent[path] = None
+                while len(recent) > self.segments_per_dir:
+                    oldest, _ = recent.popitem(last=False)
+                    self._remove_locked(oldest)
+            else:
+                self._pinned[path] = None
+            while self._bytes > self.max_bytes and (self._segments or self._pinned):
+                oldest = next(iter(self._segments or self._pinned))
+                self._remove_locked(oldest)
+
+    def discard(self, path: str) -> None:
+        with self._lock:
+            self._remove_locked(path)
+
+    def discard_tree(self, prefix: str) -> None:
+        """Drop every entry at or below the directory ``prefix``."""
+
+        base = prefix.strip("/")
+        with self._lock:
+            doomed = [
+                path
+                for path in self._entries
+                if not base or path == base or path.startswith(f"{base}/")
+            ]
+            for path in doomed:
+                self._remove_locked(path)
+
+    def _load(self, path: str, source: Path) -> Optional[CachedFile]:
+        if not self.enabled or classify(path) == KIND_OTHER:
+            return None
+        try:
+            with open(source, "rb") as handle:
+                # fstat describes the file actually read, even if it is replaced meanwhile.
+                info = os.fstat(handle.fileno())
+                if not stat.S_ISREG(info.st_mode) or info.st_size > self.max_item_bytes:
+                    return None
+                body = handle.read()
+        except OSError:
+            return None
+        self.store(path, body, info)
+        with self._lock:
+            return self._entries.get(path)
+
+    def _remove_locked(self, path: str) -> None:
+        entry = self._entries.pop(path, None)
+        if entry is None:
+            return
+        self._bytes -= len(entry.body)
+        self._segments.pop(path, None)
+        self._pinned.pop(path, None)
+        directory = str(PurePosixPath(path).parent)
+        recent = self._per_dir.get(directory)
+        if recent is not None:
+            recent.pop(path, None)
+            if not recent:
+                self._per_dir.pop(directory, None)
+
+
+__all__ = [
+    "CachedFile",
+    "SegmentCache",
+    "cache_control",
+    "classify",
+    "env_int",
+    "file_identity",
+    "guess_mimetype",
+]
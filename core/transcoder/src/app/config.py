@@ -22,6 +22,9 @@ from .constants import (
     DEFAULT_STATUS_NAMESPACE,
     DEFAULT_STATUS_PREFIX,
     DEFAULT_STATUS_REDIS_URL,
+    DEFAULT_STATUS_STREAM,
+    DEFAULT_STATUS_STREAM_MAXLEN,
+    DEFAULT_STATUS_TELEMETRY_SECONDS,
     DEFAULT_STATUS_TTL_SECONDS,
 )
 
@@ -50,7 +53,10 @@ def build_default_config() -> Dict[str, Any]:
         "TRANSCODER_STATUS_NAMESPACE": DEFAULT_STATUS_NAMESPACE,
         "TRANSCODER_STATUS_KEY": DEFAULT_STATUS_KEY,
         "TRANSCODER_STATUS_CHANNEL": DEFAULT_STATUS_CHANNEL,
+        "TRANSCODER_STATUS_STREAM": DEFAULT_STATUS_STREAM,
+        "TRANSCODER_STATUS_STREAM_MAXLEN": DEFAULT_STATUS_STREAM_MAXLEN,
         "TRANSCODER_STATUS_TTL_SECONDS": DEFAULT_STATUS_TTL_SECONDS,
         "TRANSCODER_STATUS_HEARTBEAT_SECONDS": DEFAULT_STATUS_HEARTBEAT_SECONDS,
+        "TRANSCODER_STATUS_TELEMETRY_SECONDS": DEFAULT_STATUS_TELEMETRY_SECONDS,
     }
     return cfg
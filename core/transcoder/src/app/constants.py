@@ -19,6 +19,9 @@ from .local_defaults import (
     DEFAULT_STATUS_NAMESPACE,
     DEFAULT_STATUS_PREFIX,
     DEFAULT_STATUS_REDIS_URL,
+    DEFAULT_STATUS_STREAM,
+    DEFAULT_STATUS_STREAM_MAXLEN,
+    DEFAULT_STATUS_TELEMETRY_SECONDS,
     DEFAULT_STATUS_TTL_SECONDS,
     DEFAULT_CELERY_TASK_TIMEOUT_SECONDS,
     PROJECT_ROOT,
@@ -43,6 +46,9 @@ __all__ = [
     "DEFAULT_STATUS_NAMESPACE",
     "DEFAULT_STATUS_PREFIX",
     "DEFAULT_STATUS_REDIS_URL",
+    "DEFAULT_STATUS_STREAM",
+    "DEFAULT_STATUS_STREAM_MAXLEN",
+    "DEFAULT_STATUS_TELEMETRY_SECONDS",
     "DEFAULT_STATUS_TTL_SECONDS",
     "DEFAULT_CELERY_TASK_TIMEOUT_SECONDS",
     "PROJECT_ROOT",
@@ -16,6 +16,8 @@ def init_status_broadcaster(app: Flask) -> TranscoderStatusBroadcaster:
         key=app.config.get("TRANSCODER_STATUS_KEY", "status"),
         channel=app.config.get("TRANSCODER_STATUS_CHANNEL"),
         ttl_seconds=int(app.config.get("TRANSCODER_STATUS_TTL_SECONDS", 30) or 0),
+        stream=app.config.get("TRANSCODER_STATUS_STREAM"),
+        stream_maxlen=int(app.config.get("TRANSCODER_STATUS_STREAM_MAXLEN", 1000) or 1000),
     )
     app.extensions["transcoder_status_broadcaster"] = status_broadcaster
     if not status_broadcaster.available:
@@ -31,6 +33,7 @@ def init_transcoder_controller(
     controller = TranscoderController(
         status_broadcaster=status_broadcaster,
         heartbeat_interval=int(app.config.get("TRANSCODER_STATUS_HEARTBEAT_SECONDS", 5) or 5),
+        telemetry_interval=float(app.config.get("TRANSCODER_STATUS_TELEMETRY_SECONDS", 2) or 2),
     )
     app.extensions["transcoder_controller"] = controller
     controller.broadcast_status()
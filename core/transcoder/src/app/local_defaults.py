@@ -74,6 +74,15 @@ DEFAULT_STATUS_CHANNEL = os.getenv(
     "transcoder:transcoder:status",
 )
 
+DEFAULT_STATUS_STREAM = os.getenv(
+    "TRANSCODER_STATUS_STREAM",
+    "transcoder:transcoder:status:stream",
+)
+DEFAULT_STATUS_STREAM_MAXLEN = coerce_int(
+    os.getenv("TRANSCODER_STATUS_STREAM_MAXLEN"),
+    1000,
+)
+
 DEFAULT_STATUS_TTL_SECONDS = coerce_int(
     os.getenv("TRANSCODER_STATUS_TTL_SECONDS"),
     30,
@@ -84,6 +93,11 @@ DEFAULT_STATUS_HEARTBEAT_SECONDS = coerce_int(
     5,
 )
 
+DEFAULT_STATUS_TELEMETRY_SECONDS = coerce_int(
+    os.getenv("TRANSCODER_STATUS_TELEMETRY_SECONDS"),
+    2,
+)
+
 _debug_endpoint_env = os.getenv("TRANSCODER_DEBUG_ENDPOINT_ENABLED")
 remote_debug_endpoint = remote_bool("TRANSCODER_DEBUG_ENDPOINT_ENABLED")
 if remote_debug_endpoint is not None:
@@ -131,6 +145,9 @@ __all__ = [
     "DEFAULT_STATUS_NAMESPACE",
     "DEFAULT_STATUS_PREFIX",
     "DEFAULT_STATUS_REDIS_URL",
+    "DEFAULT_STATUS_STREAM",
+    "DEFAULT_STATUS_STREAM_MAXLEN",
+    "DEFAULT_STATUS_TELEMETRY_SECONDS",
     "DEFAULT_STATUS_TTL_SECONDS",
     "DEFAULT_CELERY_TASK_TIMEOUT_SECONDS",
     "PROJECT_ROOT",
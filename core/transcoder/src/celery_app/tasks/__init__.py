@@ -1,10 +1,13 @@
 """Celery task entrypoints."""
 from __future__ import annotations
 
-from .lifecycle import stop_transcode_task
-from .transcode import start_transcode_task
+from .lifecycle import discard_standby_task, promote_standby_task, stop_transcode_task
+from .transcode import prepare_standby_task, start_transcode_task
 
 __all__ = [
+    "discard_standby_task",
+    "prepare_standby_task",
+    "promote_standby_task",
     "start_transcode_task",
     "stop_transcode_task",
 ]
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from http import HTTPStatus
-from typing import Mapping
+from typing import Mapping, Optional
 
 from celery.utils.log import get_task_logger
 from flask import current_app
@@ -36,4 +36,41 @@ def stop_transcode_task(self) -> Mapping[str, object]:
     }
 
 
-__all__ = ["stop_transcode_task"]
+@celery.task(bind=True, name="transcoder.promote_standby_av")
+def promote_standby_task(self, session_id: Optional[str] = None) -> Mapping[str, object]:
+    """Promote the prepared standby run to the active run via Celery."""
+
+    app = current_app
+    controller = app.extensions["transcoder_controller"]
+
+    LOGGER.info("[task:%s] Standby promotion requested (session=%s)", self.request.id, session_id)
+    promoted = controller.promote_standby(session_id)
+    payload = status_payload(app)
+    if not promoted:
+        return {
+            "status": HTTPStatus.CONFLICT,
+            "payload": {"error": "no matching standby session", "status": payload},
+        }
+    return {
+        "status": HTTPStatus.OK,
+        "payload": payload,
+    }
+
+
+@celery.task(bind=True, name="transcoder.discard_standby_av")
+def discard_standby_task(self) -> Mapping[str, object]:
+    """Stop the prepared standby run via Celery."""
+
+    app = current_app
+    controller = app.extensions["transcoder_controller"]
+
+    discarded = controller.discard_standby()
+    LOGGER.info("[task:%s] Standby discard requested (discarded=%s)", self.request.id, discarded)
+    return {
+        "status": HTTPStatus.OK,
+        "discarded": bool(discarded),
+        "payload": status_payload(app),
+    }
+
+
+__all__ = ["discard_standby_task", "promote_standby_task", "stop_transcode_task"]
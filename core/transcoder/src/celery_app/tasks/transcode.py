@@ -48,4 +48,35 @@ def start_transcode_task(self, overrides: Mapping[str, Any]) -> Mapping[str, Any
     }
 
 
-__all__ = ["start_transcode_task"]
+@celery.task(bind=True, name="transcoder.prepare_standby_av")
+def prepare_standby_task(self, overrides: Mapping[str, Any]) -> Mapping[str, Any]:
+    """Pre-roll the next item into a standby session via Celery."""
+
+    app = current_app
+    controller = app.extensions["transcoder_controller"]
+
+    settings = build_settings(app, overrides)
+    publish_base_raw = overrides.get("publish_base_url")
+    publish_base_url = publish_base_raw.strip() if isinstance(publish_base_raw, str) else publish_base_raw
+
+    LOGGER.info("[task:%s] Preparing standby AV transcode", self.request.id)
+
+    prepared = controller.prepare_standby(
+        settings,
+        publish_base_url,
+        session=overrides.get("session") if isinstance(overrides.get("session"), Mapping) else None,
+    )
+    payload = status_payload(app)
+    if not prepared:
+        LOGGER.info("[task:%s] Standby rejected; no active run", self.request.id)
+        return {
+            "status": HTTPStatus.CONFLICT,
+            "payload": {"error": "no active run to follow", "status": payload},
+        }
+    return {
+        "status": HTTPStatus.ACCEPTED,
+        "payload": payload,
+    }
+
+
+__all__ = ["prepare_standby_task", "start_transcode_task"]
@@ -5,6 +5,8 @@ import json
 import logging
 import os
 import threading
+import time
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Mapping, Optional, Sequence
@@ -22,6 +24,19 @@ from ..utils import ensure_trailing_slash
 LOGGER = logging.getLogger(__name__)
 
 
+@dataclass
+class _StandbyRun:
+    """A pre-rolled run encoding the next item ahead of promotion."""
+
+    token: object
+    context: SessionContext
+    settings: EncoderSettings
+    publish_url: Optional[str]
+    thread: Optional[threading.Thread] = None
+    handle: Optional[LiveEncodingHandle] = None
+    pipeline: Optional[DashTranscodePipeline] = None
+
+
 class TranscoderController:
     """Coordinate starting and stopping the FFmpeg-based transcoder."""
 
@@ -31,6 +46,7 @@ class TranscoderController:
         local_media_base: Optional[str] = None,
         status_broadcaster: Optional[TranscoderStatusBroadcaster] = None,
         heartbeat_interval: int = 5,
+        telemetry_interval: float = 2.0,
         session_retention: int = 2,
         runner: Optional[TranscodeRunner] = None,
         stop_strategy: Optional[StopStrategy] = None,
@@ -49,8 +65,12 @@ class TranscoderController:
         self._status_broadcaster = status_broadcaster
         self._heartbeat_interval = max(1, int(heartbeat_interval))
         self._heartbeat = HeartbeatLoop(self._heartbeat_interval, self._broadcast_status)
+        self._telemetry_interval = max(0.5, float(telemetry_interval))
+        self._last_telemetry_broadcast = 0.0
         self._session_manager = SessionManager(retention=session_retention)
         self._active_session: Optional[SessionContext] = None
+        self._run_token: Optional[object] = None
+        self._standby: Optional[_StandbyRun] = None
         self._watchdog_session_file = self._resolve_watchdog_session_file()
 
     def start(
@@ -84,62 +104,145 @@ class TranscoderController:
                 session_id,
                 ",".join(retain_sessions) if retain_sessions else "none",
             )
+        token = object()
         with self._lock:
             self._active_session = session_context
+            self._run_token = token
 
         self._broadcast_status()
 
-        def _on_started(handle: LiveEncodingHandle, pipeline: DashTranscodePipeline) -> None:
-            with self._lock:
-                self._handle = handle
-                self._latest_settings = settings
-                self._state = "running"
-                self._publish_url = normalized_publish
-                self._pipeline = pipeline
-            self._broadcast_status()
+        thread = self._runner.launch(
+            settings=settings,
+            session_prefix=session_prefix,
+            callbacks=self._run_callbacks(token, settings, normalized_publish, session_context),
+        )
+        self._sync_watchdog_sessions([session_id] if session_id else [])
+        with self._lock:
+            if self._run_token is token:
+                self._thread = thread
+        self._start_heartbeat()
+        self._broadcast_status()
+        return True
 
-        def _on_completed(
-            handle: Optional[LiveEncodingHandle],
-            pipeline: Optional[DashTranscodePipeline],
-            error: Optional[BaseException],
-        ) -> None:
-            if error:
-                with self._lock:
-                    self._last_error = str(error)
-                    self._state = "error"
-                self._broadcast_status()
+    def prepare_standby(
+        self,
+        settings: EncoderSettings,
+        publish_url: Optional[str] = None,
+        session: Optional[Mapping[str, Any]] = None,
+    ) -> bool:
+        """Start encoding the next item into a standby session.
 
-            self._cleanup_pipeline_output(pipeline, context="post-run")
+        The standby run writes to its own session directory while the active
+        run keeps playing. It is promoted when the active run ends, or earlier
+        through :meth:`promote_standby`. Returns ``False`` when nothing is
+        running, in which case callers should use :meth:`start` instead.
+        """
 
-            with self._lock:
-                self._handle = None
-                self._thread = None
-                self._publish_url = None
-                self._pipeline = None
-                self._active_session = None
-                if not error and self._state != "error":
-                    self._state = "idle"
-            self._session_manager.complete(session_context)
-            self._stop_heartbeat()
-            self._sync_watchdog_sessions([])
-            self._broadcast_status()
+        with self._lock:
+            if not (self._thread and self._thread.is_alive()):
+                LOGGER.debug("No active transcoder run; standby request ignored")
+                return False
+        self.discard_standby()
+
+        normalized_publish = ensure_trailing_slash(publish_url)
+        session_payload = session if isinstance(session, Mapping) else None
+        session_context = self._session_manager.prepare(settings, session_payload)
+        token = object()
+        standby = _StandbyRun(
+            token=token,
+            context=session_context,
+            settings=settings,
+            publish_url=normalized_publish,
+        )
+        with self._lock:
+            self._standby = standby
+        LOGGER.info("Transcoder standby session %s preparing", session_context.session_id)
 
-        callbacks = RunCallbacks(on_started=_on_started, on_completed=_on_completed)
         thread = self._runner.launch(
             settings=settings,
-            session_prefix=session_prefix,
-            callbacks=callbacks,
+            session_prefix=session_context.session_prefix,
+            callbacks=self._run_callbacks(token, settings, normalized_publish, session_context),
         )
-        self._sync_watchdog_sessions([session_id] if session_id else [])
         with self._lock:
-            self._thread = thread
+            standby.thread = thread
+            active_id = self._active_session.session_id if self._active_session else None
+        self._sync_watchdog_sessions([active_id, session_context.session_id])
+        self._broadcast_status()
+        return True
+
+    def promote_standby(self, session_id: Optional[str] = None) -> bool:
+        """Swap the standby run in as the active run and stop the previous one."""
+
+        with self._lock:
+            standby = self._standby
+            if standby is None or standby.thread is None or not standby.thread.is_alive():
+                return False
+            if session_id and standby.context.session_id != session_id:
+                LOGGER.info(
+                    "Standby session %s does not match promotion request %s",
+                    standby.context.session_id,
+                    session_id,
+                )
+                return False
+            previous_handle = self._handle
+            previous_thread = self._thread
+            previous_context = self._active_session
+            self._standby = None
+            self._run_token = standby.token
+            self._thread = standby.thread
+            self._handle = standby.handle
+            self._pipeline = standby.pipeline
+            self._latest_settings = standby.settings
+            self._publish_url = standby.publish_url
+            self._active_session = standby.context
+            self._state = "running" if standby.handle is not None else "starting"
+            self._last_error = None
+
+        self._session_manager.complete(previous_context)
+        self._session_manager.activate(standby.context)
+        self._sync_watchdog_sessions([standby.context.session_id])
+        LOGGER.info(
+            "Promoted standby session %s (previous=%s)",
+            standby.context.session_id,
+            previous_context.session_id if previous_context else None,
+        )
         self._start_heartbeat()
         self._broadcast_status()
+
+        if (
+            previous_handle is not None
+            and previous_thread is not None
+            and previous_thread is not threading.current_thread()
+            and previous_thread.is_alive()
+        ):
+            self._stopper.shutdown(previous_handle)
+            previous_thread.join(timeout=5)
+            previous_handle.cleanup()
+        return True
+
+    def discard_standby(self) -> bool:
+        """Stop and remove a prepared standby run, if any."""
+
+        with self._lock:
+            standby = self._standby
+            self._standby = None
+        if standby is None:
+            return False
+        LOGGER.info("Discarding transcoder standby session %s", standby.context.session_id)
+        if standby.handle is not None:
+            self._stopper.shutdown(standby.handle)
+        if standby.thread is not None:
+            standby.thread.join(timeout=5)
+        if standby.handle is not None:
+            standby.handle.cleanup()
+        self._cleanup_pipeline_output(standby.pipeline, context="standby")
+        self._broadcast_status()
         return True
 
     def stop(self) -> bool:
         """Request shutdown of the running transcoder."""
 
+        self.discard_standby()
         with self._lock:
             handle = self._handle
             thread = self._thread
@@ -149,6 +252,7 @@ class TranscoderController:
                 LOGGER.debug("No active transcoder run to stop")
                 return False
             self._state = "stopping"
+            self._run_token = None
         self._broadcast_status()
 
         self._stopper.shutdown(handle)
@@ -184,6 +288,7 @@ class TranscoderController:
             )
             settings = self._latest_settings
             pipeline_ref = self._pipeline
+            progress_reader = self._handle.progress if self._handle else None
             manifest = str(settings.mpd_path) if settings else None
             output_dir = str(settings.output_dir) if settings else None
             current_session = self._session_manager.current_session_id
@@ -210,6 +315,9 @@ class TranscoderController:
                 relative_path = "/".join(part for part in relative_parts if part)
                 if base_url and relative_path:
                     manifest_url = f"{base_url}{relative_path}"
+            telemetry = self._collect_telemetry(pipeline_ref, progress_reader) if running else None
+            standby = self._standby
+            standby_session_id = standby.context.session_id if standby is not None else None
             status = TranscoderStatus(
                 state=self._state,
                 running=running,
@@ -222,9 +330,95 @@ class TranscoderController:
                 manifest_url=manifest_url,
                 session_id=current_session,
                 subtitles=subtitles,
+                telemetry=telemetry,
+                standby_session_id=standby_session_id,
             )
         return status
 
+    def _run_callbacks(
+        self,
+        token: object,
+        settings: EncoderSettings,
+        publish_url: Optional[str],
+        session_context: SessionContext,
+    ) -> RunCallbacks:
+        """Build runner callbacks bound to one run.
+
+        ``token`` identifies the run, so callbacks from a standby run or from
+        a run that has since been replaced never overwrite the active state.
+        """
+
+        def _on_started(handle: LiveEncodingHandle, pipeline: DashTranscodePipeline) -> None:
+            orphaned = False
+            with self._lock:
+                standby = self._standby
+                if standby is not None and standby.token is token:
+                    standby.handle = handle
+                    standby.pipeline = pipeline
+                elif self._run_token is token:
+                    self._handle = handle
+                    self._latest_settings = settings
+                    self._state = "running"
+                    self._publish_url = publish_url
+                    self._pipeline = pipeline
+                else:
+                    orphaned = True
+            if orphaned:
+                LOGGER.info("Stopping transcoder run for discarded session %s", session_context.session_id)
+                self._stopper.shutdown(handle)
+                return
+            self._broadcast_status()
+
+        def _on_completed(
+            handle: Optional[LiveEncodingHandle],
+            pipeline: Optional[DashTranscodePipeline],
+            error: Optional[BaseException],
+        ) -> None:
+            with self._lock:
+                standby = self._standby
+                if standby is not None and standby.token is token:
+                    # The standby run ended before it could be promoted.
+                    self._standby = None
+                    superseded = True
+                else:
+                    superseded = self._run_token is not token
+            if superseded:
+                LOGGER.debug("Transcoder run for session %s finished off-air", session_context.session_id)
+                if error:
+                    self._broadcast_status()
+                return
+
+            if error:
+                with self._lock:
+                    self._last_error = str(error)
+                    self._state = "error"
+                self._broadcast_status()
+            elif self.promote_standby():
+                # The next item was already encoding; it takes over at the boundary.
+                return
+
+            self._cleanup_pipeline_output(pipeline, context="post-run")
+
+            with self._lock:
+                self._handle = None
+                self._thread = None
+                self._publish_url = None
+                self._pipeline = None
+                self._active_session = None
+                self._run_token = None
+                if not error and self._state != "error":
+                    self._state = "idle"
+            self._session_manager.complete(session_context)
+            self._stop_heartbeat()
+            self._sync_watchdog_sessions([])
+            self._broadcast_status()
+
+        return RunCallbacks(
+            on_started=_on_started,
+            on_completed=_on_completed,
+            on_progress=self._on_progress,
+        )
+
     def broadcast_status(self) -> None:
         """Force an immediate status broadcast if configured."""
 
@@ -239,6 +433,29 @@ class TranscoderController:
         except Exception:  # pragma: no cover - defensive
             LOGGER.debug("Failed to broadcast transcoder status", exc_info=True)
 
+    def _on_progress(self, _progress: Mapping[str, Any]) -> None:
+        now = time.monotonic()
+        with self._lock:
+            if now - self._last_telemetry_broadcast < self._telemetry_interval:
+                return
+            self._last_telemetry_broadcast = now
+        self._broadcast_status()
+
+    @staticmethod
+    def _collect_telemetry(
+        pipeline: Optional[DashTranscodePipeline],
+        progress_reader: Any,
+    ) -> Optional[dict[str, Any]]:
+        telemetry: dict[str, Any] = {}
+        if progress_reader is not None:
+            telemetry.update(progress_reader.snapshot())
+        if pipeline is not None:
+            try:
+                telemetry["latest_segment"] = pipeline.latest_segment_number()
+            except Exception:  # pragma: no cover - defensive
+                LOGGER.debug("Failed to read latest packager segment", exc_info=True)
+        return telemetry or None
+
     def _cleanup_pipeline_output(self, pipeline: Optional[DashTranscodePipeline], *, context: str) -> None:
         if pipeline is None:
             LOGGER.debug("Skipping %s cleanup: no active pipeline", context)
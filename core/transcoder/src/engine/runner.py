@@ -4,7 +4,7 @@ from __future__ import annotations
 import logging
 import threading
 from dataclasses import dataclass
-from typing import Callable, Optional
+from typing import Any, Callable, Optional
 
 from transcoder import DashTranscodePipeline, EncoderSettings, FFmpegDashEncoder, LiveEncodingHandle
 
@@ -17,6 +17,7 @@ class RunCallbacks:
 
     on_started: Callable[[LiveEncodingHandle, DashTranscodePipeline], None]
     on_completed: Callable[[Optional[LiveEncodingHandle], Optional[DashTranscodePipeline], Optional[BaseException]], None]  # noqa: F821
+    on_progress: Optional[Callable[[dict[str, Any]], None]] = None
 
 
 class TranscodeRunner:
@@ -43,7 +44,7 @@ class TranscodeRunner:
                     encoder,
                     session_prefix=session_prefix,
                 )
-                handle = pipeline.start_live()
+                handle = pipeline.start_live(progress_callback=callbacks.on_progress)
                 callbacks.on_started(handle, pipeline)
                 packager_pid = handle.packager_process.pid if handle.packager_process else None
                 LOGGER.info(
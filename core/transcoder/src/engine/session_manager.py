@@ -40,22 +40,20 @@ class SessionManager:
         settings: EncoderSettings,
         session_payload: Optional[Mapping[str, object]],
     ) -> SessionContext:
-        session_id, retain_sessions, session_prefix = self._parse_payload(session_payload)
-        retain_tuple = tuple(retain_sessions)
+        return self._open(settings, session_payload, activate=True)
 
-        with self._lock:
-            preserve_ids = self._preserve_ids_locked(session_id, retain_tuple)
-            if session_id:
-                self._current_session_id = session_id
-                self._register_session_locked(session_id)
-            else:
-                self._current_session_id = None
-            for retained in retain_tuple:
-                if retained:
-                    self._known_sessions.add(retained)
+    def prepare(
+        self,
+        settings: EncoderSettings,
+        session_payload: Optional[Mapping[str, object]],
+    ) -> SessionContext:
+        """Register a standby session and create its directory without activating it."""
 
-        self._prepare_session_directories(settings, session_prefix, preserve_ids)
-        return SessionContext(session_id=session_id, session_prefix=session_prefix, retain_sessions=retain_tuple)
+        return self._open(settings, session_payload, activate=False)
+
+    def activate(self, context: SessionContext) -> None:
+        with self._lock:
+            self._current_session_id = context.session_id
 
     def complete(self, context: Optional[SessionContext]) -> None:
         session_id = context.session_id if context else None
@@ -81,6 +79,31 @@ class SessionManager:
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
+    def _open(
+        self,
+        settings: EncoderSettings,
+        session_payload: Optional[Mapping[str, object]],
+        *,
+        activate: bool,
+    ) -> SessionContext:
+        session_id, retain_sessions, session_prefix = self._parse_payload(session_payload)
+        retain_tuple = tuple(retain_sessions)
+
+        with self._lock:
+            preserve_ids = self._preserve_ids_locked(session_id, retain_tuple)
+            if self._current_session_id:
+                preserve_ids.add(self._current_session_id)
+            if session_id:
+                self._register_session_locked(session_id)
+            if activate:
+                self._current_session_id = session_id or None
+            for retained in retain_tuple:
+                if retained:
+                    self._known_sessions.add(retained)
+
+        self._prepare_session_directories(settings, session_prefix, preserve_ids)
+        return SessionContext(session_id=session_id, session_prefix=session_prefix, retain_sessions=retain_tuple)
+
     @staticmethod
     def _parse_payload(
         session_payload: Optional[Mapping[str, object]],
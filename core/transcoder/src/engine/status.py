@@ -3,6 +3,8 @@ from __future__ import annotations
 
 import json
 import logging
+import threading
+import time
 from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 
@@ -21,7 +23,26 @@ LOGGER = logging.getLogger(__name__)
 
 
 class TranscoderStatusBroadcaster:
-    """Publish controller status snapshots to Redis for downstream consumers."""
+    """Publish controller status snapshots to Redis for downstream consumers.
+
+    The full snapshot is always stored under the status key. Pub/sub messages
+    are sequenced: a ``snapshot`` message carries the whole session, and a
+    ``delta`` message carries only the session fields that changed since the
+    previous message. If nothing changed, the heartbeat only refreshes the
+    liveness key and the TTL. Calls that arrive within ``coalesce_seconds``
+    of the last write are merged, and only the latest status is published;
+    a status whose ``running`` differs from the one before it is written
+    at once instead.
+
+    Every message is also appended to a capped Redis Stream so consumers can
+    replay what they missed while disconnected. Transitions of ``running``
+    are tagged as ``started``/``stopped`` lifecycle events and always sent as
+    full snapshots, so they never depend on an earlier delta.
+    """
+
+    DEFAULT_COALESCE_SECONDS = 0.25
+    DEFAULT_FULL_SNAPSHOT_SECONDS = 30.0
+    DEFAULT_STREAM_MAXLEN = 1000
 
     def __init__(
         self,
@@ -32,6 +53,10 @@ class TranscoderStatusBroadcaster:
         key: str,
         channel: Optional[str],
         ttl_seconds: int,
+        stream: Optional[str] = None,
+        stream_maxlen: int = DEFAULT_STREAM_MAXLEN,
+        coalesce_seconds: float = DEFAULT_COALESCE_SECONDS,
+        full_snapshot_seconds: float = DEFAULT_FULL_SNAPSHOT_SECONDS,
     ) -> None:
         self._redis_url = redis_url or ""
         self._prefix = prefix.strip() or "transcoder"
@@ -39,8 +64,19 @@ class TranscoderStatusBroadcaster:
         self._key = key.strip() or "status"
         self._channel = channel.strip() if isinstance(channel, str) else None
         self._ttl = max(0, int(ttl_seconds))
+        self._stream = stream.strip() if isinstance(stream, str) and stream.strip() else None
+        self._stream_maxlen = max(1, int(stream_maxlen))
+        self._coalesce = max(0.0, float(coalesce_seconds))
+        self._full_snapshot_interval = max(1.0, float(full_snapshot_seconds))
         self._client: Optional[Redis] = None
         self._last_error: Optional[str] = None
+        self._publish_lock = threading.Lock()
+        self._pending: Optional[TranscoderStatus] = None
+        self._flush_timer: Optional[threading.Timer] = None
+        self._last_write_at = 0.0
+        self._last_full_at = 0.0
+        self._sequence = 0
+        self._last_session: Optional[Dict[str, Any]] = None
         self._connect()
 
     # ------------------------------------------------------------------
@@ -88,6 +124,7 @@ class TranscoderStatusBroadcaster:
         return self._client
 
     def close(self) -> None:
+        self.flush()
         client = self._client
         if client is None:
             return
@@ -111,45 +148,44 @@ class TranscoderStatusBroadcaster:
     def publish(self, status: "TranscoderStatus") -> None:
         """Persist and broadcast the latest controller status."""
 
-        client = self._ensure_client()
-        if client is None:
-            return
-        payload = self._serialize(status)
-        redis_key = self._redis_key()
-        try:
-            if self._ttl > 0:
-                client.set(redis_key, payload, ex=self._ttl)
+        with self._publish_lock:
+            pending = self._pending
+            if pending is not None:
+                reference: Optional[bool] = bool(pending.running)
+            elif self._last_session is not None:
+                reference = bool(self._last_session.get("running"))
             else:
-                client.set(redis_key, payload)
-            self._last_error = None
-        except RedisError as exc:  # pragma: no cover - network dependent
-            self._last_error = f"Failed to write transcoder status: {exc}"
-            LOGGER.debug("Failed to write transcoder status to Redis: %s", exc)
-            try:
-                client.close()
-            except Exception:  # pragma: no cover - defensive
-                pass
-            self._client = None
-            return
+                reference = None
+            self._pending = status
+            if reference is not None and bool(status.running) != reference:
+                # A lifecycle transition; coalescing could merge it away, so write it now.
+                self._flush_locked()
+                return
+            if self._flush_timer is not None:
+                return
+            wait = self._coalesce - (time.monotonic() - self._last_write_at)
+            if wait > 0:
+                timer = threading.Timer(wait, self.flush)
+                timer.daemon = True
+                self._flush_timer = timer
+                timer.start()
+                return
+        self.flush()
 
-        if self._channel:
-            try:
-                client.publish(self._channel, payload)
-            except RedisError as exc:  # pragma: no cover - network dependent
-                self._last_error = f"Failed to publish transcoder status event: {exc}"
-                LOGGER.debug("Failed to publish transcoder status event: %s", exc)
-                try:
-                    client.close()
-                except Exception:  # pragma: no cover - defensive
-                    pass
-                self._client = None
+    def flush(self) -> None:
+        """Write any coalesced status immediately."""
+
+        with self._publish_lock:
+            self._flush_locked()
 
     def clear(self) -> None:
         client = self._ensure_client()
         if client is None:
             return
+        with self._publish_lock:
+            self._last_session = None
         try:
-            client.delete(self._redis_key())
+            client.delete(self._redis_key(), self._heartbeat_key())
         except RedisError:  # pragma: no cover - defensive
             LOGGER.debug("Failed to clear transcoder status key from Redis")
 
@@ -159,20 +195,134 @@ class TranscoderStatusBroadcaster:
     def _redis_key(self) -> str:
         return f"{self._prefix}:{self._namespace}:{self._key}"
 
+    def _heartbeat_key(self) -> str:
+        return f"{self._redis_key()}:heartbeat"
+
+    def _flush_locked(self) -> None:
+        timer = self._flush_timer
+        self._flush_timer = None
+        if timer is not None:
+            timer.cancel()
+        status = self._pending
+        self._pending = None
+        if status is None:
+            return
+        self._last_write_at = time.monotonic()
+        self._write(status)
+
+    def _write(self, status: "TranscoderStatus") -> None:
+        client = self._ensure_client()
+        if client is None:
+            return
+        updated_at = datetime.now(timezone.utc).isoformat()
+        session = status.to_session(origin="transcoder", updated_at=updated_at)
+        comparable = {key: value for key, value in session.items() if key != "updated_at"}
+        previous = self._last_session
+
+        try:
+            if previous is not None and comparable == previous:
+                self._touch(client, updated_at)
+                self._last_error = None
+                return
+
+            self._sequence += 1
+            now = time.monotonic()
+            snapshot = {"session": session, "metadata": {}, "seq": self._sequence}
+            if self._ttl > 0:
+                client.set(self._redis_key(), self._serialize(snapshot), ex=self._ttl)
+            else:
+                client.set(self._redis_key(), self._serialize(snapshot))
+            self._last_error = None
+        except RedisError as exc:  # pragma: no cover - network dependent
+            self._handle_error(client, f"Failed to write transcoder status: {exc}")
+            return
+
+        event = self._lifecycle_event(previous, session)
+        if (
+            previous is None
+            or event is not None
+            or now - self._last_full_at >= self._full_snapshot_interval
+        ):
+            message: Dict[str, Any] = {"type": "snapshot", **snapshot}
+            self._last_full_at = now
+        else:
+            changed = {
+                key: value
+                for key, value in session.items()
+                if key == "updated_at" or key not in previous or previous[key] != value
+            }
+            message = {
+                "type": "delta",
+                "seq": self._sequence,
+                "session": changed,
+                "removed": [key for key in previous if key not in session],
+                "metadata": {},
+            }
+        if event is not None:
+            message["event"] = event
+        self._last_session = comparable
+
+        if not self._stream and not self._channel:
+            return
+        serialized = self._serialize(message)
+        try:
+            if self._stream:
+                client.xadd(
+                    self._stream,
+                    {"type": message["type"], "seq": self._sequence, "payload": serialized},
+                    maxlen=self._stream_maxlen,
+                    approximate=True,
+                )
+            if self._channel:
+                client.publish(self._channel, serialized)
+        except RedisError as exc:  # pragma: no cover - network dependent
+            self._handle_error(client, f"Failed to publish transcoder status event: {exc}")
+
+    @staticmethod
+    def _lifecycle_event(
+        previous: Optional[Dict[str, Any]],
+        session: Dict[str, Any],
+    ) -> Optional[str]:
+        running = bool(session.get("running"))
+        if previous is None:
+            return "started" if running else None
+        if bool(previous.get("running")) == running:
+            return None
+        return "started" if running else "stopped"
+
+    def _touch(self, client: Redis, updated_at: str) -> None:
+        heartbeat = self._serialize({"updated_at": updated_at, "seq": self._sequence})
+        pipe = client.pipeline()
+        if self._ttl > 0:
+            pipe.expire(self._redis_key(), self._ttl)
+            pipe.set(self._heartbeat_key(), heartbeat, ex=self._ttl)
+        else:
+            pipe.set(self._heartbeat_key(), heartbeat)
+        pipe.execute()
+
+    def _handle_error(self, client: Redis, message: str) -> None:
+        self._last_error = message
+        LOGGER.debug(message)
+        # Force a full snapshot once Redis is reachable again.
+        self._last_session = None
+        try:
+            client.close()
+        except Exception:  # pragma: no cover - defensive
+            pass
+        self._client = None
+
     @staticmethod
-    def _serialize(status: "TranscoderStatus") -> str:
-        session = status.to_session(
-            origin="transcoder",
-            updated_at=datetime.now(timezone.utc).isoformat(),
-        )
-        payload = {"session": session, "metadata": {}}
+    def _serialize(payload: Dict[str, Any]) -> str:
         try:
             serialized = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
         except (TypeError, ValueError):  # pragma: no cover - defensive
+            session = payload.get("session") if isinstance(payload.get("session"), dict) else {}
             fallback: Dict[str, Any] = {
+                "type": "snapshot",
+                "seq": payload.get("seq"),
                 "session": {
-                    "state": getattr(status, "state", "unknown"),
-                    "running": getattr(status, "running", False),
+                    "state": session.get("state", "unknown"),
+                    "running": session.get("running", False),
                 },
                 "metadata": {},
             }
@@ -20,6 +20,8 @@ class TranscoderStatus:
     manifest_url: Optional[str]
     session_id: Optional[str] = None
     subtitles: Optional[Sequence[dict[str, Any]]] = None
+    telemetry: Optional[dict[str, Any]] = None
+    standby_session_id: Optional[str] = None
 
     def to_session(
         self,
@@ -46,6 +48,10 @@ class TranscoderStatus:
             session["session_id"] = self.session_id
         if self.subtitles is not None:
             session["subtitles"] = [dict(track) for track in self.subtitles]
+        if self.telemetry is not None:
+            session["telemetry"] = dict(self.telemetry)
+        if self.standby_session_id is not None:
+            session["standby_session_id"] = self.standby_session_id
 
         if log_file is not None:
             session["log_file"] = log_file
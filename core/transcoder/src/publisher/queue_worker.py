@@ -36,6 +36,9 @@ class UploadManager:
         max_workers: int,
         delete_workers: Optional[int] = None,
         stop_event: Optional[Event] = None,
+        batch_max_files: int = 1,
+        batch_max_bytes: int = 4 * 1024 * 1024,
+        batch_window: float = 0.05,
     ) -> None:
         self.output_dir = output_dir.expanduser().resolve()
         self.storage = storage
@@ -65,6 +68,13 @@ class UploadManager:
         self._delete_delay = 120.0
         self._pending_deletes: list[tuple[float, Path, bool]] = []
         self._delete_wakeup = Event()
+        # Segments closed within ``batch_window`` of each other are sent as
+        # one multipart request when the storage supports it.
+        self._batch_max_files = max(1, batch_max_files)
+        self._batch_max_bytes = max(0, batch_max_bytes)
+        self._batch_window = max(0.0, batch_window)
+        self._pending_batch: list[tuple[Path, Path, int, Optional[str]]] = []
+        self._batch_timer: Optional[threading.Timer] = None
         self._delete_thread = threading.Thread(
             target=self._delete_worker,
             name="upload-delete-delay",
@@ -85,6 +95,11 @@ class UploadManager:
         LOGGER.debug("Upload manager shutting down")
         self.stop_event.set()
         self._delete_wakeup.set()
+        with self._condition:
+            timer = self._batch_timer
+            self._batch_timer = None
+        if timer is not None:
+            timer.cancel()
         self._executor.shutdown(wait=True, cancel_futures=True)
         if self._delete_executor:
             self._delete_executor.shutdown(wait=True, cancel_futures=True)
@@ -135,6 +150,9 @@ class UploadManager:
             return
 
         token = self._register_segment(relative, session_id)
+        if self._should_batch(path):
+            self._queue_batch_entry(path, relative, token, session_id)
+            return
         LOGGER.debug("Scheduling segment upload for %s (token=%d)", relative, token)
         self._executor.submit(self._upload_segment, path, relative, token, session_id)
 
@@ -216,11 +234,106 @@ class UploadManager:
                     attempts,
                     relative,
                 )
-            with self._condition:
-                self._inflight_segments.pop(token, None)
-                if session_id:
-                    self._segment_sessions.pop(token, None)
-                self._condition.notify_all()
+            self._release_segment(token, session_id)
+
+    def _should_batch(self, path: Path) -> bool:
+        if self._batch_max_files <= 1 or not getattr(self.storage, "batch_supported", False):
+            return False
+        try:
+            return path.stat().st_size <= self._batch_max_bytes
+        except OSError:
+            return False
+
+    def _queue_batch_entry(self, path: Path, relative: Path, token: int, session_id: Optional[str]) -> None:
+        flush_now = False
+        with self._condition:
+            self._pending_batch.append((path, relative, token, session_id))
+            if len(self._pending_batch) >= self._batch_max_files:
+                flush_now = True
+            elif self._batch_timer is None:
+                timer = threading.Timer(self._batch_window, self._flush_batch)
+                timer.daemon = True
+                self._batch_timer = timer
+                timer.start()
+        LOGGER.debug("Queued segment %s for batched upload (token=%d)", relative, token)
+        if flush_now:
+            self._flush_batch()
+
+    def _flush_batch(self) -> None:
+        with self._condition:
+            entries = self._pending_batch
+            self._pending_batch = []
+            timer = self._batch_timer
+            self._batch_timer = None
+        if timer is not None:
+            timer.cancel()
+        if not entries:
+            return
+        if self.stop_event.is_set():
+            for _path, _relative, token, session_id in entries:
+                self._release_segment(token, session_id)
+            return
+        LOGGER.debug("Scheduling batched upload of %d segment(s)", len(entries))
+        self._executor.submit(self._upload_segment_batch, entries)
+
+    def _upload_segment_batch(self, entries: list[tuple[Path, Path, int, Optional[str]]]) -> None:
+        remaining: dict[Path, tuple[Path, int, Optional[str]]] = {}
+        for path, relative, token, session_id in entries:
+            previous = remaining.get(relative)
+            if previous is not None:
+                # The same file closed twice within one window; upload it once.
+                self._release_segment(previous[1], previous[2])
+            remaining[relative] = (path, token, session_id)
+        attempts = 0
+        try:
+            while remaining and not self.stop_event.is_set():
+                for relative, (path, token, session_id) in list(remaining.items()):
+                    if self._is_session_inactive(session_id):
+                        LOGGER.debug("Aborting segment upload for %s: session inactive", relative)
+                        remaining.pop(relative)
+                        self._release_segment(token, session_id)
+                if not remaining:
+                    break
+                attempts += 1
+                results = self.storage.upload_batch(
+                    kind="segment",
+                    files=[(path, relative) for relative, (path, _token, _session) in remaining.items()],
+                    stop_event=self.stop_event,
+                )
+                for relative, (path, token, session_id) in list(remaining.items()):
+                    if results.get(relative):
+                        remaining.pop(relative)
+                        self._release_segment(token, session_id)
+                    elif not path.exists():
+                        LOGGER.warning("Segment disappeared before upload succeeded: %s", relative)
+                        remaining.pop(relative)
+                        self._release_segment(token, session_id)
+                if not remaining:
+                    break
+                delay = self._next_retry_delay(attempts)
+                LOGGER.warning(
+                    "Batched upload of %d segment(s) failed; retrying in %.1fs (cycle=%d)",
+                    len(remaining),
+                    delay,
+                    attempts,
+                )
+                self._sleep_with_stop(delay)
+        finally:
+            if remaining and not self.stop_event.is_set():
+                LOGGER.warning(
+                    "Batched upload exhausted after %d cycle(s); giving up on %d segment(s)",
+                    attempts,
+                    len(remaining),
+                )
+            for _path, token, session_id in remaining.values():
+                self._release_segment(token, session_id)
+
+    def _release_segment(self, token: int, session_id: Optional[str]) -> None:
+        with self._condition:
+            self._inflight_segments.pop(token, None)
+            if session_id:
+                self._segment_sessions.pop(token, None)
+            self._condition.notify_all()
 
     def _upload_manifest(self, path: Path, relative: Path, marker: int, session_id: Optional[str]) -> None:
         if self._is_session_inactive(session_id):
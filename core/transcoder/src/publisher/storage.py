@@ -1,10 +1,12 @@
 """WebDAV storage helpers used by the transcoder uploader."""
 from __future__ import annotations
 
+import base64
+import hashlib
 import logging
 from pathlib import Path
 from threading import Lock
-from typing import Optional
+from typing import Iterable, Optional
 from urllib.parse import quote
 
 import requests
@@ -38,6 +40,7 @@ class WebDavStorage:
         self._session = session or requests.Session()
         self._known_directories: set[Path] = set()
         self._lock = Lock()
+        self._batch_supported = True
 
     def close(self) -> None:
         self._session.close()
@@ -95,6 +98,64 @@ class WebDavStorage:
         LOGGER.error("[%s] %s failed after %d attempt(s)", kind.upper(), relative.as_posix(), self.retry_attempts)
         return False
 
+    @property
+    def batch_supported(self) -> bool:
+        return self._batch_supported
+
+    def upload_batch(
+        self,
+        *,
+        kind: str,
+        files: Iterable[tuple[Path, Path]],
+        stop_event,
+    ) -> dict[Path, bool]:
+        """Upload ``(path, relative)`` pairs in one multipart POST.
+
+        Each part is named by its relative path and carries a ``Digest``
+        header so the ingest server can verify it before publishing. Only
+        entries the server rejected, or all of them after a transport error,
+        are retried. If the server does not accept batches, the remaining
+        files fall back to individual PUTs.
+        """
+
+        results: dict[Path, bool] = {}
+        pending: dict[Path, Path] = {}
+        for path, relative in files:
+            if path.exists() and path.is_file():
+                pending[relative] = path
+            else:
+                LOGGER.warning("Skipping %s upload; path no longer exists: %s", kind, path)
+                results[relative] = False
+
+        attempt = 1
+        backoff = self.retry_backoff
+        while pending and self._batch_supported and attempt <= self.retry_attempts and not stop_event.is_set():
+            try:
+                outcome = self._post_batch(pending)
+            except requests.RequestException as exc:
+                LOGGER.warning("[%s] batch of %d upload error: %s", kind.upper(), len(pending), exc)
+                outcome = {}
+            for relative, status in outcome.items():
+                if 200 <= status < 300:
+                    LOGGER.info("[%s] %s (%d, batched)", kind.upper(), relative.as_posix(), status)
+                    results[relative] = True
+                    pending.pop(relative, None)
+            attempt += 1
+            if pending and self._batch_supported and attempt <= self.retry_attempts:
+                sleep_for = min(backoff, 10.0)
+                LOGGER.debug("Retrying %d batched %s upload(s) in %.1fs", len(pending), kind, sleep_for)
+                sleep_with_stop(sleep_for, stop_event)
+                backoff *= self.retry_backoff
+
+        if pending and not self._batch_supported:
+            for relative, path in pending.items():
+                results[relative] = self.upload_file(kind=kind, path=path, relative=relative, stop_event=stop_event)
+            return results
+        for relative in pending:
+            LOGGER.error("[%s] %s failed after %d batched attempt(s)", kind.upper(), relative.as_posix(), self.retry_attempts)
+            results[relative] = False
+        return results
+
     def delete_path(self, relative: Path, *, is_directory: bool, stop_event) -> None:
         if stop_event.is_set():
             LOGGER.debug("Skipping delete for %s: stop requested", relative)
@@ -185,6 +246,52 @@ class WebDavStorage:
             for entry in to_remove:
                 self._known_directories.discard(entry)
 
+    def _post_batch(self, pending: dict[Path, Path]) -> dict[Path, int]:
+        """POST ``pending`` to the upload root and return per-file status codes."""
+
+        parts = []
+        for relative, path in pending.items():
+            data = path.read_bytes()
+            digest = base64.b64encode(hashlib.sha256(data).digest()).decode("ascii")
+            parts.append(
+                (
+                    relative.as_posix(),
+                    (relative.name, data, "application/octet-stream", {"Digest": f"sha-256={digest}"}),
+                )
+            )
+        response = self._session.post(
+            f"{self.upload_base}/",
+            headers=self.headers,
+            files=parts,
+            timeout=self.request_timeout,
+        )
+        if response.status_code in (404, 405, 501):
+            LOGGER.info("Ingest server does not accept batch uploads (status=%d); using PUT", response.status_code)
+            self._batch_supported = False
+            return {}
+        try:
+            entries = response.json().get("results") or []
+        except ValueError:
+            entries = []
+        by_name = {relative.as_posix(): relative for relative in pending}
+        statuses: dict[Path, int] = {}
+        for entry in entries:
+            relative = by_name.get(str(entry.get("path")))
+            if relative is None:
+                continue
+            try:
+                statuses[relative] = int(entry.get("status"))
+            except (TypeError, ValueError):
+                continue
+            if statuses[relative] >= 300:
+                LOGGER.warning(
+                    "[BATCH] %s rejected (status=%d): %s",
+                    relative.as_posix(),
+                    statuses[relative],
+                    entry.get("error"),
+                )
+        return statuses
+
     def remote_exists(self, relative: Path) -> bool:
         url = self._compose_url(relative)
         try:
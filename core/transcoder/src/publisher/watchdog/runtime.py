@@ -35,6 +35,9 @@ class WatchdogConfig:
     retry_backoff: float
     request_timeout: float
     backfill_window: float
+    batch_max_files: int = 8
+    batch_max_bytes: int = 4 * 1024 * 1024
+    batch_window: float = 0.05
 
 
 class UploadEventHandler(FileSystemEventHandler):
@@ -145,6 +148,12 @@ def load_config_from_env() -> WatchdogConfig:
             os.getenv("WATCHDOG_REQUEST_TIMEOUT"), default=30.0)),
         backfill_window=max(0.0, _parse_float(
             os.getenv("WATCHDOG_BACKFILL_WINDOW_SECONDS"), default=300.0)),
+        batch_max_files=max(1, _parse_int(
+            os.getenv("WATCHDOG_BATCH_MAX_FILES"), default=8)),
+        batch_max_bytes=max(0, _parse_int(
+            os.getenv("WATCHDOG_BATCH_MAX_BYTES"), default=4 * 1024 * 1024)),
+        batch_window=max(0.0, _parse_float(
+            os.getenv("WATCHDOG_BATCH_WINDOW_SECONDS"), default=0.05)),
     )
     return config
 
@@ -175,6 +184,9 @@ def run_watchdog(*, stop_event: Optional[Event] = None) -> int:
         manifest_timeout=cfg.manifest_timeout,
         max_workers=cfg.max_workers,
         stop_event=effective_stop_event,
+        batch_max_files=cfg.batch_max_files,
+        batch_max_bytes=cfg.batch_max_bytes,
+        batch_window=cfg.batch_window,
     )
 
     session_state_path = _resolve_session_state_path(cfg)
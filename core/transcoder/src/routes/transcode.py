@@ -11,7 +11,13 @@ from celery.exceptions import TimeoutError as CeleryTimeoutError
 from celery.result import AsyncResult
 
 from ..celery_app import celery
-from ..celery_app.tasks import start_transcode_task, stop_transcode_task
+from ..celery_app.tasks import (
+    discard_standby_task,
+    prepare_standby_task,
+    promote_standby_task,
+    start_transcode_task,
+    stop_transcode_task,
+)
 from ..services.transcode_session import TranscodeSessionService, get_session_service
 
 api_bp = Blueprint("transcoder_api", __name__)
@@ -102,6 +108,39 @@ def stop_transcode_endpoint():
         return jsonify({"status": HTTPStatus.ACCEPTED, "task_id": task.id}), HTTPStatus.ACCEPTED
     return jsonify(result["payload"]), result["status"]
 
+@api_bp.route("/transcode/standby", methods=["POST"])
+def prepare_standby_endpoint():
+    overrides = request.get_json(silent=True) or {}
+    task = prepare_standby_task.delay(overrides)
+    try:
+        result = task.get(timeout=_task_timeout_seconds())
+    except CeleryTimeoutError:
+        return jsonify({"status": HTTPStatus.ACCEPTED, "task_id": task.id}), HTTPStatus.ACCEPTED
+    return jsonify(result["payload"]), result["status"]
+
+
+@api_bp.route("/transcode/standby/promote", methods=["POST"])
+def promote_standby_endpoint():
+    payload = request.get_json(silent=True) or {}
+    session_id = payload.get("session_id")
+    task = promote_standby_task.delay(session_id if isinstance(session_id, str) else None)
+    try:
+        result = task.get(timeout=_task_timeout_seconds())
+    except CeleryTimeoutError:
+        return jsonify({"status": HTTPStatus.ACCEPTED, "task_id": task.id}), HTTPStatus.ACCEPTED
+    return jsonify(result["payload"]), result["status"]
+
+
+@api_bp.route("/transcode/standby", methods=["DELETE"])
+def discard_standby_endpoint():
+    task = discard_standby_task.delay()
+    try:
+        result = task.get(timeout=_task_timeout_seconds())
+    except CeleryTimeoutError:
+        return jsonify({"status": HTTPStatus.ACCEPTED, "task_id": task.id}), HTTPStatus.ACCEPTED
+    return jsonify(result["payload"]), result["status"]
+
+
 @api_bp.route("/tasks/<string:task_id>", methods=["GET"])
 def task_status_endpoint(task_id: str):
     async_result = celery.AsyncResult(task_id)